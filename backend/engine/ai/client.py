@@ -0,0 +1,17 @@
+"""Shared Anthropic client for the AI modules."""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import anthropic
+
+
+@functools.lru_cache(maxsize=1)
+def get_client() -> anthropic.Anthropic:
+    """Return a process-wide Anthropic client, created on first use."""
+    import anthropic
+
+    return anthropic.Anthropic()
@@ -5,11 +5,11 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass, field
 
-import anthropic
 import pandas as pd
 import numpy as np
 
-from engine.validation.backtest import GameResult
+from engine.validation.backtest import GameResult, results_frame
+from engine.ai.client import get_client
 
 
 @dataclass
@@ -28,17 +28,19 @@ def analyze_forecast_errors(
     if not results:
         return ForecastAnalysis(summary="No results to analyze.")
 
-    df = pd.DataFrame([vars(r) for r in results])
+    df = results_frame(results)
+    err = df["volume_error"].to_numpy()
+    abs_err = np.abs(err)
 
     summary_stats = {
-        "n_games": len(df),
-        "median_volume_error": f"{df['volume_error'].median():+.1%}",
-        "mean_abs_error": f"{df['volume_error'].abs().mean():.1%}",
-        "within_15pct": int((df['volume_error'].abs() <= 0.15).sum()),
+        "n_games": err.size,
+        "median_volume_error": f"{np.median(err):+.1%}",
+        "mean_abs_error": f"{abs_err.mean():.1%}",
+        "within_15pct": int((abs_err <= 0.15).sum()),
     }
 
     try:
-        client = anthropic.Anthropic()
+        client = get_client()
         # ... AI analysis would go here
         raise NotImplementedError("Use fallback")
     except Exception as e:
@@ -47,19 +49,19 @@ def analyze_forecast_errors(
 
 def _fallback_analysis(df: pd.DataFrame, error: str) -> ForecastAnalysis:
     findings = []
-    med_err = df["volume_error"].median()
+    err = df["volume_error"].to_numpy()
+    med_err = np.median(err)
     if med_err > 0.1:
         findings.append(f"Systematic overprediction: median error is {med_err:+.1%}")
     elif med_err < -0.1:
         findings.append(f"Systematic underprediction: median error is {med_err:+.1%}")
 
-    for arch in sorted(df["archetype"].unique()):
-        sub = df[df["archetype"] == arch]
-        arch_med = sub["volume_error"].median()
-        findings.append(f"{arch} ({len(sub)} games): median error {arch_med:+.1%}")
+    arch_stats = df.groupby("archetype", sort=True)["volume_error"].agg(count="size", med="median")
+    for arch, count, arch_med in arch_stats.itertuples(name=None):
+        findings.append(f"{arch} ({count} games): median error {arch_med:+.1%}")
 
-    within_15 = (df["volume_error"].abs() <= 0.15).sum()
-    n = len(df)
+    within_15 = int((np.abs(err) <= 0.15).sum())
+    n = err.size
 
     return ForecastAnalysis(
         key_findings=findings,
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import json
-import anthropic
+import orjson
 
 from engine.models.drift import DriftDetector
 from engine.ai.reasoning import ReasoningResult
+from engine.ai.client import get_client
+
+PROMPT_JSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
 
 
 POSTGAME_SYSTEM = """You are an AI post-game analyst for Save on Foods Memorial Centre (WHL hockey arena, Victoria BC). After a game simulation, you produce a concise operations report.
@@ -62,15 +64,15 @@ FORECAST PERFORMANCE:
 - Windows with significant drift: {summary['windows_with_drift']}/{summary['total_windows']}
 
 DRIFT TIMELINE:
-{json.dumps(drift_timeline[:10], indent=2)}
+{orjson.dumps(drift_timeline[:10], option=PROMPT_JSON_OPTS).decode()}
 
 AI INTERVENTIONS:
-{json.dumps(ai_actions[:8], indent=2)}
+{orjson.dumps(ai_actions[:8], option=PROMPT_JSON_OPTS).decode()}
 
 Generate a post-game operations report."""
 
     try:
-        client = anthropic.Anthropic()
+        client = get_client()
         response = client.messages.create(
             model="claude-haiku-4-5",
             max_tokens=2048,
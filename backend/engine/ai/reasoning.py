@@ -5,10 +5,9 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 
-import anthropic
-
 from engine.models.drift import DriftReport, DriftSignal
 from engine.config import STAND_SHORT
+from engine.ai.client import get_client
 
 
 @dataclass
@@ -101,7 +100,7 @@ RECENT TREND:
 Classify the drift cause and recommend actions. Respond with JSON only."""
 
     try:
-        client = anthropic.Anthropic()
+        client = get_client()
         response = client.messages.create(
             model="claude-haiku-4-5",
             max_tokens=1024,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import pandas as pd
 import numpy as np
@@ -91,10 +92,15 @@ def classify_archetype(game_txns: pd.DataFrame) -> str:
         return "mixed"
 
 
+@functools.lru_cache(maxsize=1)
+def _read_enriched(mtime_ns: int) -> pd.DataFrame:
+    return pd.read_parquet(ENRICHED_CACHE)
+
+
 def enrich_games(force_reload: bool = False) -> pd.DataFrame:
     """Enrich games with weather, opponent metadata, calendar flags, archetypes."""
     if ENRICHED_CACHE.exists() and not force_reload:
-        return pd.read_parquet(ENRICHED_CACHE)
+        return _read_enriched(ENRICHED_CACHE.stat().st_mtime_ns).copy()
 
     games = load_games(force_reload=force_reload)
     merged = load_merged(force_reload=force_reload)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+
 import pandas as pd
 import numpy as np
 from pathlib import Path
@@ -11,6 +13,19 @@ from engine.config import (
 )
 
 
+def source_files() -> list[Path]:
+    """Raw input files that every on-disk cache is derived from."""
+    return [*sorted(DATA_DIR.glob("items-*.csv")), DATA_DIR / "GameDetails.xlsx"]
+
+
+def cache_is_fresh(cache: Path) -> bool:
+    """True if `cache` exists and is at least as new as every raw source file."""
+    if not cache.exists():
+        return False
+    mtimes = [p.stat().st_mtime for p in source_files() if p.exists()]
+    return not mtimes or cache.stat().st_mtime >= max(mtimes)
+
+
 def load_transactions(force_reload: bool = False) -> pd.DataFrame:
     """Load all item CSVs, parse datetimes, add derived fields. Caches to parquet."""
     if PARQUET_CACHE.exists() and not force_reload:
@@ -107,10 +122,27 @@ def load_games(force_reload: bool = False) -> pd.DataFrame:
     return gdf
 
 
-def load_merged(force_reload: bool = False) -> pd.DataFrame:
-    """Load transactions with game context joined in."""
-    txns = load_transactions(force_reload=force_reload)
-    games = load_games(force_reload=force_reload)
+@functools.lru_cache(maxsize=1)
+def _read_merged(mtimes_ns: tuple[int, int]) -> pd.DataFrame:
+    return _merge_games(load_transactions(), load_games())
+
+
+def load_merged(force_reload: bool = False, game_date: pd.Timestamp | None = None) -> pd.DataFrame:
+    """Load transactions with game context joined in (memoized on cache mtimes)."""
+    if PARQUET_CACHE.exists() and GAMES_CACHE.exists() and not force_reload:
+        mtimes_ns = (PARQUET_CACHE.stat().st_mtime_ns, GAMES_CACHE.stat().st_mtime_ns)
+        merged = _read_merged(mtimes_ns)
+    else:
+        merged = _merge_games(
+            load_transactions(force_reload=force_reload),
+            load_games(force_reload=force_reload),
+        )
+    if game_date is not None:
+        return merged[merged["game_date"] == game_date].copy()
+    return merged.copy()
+
+
+def _merge_games(txns: pd.DataFrame, games: pd.DataFrame) -> pd.DataFrame:
 
     txns["game_date"] = pd.to_datetime(txns["date"])
 
@@ -5,14 +5,23 @@ from __future__ import annotations
 import pandas as pd
 import numpy as np
 
-from engine.config import TIME_WINDOWS, PROFILES_CACHE
-from engine.data.loader import load_merged
+from engine.config import TIME_WINDOWS, PROFILES_CACHE, PHASE_BOUNDS_ARR, PHASE_LABELS_ARR
+from engine.data.loader import load_merged, cache_is_fresh
 from engine.data.enricher import enrich_games
 
 
+GROUP_KEY_COLS = ("archetype", "stand", "Item", "category_norm")
+
+CURVE_KEYS = {
+    "stand_curves": ["archetype", "stand", "time_window"],
+    "item_curves": ["archetype", "Item", "time_window"],
+    "stand_item_curves": ["archetype", "stand", "Item", "time_window"],
+}
+
+
 def build_profiles(force_reload: bool = False) -> dict:
     """Build historical game profile templates indexed by archetype."""
-    if PROFILES_CACHE.exists() and not force_reload:
+    if not force_reload and cache_is_fresh(PROFILES_CACHE):
         return _load_cached_profiles()
 
     merged = load_merged(force_reload=force_reload)
@@ -25,86 +34,39 @@ def build_profiles(force_reload: bool = False) -> dict:
 
 def build_profiles_from_data(merged: pd.DataFrame, games: pd.DataFrame) -> dict:
     """Build profile curves from pre-filtered data (supports LOO cross-validation)."""
-    merged = merged.copy()
-
-    arch_map = games.set_index("game_date")["archetype"].to_dict()
-    merged["archetype"] = merged["game_date"].map(arch_map).fillna("mixed")
-
-    att_map = games.set_index("game_date")["attendance"].to_dict()
-    merged["attendance"] = merged["game_date"].map(att_map)
+    merged = _join_games(merged, games)
+    games_per_arch = _games_per_archetype(games)
 
-    games_per_arch = games.groupby("archetype")["game_date"].nunique().to_dict()
+    per_game = _per_game_qty(merged)
+    stand_curves = _rollup_curves(per_game, CURVE_KEYS["stand_curves"], games_per_arch)
+    item_curves = _rollup_curves(per_game, CURVE_KEYS["item_curves"], games_per_arch)
+    stand_item_curves = _rollup_curves(per_game, CURVE_KEYS["stand_item_curves"], games_per_arch)
 
-    stand_curves = (
-        merged.groupby(["archetype", "stand", "time_window"])
-        .agg(total_qty=("Qty", "sum"), game_count=("game_date", "nunique"))
-        .reset_index()
-    )
-    stand_curves["arch_game_count"] = stand_curves["archetype"].map(games_per_arch)
-    stand_curves["avg_qty"] = (
-        stand_curves["total_qty"] / stand_curves["arch_game_count"]
-    ).round(2)
-
-    item_curves = (
-        merged.groupby(["archetype", "Item", "time_window"])
-        .agg(total_qty=("Qty", "sum"), game_count=("game_date", "nunique"))
-        .reset_index()
-    )
-    item_curves["arch_game_count"] = item_curves["archetype"].map(games_per_arch)
-    item_curves["avg_qty"] = (
-        item_curves["total_qty"] / item_curves["arch_game_count"]
-    ).round(2)
-
-    stand_item_curves = (
-        merged.groupby(["archetype", "stand", "Item", "time_window"])
-        .agg(total_qty=("Qty", "sum"), game_count=("game_date", "nunique"))
-        .reset_index()
-    )
-    stand_item_curves["arch_game_count"] = stand_item_curves["archetype"].map(games_per_arch)
-    stand_item_curves["avg_qty"] = (
-        stand_item_curves["total_qty"] / stand_item_curves["arch_game_count"]
-    ).round(2)
-
-    def assign_phase(mins: float) -> str:
-        if pd.isna(mins):
-            return "unknown"
-        if mins < 0:
-            return "pre_game"
-        elif mins < 20:
-            return "P1"
-        elif mins < 38:
-            return "INT1"
-        elif mins < 58:
-            return "P2"
-        elif mins < 76:
-            return "INT2"
-        elif mins < 96:
-            return "P3"
-        else:
-            return "post_game"
-
-    merged["phase"] = merged["mins_from_puck_drop"].apply(assign_phase)
+    mins = merged["mins_from_puck_drop"].to_numpy(dtype=float)
+    phase = PHASE_LABELS_ARR[np.searchsorted(PHASE_BOUNDS_ARR, mins, side="right")]
+    merged["phase"] = np.where(np.isnan(mins), "unknown", phase)
 
     category_mix = (
-        merged.groupby(["archetype", "phase", "category_norm"])
+        merged.groupby(["archetype", "phase", "category_norm"], observed=True)
         .agg(total_qty=("Qty", "sum"))
         .reset_index()
+        .pipe(_decategorize)
     )
-    phase_totals = category_mix.groupby(["archetype", "phase"])["total_qty"].transform("sum")
+    phase_totals = category_mix.groupby(["archetype", "phase"], observed=True)["total_qty"].transform("sum")
     category_mix["mix_pct"] = (category_mix["total_qty"] / phase_totals * 100).round(1)
 
-    percap_curves = (
-        merged.groupby(["archetype", "stand", "time_window"])
-        .apply(lambda g: (g["Qty"].sum() / g["attendance"].iloc[0])
-               if g["attendance"].iloc[0] and g["attendance"].iloc[0] > 0
-               else 0,
-               include_groups=False)
-        .reset_index(name="qty_per_cap")
+    percap_per_game = (
+        merged.groupby(["archetype", "stand", "time_window", "game_date"], observed=True)
+        .agg(qty=("Qty", "sum"), attendance=("attendance", "first"))
+        .reset_index()
     )
+    att = percap_per_game["attendance"]
+    percap_per_game["qty_per_cap"] = (percap_per_game["qty"] / att.where(att > 0)).fillna(0.0)
     percap_avg = (
-        percap_curves.groupby(["archetype", "stand", "time_window"])["qty_per_cap"]
+        percap_per_game.groupby(["archetype", "stand", "time_window"], observed=True)["qty_per_cap"]
         .mean()
         .reset_index()
+        .pipe(_decategorize)
     )
 
     return {
@@ -117,18 +79,99 @@ def build_profiles_from_data(merged: pd.DataFrame, games: pd.DataFrame) -> dict:
     }
 
 
+def build_curve_aggregates(merged: pd.DataFrame, games: pd.DataFrame) -> dict:
+    """Full-data curve sums that profiles_without_game downdates per LOO fold."""
+    per_game = _per_game_qty(_join_games(merged, games))
+    return {
+        "games": games,
+        "per_game_by_date": dict(tuple(per_game.groupby("game_date"))),
+        "curve_sums": {name: _sum_curves(per_game, keys) for name, keys in CURVE_KEYS.items()},
+    }
+
+
+def profiles_without_game(aggregates: dict, game_date: pd.Timestamp) -> dict:
+    """Curves (CURVE_KEYS + games only) as build_profiles_from_data builds them without `game_date`."""
+    games = aggregates["games"]
+    train_games = games[games["game_date"] != game_date]
+    games_per_arch = _games_per_archetype(train_games)
+    held_out = aggregates["per_game_by_date"].get(game_date)
+
+    profiles = {}
+    for name, keys in CURVE_KEYS.items():
+        sums = aggregates["curve_sums"][name]
+        if held_out is not None:
+            held_qty = held_out.groupby(keys, observed=True)["Qty"].sum()
+            sums = pd.DataFrame({
+                "total_qty": sums["total_qty"].sub(held_qty, fill_value=0).astype(sums["total_qty"].dtype),
+                "game_count": sums["game_count"].sub(pd.Series(1, index=held_qty.index), fill_value=0).astype(int),
+            })
+            sums = sums[sums["game_count"] > 0]
+        profiles[name] = _average_curves(sums, games_per_arch)
+    profiles["games"] = train_games
+    return profiles
+
+
+def _join_games(merged: pd.DataFrame, games: pd.DataFrame) -> pd.DataFrame:
+    merged = merged.drop(columns=["archetype", "attendance"], errors="ignore").merge(
+        games[["game_date", "archetype", "attendance"]], on="game_date", how="left",
+    )
+    merged["archetype"] = merged["archetype"].fillna("mixed")
+    for col in GROUP_KEY_COLS:
+        merged[col] = merged[col].astype("category")
+    return merged
+
+
+def _games_per_archetype(games: pd.DataFrame) -> dict:
+    return games.groupby("archetype", observed=True)["game_date"].nunique().to_dict()
+
+
+def _per_game_qty(merged: pd.DataFrame) -> pd.DataFrame:
+    return (
+        merged.groupby(["archetype", "stand", "Item", "time_window", "game_date"], dropna=False, observed=True)["Qty"]
+        .sum()
+        .reset_index()
+    )
+
+
+def _rollup_curves(per_game: pd.DataFrame, keys: list[str], games_per_arch: dict) -> pd.DataFrame:
+    return _average_curves(_sum_curves(per_game, keys), games_per_arch)
+
+
+def _sum_curves(per_game: pd.DataFrame, keys: list[str]) -> pd.DataFrame:
+    return per_game.groupby(keys, observed=True).agg(
+        total_qty=("Qty", "sum"), game_count=("game_date", "nunique"),
+    )
+
+
+def _average_curves(sums: pd.DataFrame, games_per_arch: dict) -> pd.DataFrame:
+    curves = sums.reset_index().pipe(_decategorize)
+    curves["arch_game_count"] = curves["archetype"].map(games_per_arch)
+    curves["avg_qty"] = (curves["total_qty"] / curves["arch_game_count"]).round(2)
+    return curves
+
+
+def _decategorize(df: pd.DataFrame) -> pd.DataFrame:
+    """Turn categorical group keys back into plain columns for downstream consumers."""
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype(df[col].cat.categories.dtype)
+    return df
+
+
 def _save_profiles(profiles: dict) -> None:
     for key, df in profiles.items():
-        path = PROFILES_CACHE.parent / f"profile_{key}.parquet"
-        df.to_parquet(path, index=False)
+        path = PROFILES_CACHE.parent / f"profile_{key}.arrow"
+        df.reset_index(drop=True).to_feather(path, compression="zstd")
+    # Completion marker, written last so a partial write is never reused
+    PROFILES_CACHE.touch()
 
 
 def _load_cached_profiles() -> dict:
     profiles = {}
     for key in ["stand_curves", "item_curves", "stand_item_curves", "category_mix", "percap_curves", "games"]:
-        path = PROFILES_CACHE.parent / f"profile_{key}.parquet"
+        path = PROFILES_CACHE.parent / f"profile_{key}.arrow"
         if path.exists():
-            profiles[key] = pd.read_parquet(path)
+            profiles[key] = pd.read_feather(path)
     return profiles
 
 
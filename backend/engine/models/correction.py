@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import json
 import numpy as np
 import pandas as pd
@@ -22,34 +24,51 @@ FEATURE_NAMES = [
 ]
 
 
-def _build_feature_vector(g: pd.Series, att_mean: float, att_std: float,
-                          temp_mean: float, temp_std: float) -> list[float]:
+def _build_feature_vector(g: pd.Series | dict, att_mean: float, att_std: float,
+                          temp_mean: float, temp_std: float) -> np.ndarray:
     att_z = (g["attendance"] - att_mean) / att_std if att_std > 0 else 0.0
     temp_z = (g["temp_mean"] - temp_mean) / temp_std if temp_std > 0 else 0.0
     div = g.get("opponent_division", "Unknown")
-    return [
+    arch = g.get("archetype", "")
+    return np.array([
         att_z,
-        float(g.get("is_weekend", False)),
-        float(g.get("is_promo", False)),
-        float(g.get("is_playoff", False)),
+        g.get("is_weekend", False),
+        g.get("is_promo", False),
+        g.get("is_playoff", False),
         temp_z,
-        float(g.get("archetype", "") == "beer_crowd"),
-        float(g.get("archetype", "") == "family"),
-        float(div == "US"),
-        float(div == "BC"),
-        float(div == "East"),
-        float(g.get("puck_drop_hour", 19)),
-    ]
+        arch == "beer_crowd",
+        arch == "family",
+        div == "US",
+        div == "BC",
+        div == "East",
+        g.get("puck_drop_hour", 19),
+    ], dtype=np.float32)
+
+
+@functools.lru_cache(maxsize=1)
+def _read_correction_model(mtime_ns: int) -> dict:
+    return json.loads(CORRECTION_CACHE.read_text())
+
+
+@functools.lru_cache(maxsize=4)
+def _coef_array(coefficients: tuple[float, ...]) -> np.ndarray:
+    return np.asarray(coefficients, dtype=np.float32)
 
 
 def load_correction_model() -> dict | None:
-    """Load the trained correction model from cache."""
-    if not CORRECTION_CACHE.exists():
+    """Load the trained correction model from cache.
+
+    The parsed model is memoized on the file's mtime, so repeat calls skip
+    the disk read until the model is retrained; callers get a copy.
+    """
+    try:
+        mtime_ns = CORRECTION_CACHE.stat().st_mtime_ns
+    except FileNotFoundError:
         return None
-    return json.loads(CORRECTION_CACHE.read_text())
+    return copy.deepcopy(_read_correction_model(mtime_ns))
 
 
-def get_correction_factor(game_features: pd.Series, model: dict | None = None) -> float:
+def get_correction_factor(game_features: pd.Series | dict, model: dict | None = None) -> float:
     if model is None:
         model = load_correction_model()
     if model is None:
@@ -62,9 +81,8 @@ def get_correction_factor(game_features: pd.Series, model: dict | None = None) -
             stats["att_mean"], stats["att_std"],
             stats["temp_mean"], stats["temp_std"],
         )
-        intercept = model["intercept"]
-        coefs = model["coefficients"]
-        raw = intercept + sum(c * f for c, f in zip(coefs, fv))
+        coefs = _coef_array(tuple(model["coefficients"]))
+        raw = model["intercept"] + float(np.dot(coefs, fv))
     elif model.get("method") == "archetype_mean":
         arch = game_features.get("archetype", "mixed")
         arch_corr = model.get("archetype_corrections", {})
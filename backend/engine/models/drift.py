@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import sys
+from collections import defaultdict
 from dataclasses import dataclass, field
+from itertools import compress
+from operator import attrgetter
 import pandas as pd
 import numpy as np
 
@@ -13,7 +17,46 @@ from engine.config import (
 from engine.simulator.engine import GameEvent
 
 
-@dataclass
+# Severities that make a report significant
+_WARN_CRIT = frozenset({"warning", "critical"})
+
+# Sort key for signals, strongest first (used with reverse=True)
+_BY_ABS_MAGNITUDE = attrgetter("abs_magnitude")
+
+
+def _severity(magnitude: float) -> str:
+    abs_mag = abs(magnitude)
+    if abs_mag >= 0.40:
+        return "critical"
+    elif abs_mag >= 0.25:
+        return "warning"
+    else:
+        return "info"
+
+
+# Module-level factory (not a lambda) so detectors stay picklable
+def _counts() -> defaultdict[str, int]:
+    return defaultdict(int)
+
+
+def _drift_ratios(
+    actual: dict[str, int], forecast: dict[str, int],
+) -> tuple[list[str], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized (actual - fc) / fc over every key seen in a window.
+
+    Returns the keys with their actual counts, forecast counts and drift
+    ratios as position-aligned arrays; drift is NaN where fc is 0.
+    """
+    keys = list(actual)
+    n = len(keys)
+    act = np.fromiter(actual.values(), dtype=np.int64, count=n)
+    fc = np.fromiter((forecast.get(k, 0) for k in keys), dtype=np.int64, count=n)
+    drift = np.divide(act - fc, fc, out=np.full(n, np.nan), where=fc > 0)
+    return keys, act, fc, drift
+
+
+@dataclass(slots=True, frozen=True)
 class DriftSignal:
     drift_type: str
     scope: str
@@ -21,16 +64,12 @@ class DriftSignal:
     direction: str
     time_window: int
     detail: str
+    severity: str = field(init=False, repr=False, compare=False)
+    abs_magnitude: float = field(init=False, repr=False, compare=False)
 
-    @property
-    def severity(self) -> str:
-        abs_mag = abs(self.magnitude)
-        if abs_mag >= 0.40:
-            return "critical"
-        elif abs_mag >= 0.25:
-            return "warning"
-        else:
-            return "info"
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "severity", _severity(self.magnitude))
+        object.__setattr__(self, "abs_magnitude", abs(self.magnitude))
 
     def to_dict(self) -> dict:
         return {
@@ -44,7 +83,7 @@ class DriftSignal:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DriftReport:
     time_window: int
     signals: list[DriftSignal] = field(default_factory=list)
@@ -55,7 +94,7 @@ class DriftReport:
 
     @property
     def has_significant_drift(self) -> bool:
-        return any(s.severity in ("warning", "critical") for s in self.signals)
+        return any(s.severity in _WARN_CRIT for s in self.signals)
 
     def to_dict(self) -> dict:
         return {
@@ -67,60 +106,64 @@ class DriftReport:
         }
 
 
+def _rows(df: pd.DataFrame, *cols: str):
+    """Zip columns as plain Python scalars, without boxing each row as a Series."""
+    return zip(*(df[c].tolist() for c in cols))
+
+
 class DriftDetector:
     def __init__(self, forecast: dict):
         self.stand_forecast = forecast["stand_forecast"]
         self.item_forecast = forecast["item_forecast"]
         self.stand_item_forecast = forecast.get("stand_item_forecast")
 
-        self._actual_by_stand_window: dict[tuple[str, int], int] = {}
-        self._actual_by_item_window: dict[tuple[str, int], int] = {}
-        self._actual_by_category_window: dict[tuple[str, int], int] = {}
-        self._actual_by_stand_item_window: dict[tuple[str, str, int], int] = {}
-        self._actual_by_window: dict[int, int] = {}
-        self._event_count_by_window: dict[int, int] = {}
-
-        self._fc_stand = {}
-        for _, row in self.stand_forecast.iterrows():
-            key = (row["stand"], int(row["time_window"]))
-            self._fc_stand[key] = int(row["expected_qty"])
-
-        self._fc_item = {}
-        for _, row in self.item_forecast.iterrows():
-            key = (row["item"], int(row["time_window"]))
-            self._fc_item[key] = int(row["expected_qty"])
-
-        self._fc_stand_item: dict[tuple[str, str, int], int] = {}
-        if self.stand_item_forecast is not None:
-            for _, row in self.stand_item_forecast.iterrows():
-                key = (row["stand"], row["item"], int(row["time_window"]))
-                self._fc_stand_item[key] = int(row["expected_qty"])
+        # Keyed by time window first, so check_drift never scans other windows
+        self._actual_by_window_stand: dict[int, dict[str, int]] = defaultdict(_counts)
+        self._actual_by_window_item: dict[int, dict[str, int]] = defaultdict(_counts)
+        self._actual_by_window: dict[int, int] = defaultdict(int)
+        self._event_count_by_window: dict[int, int] = defaultdict(int)
+
+        self._fc_stand_by_window: dict[int, dict[str, int]] = {}
+        for stand, tw, qty in _rows(self.stand_forecast, "stand", "time_window", "expected_qty"):
+            self._fc_stand_by_window.setdefault(tw, {})[sys.intern(stand)] = qty
+
+        self._fc_item_by_window: dict[int, dict[str, int]] = {}
+        for item, tw, qty in _rows(self.item_forecast, "item", "time_window", "expected_qty"):
+            self._fc_item_by_window.setdefault(tw, {})[sys.intern(item)] = qty
+
+        self._fc_total_by_window: dict[int, int] = {
+            tw: sum(fc.values()) for tw, fc in self._fc_stand_by_window.items()
+        }
 
         self._cumulative_actual = 0
         self._cumulative_forecast = 0
         self._drift_history: list[DriftReport] = []
+        self._report_by_window: dict[int, DriftReport] = {}
+        self._signal_count = 0
+        self._severity_counts: dict[str, int] = defaultdict(int)
+        self._windows_with_drift = 0
 
     def ingest_event(self, event: GameEvent) -> None:
         tw = event.time_window
         stand = event.stand
         item = event.item
-        cat = event.category
         qty = event.qty
 
-        self._actual_by_stand_window[(stand, tw)] = self._actual_by_stand_window.get((stand, tw), 0) + qty
-        self._actual_by_item_window[(item, tw)] = self._actual_by_item_window.get((item, tw), 0) + qty
-        self._actual_by_category_window[(cat, tw)] = self._actual_by_category_window.get((cat, tw), 0) + qty
-        self._actual_by_stand_item_window[(stand, item, tw)] = self._actual_by_stand_item_window.get((stand, item, tw), 0) + qty
-        self._actual_by_window[tw] = self._actual_by_window.get(tw, 0) + qty
-        self._event_count_by_window[tw] = self._event_count_by_window.get(tw, 0) + 1
+        self._actual_by_window_stand[tw][stand] += qty
+        self._actual_by_window_item[tw][item] += qty
+        self._actual_by_window[tw] += qty
+        self._event_count_by_window[tw] += 1
         self._cumulative_actual += qty
 
+    def forecast_total(self, time_window: int) -> int:
+        return self._fc_total_by_window.get(time_window, 0)
+
     def check_drift(self, time_window: int) -> DriftReport:
         report = DriftReport(time_window=time_window)
         signals = []
 
         actual_total = self._actual_by_window.get(time_window, 0)
-        fc_total = sum(v for (s, tw), v in self._fc_stand.items() if tw == time_window)
+        fc_total = self.forecast_total(time_window)
 
         if fc_total > 0 and self._event_count_by_window.get(time_window, 0) >= DRIFT_MIN_SAMPLES:
             vol_drift = (actual_total - fc_total) / fc_total
@@ -135,61 +178,70 @@ class DriftDetector:
                     detail=f"Total demand {vol_drift:+.0%} vs forecast ({actual_total} vs {fc_total} expected)",
                 ))
 
-        stands_this_window = {s for (s, tw) in self._actual_by_stand_window if tw == time_window}
-        for stand in stands_this_window:
-            actual = self._actual_by_stand_window.get((stand, time_window), 0)
-            fc = self._fc_stand.get((stand, time_window), 0)
-            if fc > 0:
-                drift = (actual - fc) / fc
-                short = STAND_SHORT.get(stand, stand)
-                report.stand_drifts[stand] = drift
-                if abs(drift) >= DRIFT_VOLUME_THRESHOLD:
-                    direction = "above" if drift > 0 else "below"
-                    signals.append(DriftSignal(
-                        drift_type="volume", scope=short,
-                        magnitude=drift, direction=direction,
-                        time_window=time_window,
-                        detail=f"{short}: {actual} actual vs {fc} forecast ({drift:+.0%})",
-                    ))
-
-        items_this_window = {i for (i, tw) in self._actual_by_item_window if tw == time_window}
-        for item in items_this_window:
-            actual = self._actual_by_item_window.get((item, time_window), 0)
-            fc = self._fc_item.get((item, time_window), 0)
-            if fc > 0:
-                drift = (actual - fc) / fc
-                report.item_drifts[item] = drift
-                if abs(drift) >= 0.30:
-                    direction = "above" if drift > 0 else "below"
-                    signals.append(DriftSignal(
-                        drift_type="mix", scope=item,
-                        magnitude=drift, direction=direction,
-                        time_window=time_window,
-                        detail=f"{item}: {actual} actual vs {fc} forecast ({drift:+.0%})",
-                    ))
+        stands, actuals, fcs, drifts = _drift_ratios(
+            self._actual_by_window_stand.get(time_window, {}),
+            self._fc_stand_by_window.get(time_window, {}),
+        )
+        has_fc = fcs > 0
+        report.stand_drifts = dict(zip(compress(stands, has_fc), drifts[has_fc].tolist()))
+        for i in np.flatnonzero(np.abs(drifts) >= DRIFT_VOLUME_THRESHOLD).tolist():
+            stand, actual, fc, drift = stands[i], int(actuals[i]), int(fcs[i]), float(drifts[i])
+            short = STAND_SHORT.get(stand, stand)
+            direction = "above" if drift > 0 else "below"
+            signals.append(DriftSignal(
+                drift_type="volume", scope=short,
+                magnitude=drift, direction=direction,
+                time_window=time_window,
+                detail=f"{short}: {actual} actual vs {fc} forecast ({drift:+.0%})",
+            ))
+
+        items, actuals, fcs, drifts = _drift_ratios(
+            self._actual_by_window_item.get(time_window, {}),
+            self._fc_item_by_window.get(time_window, {}),
+        )
+        has_fc = fcs > 0
+        report.item_drifts = dict(zip(compress(items, has_fc), drifts[has_fc].tolist()))
+        for i in np.flatnonzero(np.abs(drifts) >= 0.30).tolist():
+            item, actual, fc, drift = items[i], int(actuals[i]), int(fcs[i]), float(drifts[i])
+            direction = "above" if drift > 0 else "below"
+            signals.append(DriftSignal(
+                drift_type="mix", scope=item,
+                magnitude=drift, direction=direction,
+                time_window=time_window,
+                detail=f"{item}: {actual} actual vs {fc} forecast ({drift:+.0%})",
+            ))
 
         self._cumulative_forecast += fc_total
-        report.signals = sorted(signals, key=lambda s: -abs(s.magnitude))
+        report.signals = sorted(signals, key=_BY_ABS_MAGNITUDE, reverse=True)
         self._drift_history.append(report)
+        self._report_by_window[time_window] = report
+
+        self._signal_count += len(signals)
+        for s in signals:
+            self._severity_counts[s.severity] += 1
+        if report.has_significant_drift:
+            self._windows_with_drift += 1
         return report
 
     @property
     def history(self) -> list[DriftReport]:
         return self._drift_history
 
+    def report_for(self, time_window: int) -> DriftReport | None:
+        return self._report_by_window.get(time_window)
+
     def cumulative_drift(self) -> float:
         if self._cumulative_forecast == 0:
             return 0.0
         return (self._cumulative_actual - self._cumulative_forecast) / self._cumulative_forecast
 
     def summary(self) -> dict:
-        all_signals = [s for r in self._drift_history for s in r.signals]
         return {
             "total_windows": len(self._drift_history),
-            "windows_with_drift": sum(1 for r in self._drift_history if r.has_significant_drift),
-            "total_signals": len(all_signals),
-            "critical_signals": sum(1 for s in all_signals if s.severity == "critical"),
-            "warning_signals": sum(1 for s in all_signals if s.severity == "warning"),
+            "windows_with_drift": self._windows_with_drift,
+            "total_signals": self._signal_count,
+            "critical_signals": self._severity_counts["critical"],
+            "warning_signals": self._severity_counts["warning"],
             "cumulative_drift": f"{self.cumulative_drift():+.1%}",
             "total_actual": self._cumulative_actual,
             "total_forecast": self._cumulative_forecast,
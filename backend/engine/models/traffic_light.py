@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
+from operator import attrgetter
 
 from engine.config import STAND_SHORT
 from engine.models.drift import DriftDetector, DriftReport
@@ -19,6 +21,8 @@ class Status(str, Enum):
 GREEN_THRESHOLD = 0.15
 YELLOW_THRESHOLD = 0.30
 
+_BY_ABS_DRIFT = attrgetter("abs_drift")
+
 
 @dataclass
 class StandStatus:
@@ -28,6 +32,10 @@ class StandStatus:
     forecast_qty: int
     actual_qty: int
     trend: str
+    abs_drift: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.abs_drift = abs(self.drift_pct)
 
     @property
     def short_name(self) -> str:
@@ -44,13 +52,16 @@ class StandStatus:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class OverallStatus:
     time_window: int
     overall_status: Status
     overall_drift: float
     stand_statuses: list[StandStatus]
     cumulative_drift: float
+    red_count: int = 0
+    yellow_count: int = 0
+    green_count: int = 0
 
     def to_dict(self) -> dict:
         return {
@@ -76,14 +87,10 @@ class TrafficLightMonitor:
     def __init__(self, detector: DriftDetector):
         self.detector = detector
         self._history: list[OverallStatus] = []
-        self._stand_drift_history: dict[str, list[float]] = {}
+        self._stand_abs_drift: dict[str, deque[float]] = {}
 
     def update(self, time_window: int) -> OverallStatus:
-        report = None
-        for r in reversed(self.detector.history):
-            if r.time_window == time_window:
-                report = r
-                break
+        report = self.detector.report_for(time_window)
 
         if report is None:
             return OverallStatus(
@@ -98,26 +105,33 @@ class TrafficLightMonitor:
         overall_status = classify_status(overall_drift)
         cumulative = self.detector.cumulative_drift()
 
-        stand_statuses = []
+        buckets: dict[Status, list[StandStatus]] = {
+            Status.RED: [], Status.YELLOW: [], Status.GREEN: [],
+        }
+        fc_by_stand = self.detector._fc_stand_by_window.get(time_window, {})
+        actual_by_stand = self.detector._actual_by_window_stand.get(time_window, {})
         for stand, drift in report.stand_drifts.items():
-            if stand not in self._stand_drift_history:
-                self._stand_drift_history[stand] = []
-            self._stand_drift_history[stand].append(drift)
+            recent = self._stand_abs_drift.get(stand)
+            if recent is None:
+                recent = self._stand_abs_drift[stand] = deque(maxlen=3)
+            recent.append(abs(drift))
 
-            trend = self._compute_trend(self._stand_drift_history[stand])
+            trend = self._compute_trend(recent)
 
-            fc_key = (stand, time_window)
-            fc_qty = self.detector._fc_stand.get(fc_key, 0)
-            actual_qty = self.detector._actual_by_stand_window.get(fc_key, 0)
+            fc_qty = fc_by_stand.get(stand, 0)
+            actual_qty = actual_by_stand.get(stand, 0)
 
-            stand_statuses.append(StandStatus(
-                stand=stand, status=classify_status(drift),
+            status = classify_status(drift)
+            buckets[status].append(StandStatus(
+                stand=stand, status=status,
                 drift_pct=drift, forecast_qty=fc_qty,
                 actual_qty=actual_qty, trend=trend,
             ))
 
-        priority = {Status.RED: 0, Status.YELLOW: 1, Status.GREEN: 2}
-        stand_statuses.sort(key=lambda s: (priority[s.status], -abs(s.drift_pct)))
+        stand_statuses = []
+        for bucket in buckets.values():
+            bucket.sort(key=_BY_ABS_DRIFT, reverse=True)
+            stand_statuses.extend(bucket)
 
         status = OverallStatus(
             time_window=time_window,
@@ -125,20 +139,20 @@ class TrafficLightMonitor:
             overall_drift=overall_drift,
             stand_statuses=stand_statuses,
             cumulative_drift=cumulative,
+            red_count=len(buckets[Status.RED]),
+            yellow_count=len(buckets[Status.YELLOW]),
+            green_count=len(buckets[Status.GREEN]),
         )
         self._history.append(status)
         return status
 
-    def _compute_trend(self, history: list[float]) -> str:
-        if len(history) < 2:
+    def _compute_trend(self, recent_abs: deque[float]) -> str:
+        if len(recent_abs) < 2:
             return "stable"
-        recent = history[-3:] if len(history) >= 3 else history
-        if len(recent) >= 2:
-            recent_abs = [abs(d) for d in recent]
-            if recent_abs[-1] < recent_abs[0] - 0.05:
-                return "improving"
-            elif recent_abs[-1] > recent_abs[0] + 0.05:
-                return "worsening"
+        if recent_abs[-1] < recent_abs[0] - 0.05:
+            return "improving"
+        elif recent_abs[-1] > recent_abs[0] + 0.05:
+            return "worsening"
         return "stable"
 
     @property
@@ -146,8 +160,8 @@ class TrafficLightMonitor:
         if not self._history:
             return Status.GREEN
         latest = self._history[-1]
-        if any(s.status == Status.RED for s in latest.stand_statuses):
+        if latest.red_count:
             return Status.RED
-        if any(s.status == Status.YELLOW for s in latest.stand_statuses):
+        if latest.yellow_count:
             return Status.YELLOW
         return Status.GREEN
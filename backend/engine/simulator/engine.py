@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import sys
 import time
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Callable
+from itertools import compress, groupby
+from operator import attrgetter
+from typing import Callable, Iterator
 
 import pandas as pd
 import numpy as np
@@ -13,7 +17,7 @@ from engine.data.loader import load_merged
 from engine.data.enricher import enrich_games
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GameEvent:
     """A single POS transaction event."""
     timestamp: pd.Timestamp
@@ -25,6 +29,13 @@ class GameEvent:
     mins_from_puck_drop: float
     time_window: int
 
+    def __post_init__(self) -> None:
+        # Keys for the detector's counters: share one string object per name
+        # so dict lookups hit the identity fast path with a cached hash.
+        object.__setattr__(self, "stand", sys.intern(self.stand))
+        object.__setattr__(self, "item", sys.intern(self.item))
+        object.__setattr__(self, "category", sys.intern(self.category))
+
     def to_dict(self) -> dict:
         return {
             "timestamp": str(self.timestamp),
@@ -38,7 +49,7 @@ class GameEvent:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class NoiseConfig:
     demand_spike_stand: str | None = None
     demand_spike_factor: float = 1.0
@@ -70,8 +81,7 @@ class GameSimulator:
         self.observers: list[Observer] = observers or []
         self.window_observers: list[WindowObserver] = window_observers or []
 
-        merged = load_merged()
-        self.game_txns = merged[merged["game_date"] == self.game_date].copy()
+        self.game_txns = load_merged(game_date=self.game_date)
         if self.game_txns.empty:
             raise ValueError(f"No transactions found for {game_date}")
 
@@ -101,64 +111,86 @@ class GameSimulator:
             "total_transactions": self.total_events,
         }
 
-    def _apply_noise(self, row: pd.Series) -> list[GameEvent]:
-        mins = row["mins_from_puck_drop"]
-        stand = row["stand"]
-
-        if (self.noise.stand_outage and stand == self.noise.stand_outage
-                and self.noise.stand_outage_start_min <= mins <= self.noise.stand_outage_end_min):
-            return []
-
-        qty = int(row["Qty"])
-        qty = max(1, round(qty * self.noise.global_volume_factor))
-
-        if (self.noise.demand_spike_stand and stand == self.noise.demand_spike_stand
-                and mins >= self.noise.demand_spike_after_min):
-            qty = max(1, round(qty * self.noise.demand_spike_factor))
-
-        return [GameEvent(
-            timestamp=row["datetime"],
-            stand=stand,
-            item=row["Item"],
-            category=row["category_norm"],
-            qty=qty,
-            price_point=str(row.get("Price Point Name", "")),
-            mins_from_puck_drop=float(mins),
-            time_window=int(row["time_window"]),
-        )]
+    def _iter_events(self) -> Iterator[GameEvent]:
+        # Noise is applied column-wise; rows only build GameEvents
+        txns = self.game_txns
+        noise = self.noise
+        stand = txns["stand"]
+        mins = txns["mins_from_puck_drop"]
+
+        keep = None
+        if noise.stand_outage:
+            keep = ~(
+                (stand == noise.stand_outage)
+                & mins.between(noise.stand_outage_start_min, noise.stand_outage_end_min)
+            ).to_numpy()
+
+        qty = txns["Qty"].to_numpy()
+        if noise.global_volume_factor != 1.0:
+            qty = np.round(qty * noise.global_volume_factor)
+        qty = np.maximum(1, qty).astype(np.int64)
+
+        if noise.demand_spike_stand:
+            spike = ((stand == noise.demand_spike_stand) & (mins >= noise.demand_spike_after_min)).to_numpy()
+            qty[spike] = np.maximum(1, np.round(qty[spike] * noise.demand_spike_factor))
+
+        if "Price Point Name" in txns:
+            price_points = [str(p) for p in txns["Price Point Name"].tolist()]
+        else:
+            price_points = [""] * len(txns)
+
+        rows = zip(
+            txns["datetime"].tolist(), stand.tolist(), txns["Item"].tolist(),
+            txns["category_norm"].tolist(), qty.tolist(), price_points,
+            mins.tolist(), txns["time_window"].tolist(),
+        )
+        if keep is not None:
+            rows = compress(rows, keep.tolist())
+        for ts, st, item, cat, q, price_point, m, tw in rows:
+            yield GameEvent(
+                timestamp=ts, stand=st, item=item, category=cat, qty=q,
+                price_point=price_point, mins_from_puck_drop=m, time_window=tw,
+            )
 
     def run(self, realtime: bool = True) -> list[GameEvent]:
+        if not realtime and not self.observers:
+            return self._run_by_window()
+
         all_events: list[GameEvent] = []
-        window_events: dict[int, list[GameEvent]] = {}
+        window_events: defaultdict[int, list[GameEvent]] = defaultdict(list)
         current_window = None
         prev_time = None
+        anchor_ts = anchor_clock = anchor_speed = None
 
-        for _, row in self.game_txns.iterrows():
-            events = self._apply_noise(row)
+        for event in self._iter_events():
+            # Sleep to an absolute deadline; re-anchor when speed changes mid-run
+            if realtime and self.speed > 0:
+                if anchor_ts is None or self.speed != anchor_speed:
+                    anchor_ts = prev_time if prev_time is not None else event.timestamp
+                    anchor_clock, anchor_speed = time.monotonic(), self.speed
+                delay = (
+                    anchor_clock
+                    + (event.timestamp - anchor_ts).total_seconds() / anchor_speed
+                    - time.monotonic()
+                )
+                if delay > 0:
+                    time.sleep(delay)
 
-            for event in events:
-                if realtime and prev_time is not None and self.speed > 0:
-                    delta = (event.timestamp - prev_time).total_seconds()
-                    if delta > 0:
-                        time.sleep(delta / self.speed)
+            prev_time = event.timestamp
 
-                prev_time = event.timestamp
+            for obs in self.observers:
+                obs(event)
 
-                for obs in self.observers:
-                    obs(event)
+            all_events.append(event)
 
-                all_events.append(event)
+            tw = event.time_window
+            window_events[tw].append(event)
 
-                tw = event.time_window
-                if tw not in window_events:
-                    window_events[tw] = []
-                window_events[tw].append(event)
+            if current_window is not None and tw != current_window:
+                for wobs in self.window_observers:
+                    wobs(current_window, window_events.get(current_window, []))
 
-                if current_window is not None and tw != current_window:
-                    for wobs in self.window_observers:
-                        wobs(current_window, window_events.get(current_window, []))
-
-                current_window = tw
+            current_window = tw
 
         if current_window is not None:
             for wobs in self.window_observers:
@@ -168,5 +200,18 @@ class GameSimulator:
         self._window_events = window_events
         return all_events
 
+    def _run_by_window(self) -> list[GameEvent]:
+        # Batch mode with no per-event observers: one pass, then window callbacks
+        all_events = list(self._iter_events())
+        window_events: defaultdict[int, list[GameEvent]] = defaultdict(list)
+        for tw, events in groupby(all_events, key=attrgetter("time_window")):
+            window_events[tw].extend(events)
+            for wobs in self.window_observers:
+                wobs(tw, window_events[tw])
+
+        self._events = all_events
+        self._window_events = window_events
+        return all_events
+
     def run_batch(self) -> list[GameEvent]:
         return self.run(realtime=False)
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 
+import pandas as pd
+
+from engine.config import ENRICHED_CACHE
 from engine.simulator.engine import GameSimulator, NoiseConfig
 from engine.data.enricher import enrich_games
 
@@ -25,8 +29,7 @@ class Scenario:
         )
 
 
-def _pick_game(archetype: str = "mixed", is_playoff: bool = False) -> str:
-    games = enrich_games()
+def _pick_game(games: pd.DataFrame, archetype: str = "mixed", is_playoff: bool = False) -> str:
     candidates = games[
         (games["archetype"] == archetype) & (games["is_playoff"] == is_playoff)
     ]
@@ -37,12 +40,12 @@ def _pick_game(archetype: str = "mixed", is_playoff: bool = False) -> str:
     return str(candidates.loc[idx, "game_date"].date())
 
 
-def get_scenarios() -> dict[str, Scenario]:
+@functools.lru_cache(maxsize=1)
+def _scenario_dates(enriched_mtime_ns: int) -> tuple[str, str, str, str]:
     games = enrich_games()
 
-    normal_date = _pick_game("mixed")
-    beer_date = _pick_game("beer_crowd")
-    family_date = _pick_game("family")
+    normal_date = _pick_game(games, "mixed")
+    family_date = _pick_game(games, "family")
 
     playoff_games = games[games["is_playoff"]]
     playoff_date = str(playoff_games.iloc[0]["game_date"].date()) if not playoff_games.empty else normal_date
@@ -50,6 +53,13 @@ def get_scenarios() -> dict[str, Scenario]:
     promo_games = games[games["is_promo"]]
     promo_date = str(promo_games.iloc[0]["game_date"].date()) if not promo_games.empty else normal_date
 
+    return normal_date, family_date, playoff_date, promo_date
+
+
+def get_scenarios() -> dict[str, Scenario]:
+    mtime_ns = ENRICHED_CACHE.stat().st_mtime_ns if ENRICHED_CACHE.exists() else 0
+    normal_date, family_date, playoff_date, promo_date = _scenario_dates(mtime_ns)
+
     return {
         "normal": Scenario(
             name="Normal Game",
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+
 import pandas as pd
 import numpy as np
-from dataclasses import dataclass
 
 from engine.data.loader import load_merged
 from engine.data.enricher import enrich_games
-from engine.data.profiles import build_profiles_from_data
+from engine.data.profiles import build_curve_aggregates, profiles_without_game
 from engine.models.forecast import generate_forecast
 
+_NO_SALES = pd.Series(dtype=np.int64)
+
 
 @dataclass
 class GameResult:
@@ -45,8 +50,151 @@ class GameResult:
         }
 
 
-def run_backtest(use_correction: bool = False) -> list[GameResult]:
-    """Run leave-one-out cross-validation over all games."""
+_RESULT_FIELDS = tuple(f.name for f in fields(GameResult))
+
+
+def results_frame(results: list[GameResult]) -> pd.DataFrame:
+    """One row per result, built column-wise."""
+    return pd.DataFrame({name: [getattr(r, name) for r in results] for name in _RESULT_FIELDS})
+
+
+def _backtest_one_game(
+    gd_ts: pd.Timestamp,
+    games: pd.DataFrame,
+    correction_model: dict | None,
+    game_actuals: dict,
+    curve_aggregates: dict,
+) -> GameResult | None:
+    """Hold out one game, downdate the profiles without it, and score the forecast.
+
+    ``game_actuals`` is ``_game_actuals`` over all transactions;
+    ``curve_aggregates`` is ``build_curve_aggregates`` over all games.
+    """
+    game_row = games[games["game_date"] == gd_ts]
+    if game_row.empty:
+        return None
+    g = game_row.iloc[0]
+
+    if game_actuals["rows"].get(gd_ts, 0) == game_actuals["n_rows"]:
+        return None
+
+    profiles = profiles_without_game(curve_aggregates, gd_ts)
+
+    forecast = generate_forecast(
+        attendance=int(g["attendance"]),
+        puck_drop_hour=int(g["puck_drop_hour"]),
+        is_playoff=bool(g["is_playoff"]),
+        is_promo=bool(g["is_promo"]),
+        promo_type=str(g.get("promo_type", "")),
+        temp_mean=float(g.get("temp_mean", 8.0)),
+        day_of_week=str(g["day_of_week"]),
+        profiles=profiles,
+    )
+
+    if correction_model is not None:
+        from engine.models.correction import get_correction_factor
+        cf = get_correction_factor(g, model=correction_model)
+        scaled_fc = forecast["item_forecast"]
+        for col in ("expected_qty", "prep_qty"):
+            scaled_fc[col] = np.rint(scaled_fc[col].to_numpy() * cf).astype(int)
+
+    actual_total = int(game_actuals["total"].get(gd_ts, 0))
+    actual_by_stand = game_actuals["stand"].get(gd_ts, _NO_SALES)
+    actual_by_item = game_actuals["item"].get(gd_ts, _NO_SALES)
+
+    item_fc = forecast["item_forecast"]
+    forecast_total = int(item_fc["expected_qty"].sum())
+    volume_error = (
+        (forecast_total - actual_total) / actual_total
+        if actual_total > 0 else 0.0
+    )
+
+    stand_fc = forecast["stand_forecast"]
+    stand_mape = _mape(stand_fc.groupby("stand")["expected_qty"].sum(), actual_by_stand)
+    item_mape = _mape(
+        item_fc.groupby("item")["expected_qty"].sum(),
+        actual_by_item.sort_values(ascending=False).head(15),
+    )
+
+    prep_by_item, actual_by_item = item_fc.groupby("item")["prep_qty"].sum().align(
+        actual_by_item, join="outer", fill_value=0,
+    )
+    prep_qty = prep_by_item.to_numpy()
+    actual_qty = actual_by_item.to_numpy()
+
+    covered = (prep_qty >= actual_qty).sum()
+    total_items = int((actual_qty > 0).sum())
+    prep_coverage = covered / total_items if total_items > 0 else 1.0
+
+    waste_units = int(np.maximum(0, prep_qty - actual_qty).sum())
+    stockout_units = int(np.maximum(0, actual_qty - prep_qty).sum())
+
+    return GameResult(
+        game_date=gd_ts,
+        opponent=str(g["opponent"]),
+        attendance=int(g["attendance"]),
+        archetype=str(g["archetype"]),
+        actual_total=actual_total,
+        forecast_total=forecast_total,
+        volume_error=volume_error,
+        stand_mape=stand_mape,
+        item_mape=item_mape,
+        prep_coverage=prep_coverage,
+        waste_units=waste_units,
+        stockout_units=stockout_units,
+    )
+
+
+def _mape(forecast: pd.Series, actual: pd.Series) -> float:
+    """MAPE over keys present in both series, skipping zero actuals."""
+    fc = forecast[forecast.index.isin(actual.index)]
+    act = actual.reindex(fc.index).to_numpy()
+    mask = act > 0
+    if not mask.any():
+        return 0.0
+    return (np.abs(fc.to_numpy()[mask] - act[mask]) / act[mask]).mean()
+
+
+def _game_actuals(merged: pd.DataFrame) -> dict:
+    """Per-game row counts, totals and stand/item sums, keyed by game date."""
+    per_game = merged.groupby("game_date")["Qty"].agg(["size", "sum"])
+    by_stand = merged.groupby(["game_date", "stand"])["Qty"].sum()
+    by_item = merged.groupby(["game_date", "Item"])["Qty"].sum()
+    return {
+        "n_rows": len(merged),
+        "rows": per_game["size"],
+        "total": per_game["sum"],
+        "stand": {gd: s.droplevel("game_date") for gd, s in by_stand.groupby(level="game_date")},
+        "item": {gd: s.droplevel("game_date") for gd, s in by_item.groupby(level="game_date")},
+    }
+
+
+# Per-process state for the parallel LOO workers, set once by _init_worker so the
+# fold inputs are pickled once per worker rather than once per game.
+_WORKER_DATA: dict = {}
+
+
+def _init_worker(games: pd.DataFrame, correction_model: dict | None,
+                 game_actuals: dict, curve_aggregates: dict) -> None:
+    _WORKER_DATA["games"] = games
+    _WORKER_DATA["correction_model"] = correction_model
+    _WORKER_DATA["game_actuals"] = game_actuals
+    _WORKER_DATA["curve_aggregates"] = curve_aggregates
+
+
+def _backtest_worker(gd_ts: pd.Timestamp) -> GameResult | None:
+    return _backtest_one_game(
+        gd_ts, _WORKER_DATA["games"], _WORKER_DATA["correction_model"],
+        _WORKER_DATA["game_actuals"], _WORKER_DATA["curve_aggregates"],
+    )
+
+
+def run_backtest(use_correction: bool = False, max_workers: int | None = None) -> list[GameResult]:
+    """Run leave-one-out cross-validation over all games.
+
+    Folds are independent, so they are fanned out over a process pool.
+    Pass ``max_workers=1`` to run serially in the calling process.
+    """
     merged = load_merged()
     games = enrich_games()
 
@@ -55,121 +203,22 @@ def run_backtest(use_correction: bool = False) -> list[GameResult]:
         from engine.models.correction import load_correction_model
         correction_model = load_correction_model()
 
-    game_dates = sorted(games["game_date"].unique())
-    results: list[GameResult] = []
-
-    for gd in game_dates:
-        gd_ts = pd.Timestamp(gd)
-        game_row = games[games["game_date"] == gd_ts]
-        if game_row.empty:
-            continue
-        g = game_row.iloc[0]
-
-        train_merged = merged[merged["game_date"] != gd_ts]
-        train_games = games[games["game_date"] != gd_ts]
-        if train_merged.empty:
-            continue
-
-        profiles = build_profiles_from_data(train_merged, train_games)
-
-        forecast = generate_forecast(
-            attendance=int(g["attendance"]),
-            puck_drop_hour=int(g["puck_drop_hour"]),
-            is_playoff=bool(g["is_playoff"]),
-            is_promo=bool(g["is_promo"]),
-            promo_type=str(g.get("promo_type", "")),
-            temp_mean=float(g.get("temp_mean", 8.0)),
-            day_of_week=str(g["day_of_week"]),
-            profiles=profiles,
-        )
-
-        if correction_model is not None:
-            from engine.models.correction import get_correction_factor
-            cf = get_correction_factor(g, model=correction_model)
-            forecast["item_forecast"]["expected_qty"] = (
-                forecast["item_forecast"]["expected_qty"] * cf
-            ).round(0).astype(int)
-            forecast["item_forecast"]["prep_qty"] = (
-                forecast["item_forecast"]["prep_qty"] * cf
-            ).round(0).astype(int)
-
-        game_txns = merged[merged["game_date"] == gd_ts]
-        actual_total = int(game_txns["Qty"].sum())
-
-        item_fc = forecast["item_forecast"]
-        forecast_total = int(item_fc["expected_qty"].sum())
-        volume_error = (
-            (forecast_total - actual_total) / actual_total
-            if actual_total > 0 else 0.0
-        )
-
-        stand_fc = forecast["stand_forecast"]
-        actual_by_stand = (
-            game_txns.groupby("stand")["Qty"].sum().reset_index()
-            .rename(columns={"Qty": "actual_qty"})
-        )
-        stand_comp = stand_fc.groupby("stand")["expected_qty"].sum().reset_index()
-        stand_comp = stand_comp.merge(actual_by_stand, on="stand", how="inner")
-        if not stand_comp.empty and (stand_comp["actual_qty"] > 0).any():
-            mask = stand_comp["actual_qty"] > 0
-            stand_mape = (
-                (stand_comp.loc[mask, "expected_qty"] - stand_comp.loc[mask, "actual_qty"]).abs()
-                / stand_comp.loc[mask, "actual_qty"]
-            ).mean()
-        else:
-            stand_mape = 0.0
-
-        actual_by_item = (
-            game_txns.groupby("Item")["Qty"].sum()
-            .sort_values(ascending=False)
-            .head(15)
-            .reset_index()
-            .rename(columns={"Qty": "actual_qty"})
-        )
-        item_comp = item_fc.groupby("item")["expected_qty"].sum().reset_index()
-        item_comp = item_comp.merge(
-            actual_by_item, left_on="item", right_on="Item", how="inner"
-        )
-        if not item_comp.empty and (item_comp["actual_qty"] > 0).any():
-            mask = item_comp["actual_qty"] > 0
-            item_mape = (
-                (item_comp.loc[mask, "expected_qty"] - item_comp.loc[mask, "actual_qty"]).abs()
-                / item_comp.loc[mask, "actual_qty"]
-            ).mean()
-        else:
-            item_mape = 0.0
-
-        prep_fc = item_fc.groupby("item")[["prep_qty", "expected_qty"]].sum().reset_index()
-        actual_items = (
-            game_txns.groupby("Item")["Qty"].sum().reset_index()
-            .rename(columns={"Item": "item", "Qty": "actual_qty"})
-        )
-        prep_comp = prep_fc.merge(actual_items, on="item", how="outer").fillna(0)
-
-        covered = (prep_comp["prep_qty"] >= prep_comp["actual_qty"]).sum()
-        total_items = len(prep_comp[prep_comp["actual_qty"] > 0])
-        prep_coverage = covered / total_items if total_items > 0 else 1.0
-
-        waste_units = int(
-            prep_comp.apply(lambda r: max(0, r["prep_qty"] - r["actual_qty"]), axis=1).sum()
-        )
-        stockout_units = int(
-            prep_comp.apply(lambda r: max(0, r["actual_qty"] - r["prep_qty"]), axis=1).sum()
-        )
-
-        results.append(GameResult(
-            game_date=gd_ts,
-            opponent=str(g["opponent"]),
-            attendance=int(g["attendance"]),
-            archetype=str(g["archetype"]),
-            actual_total=actual_total,
-            forecast_total=forecast_total,
-            volume_error=volume_error,
-            stand_mape=stand_mape,
-            item_mape=item_mape,
-            prep_coverage=prep_coverage,
-            waste_units=waste_units,
-            stockout_units=stockout_units,
-        ))
-
-    return results
+    # tolist() boxes datetime64 values as Timestamps, matching the per-game dict keys
+    game_dates = games["game_date"].drop_duplicates().sort_values().tolist()
+
+    if max_workers is None:
+        max_workers = min(os.cpu_count() or 1, len(game_dates))
+
+    game_actuals = _game_actuals(merged)
+    curve_aggregates = build_curve_aggregates(merged, games)
+    fold_inputs = (games, correction_model, game_actuals, curve_aggregates)
+
+    if max_workers <= 1:
+        results = [_backtest_one_game(gd, *fold_inputs) for gd in game_dates]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker, initargs=fold_inputs,
+        ) as ex:
+            results = list(ex.map(_backtest_worker, game_dates, chunksize=4))
+
+    return [r for r in results if r is not None]
@@ -8,15 +8,18 @@ Powered by damien's profile-matching forecast engine with partner's polished API
 import os
 import sys
 import math
+import functools
 import json
 import asyncio
 import logging
 import threading
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+import orjson
+from fastapi import FastAPI, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Literal, Optional
 
 # Add backend to sys.path so engine imports work
@@ -32,7 +35,7 @@ from engine.models.drift import DriftDetector
 from engine.models.traffic_light import TrafficLightMonitor
 from engine.simulator.engine import GameSimulator, NoiseConfig
 from engine.simulator.scenarios import get_scenarios, list_scenarios
-from engine.ai.reasoning import analyze_drift
+from engine.ai.reasoning import analyze_drift, _fallback_classify
 from engine.ai.post_game import generate_post_game_report
 from engine.ai.event_optimizer import analyze_promo_opportunities, generate_ai_event_recommendations
 from engine.validation.backtest import run_backtest
@@ -109,12 +112,18 @@ GAMES = None
 MERGED = None
 CORRECTION_MODEL = None
 ITEM_STATS = []
+# item -> (emoji, category, mean_per100, std_per100, variance_pct, confidence, perishability)
+ITEM_TABLE = {}
+_MISSING_STAT = (0.0, 0.0, 30.0, "medium")
 DOW_MULTIPLIERS = {}
 LOCATION_SHARES = {}
 LOCATION_TOP_ITEMS = {}
 DATASET_META = {}
 HISTORY_SUMMARY = {}
+ROOT_JSON = b"{}"             # pre-encoded payloads for the static GET routes
+HISTORY_SUMMARY_JSON = b"{}"
 BACKTEST_CACHE = None
+BACKTEST_JSON = orjson.dumps({"results": [], "error": "Backtest not computed"})
 EVENT_RECS_CACHE = None
 AI_STRATEGY_CACHE = None
 HAS_AI = False
@@ -122,6 +131,7 @@ HAS_AI = False
 
 # ─── HELPERS ────────────────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=256)
 def infer_category(item_name: str) -> str:
     if item_name in ITEM_CATEGORY_OVERRIDES:
         return ITEM_CATEGORY_OVERRIDES[item_name]
@@ -139,10 +149,26 @@ def infer_category(item_name: str) -> str:
     return "Snack"
 
 
+@functools.lru_cache(maxsize=256)
 def home_support_modifier(pct: int) -> float:
     return round(1.0 + ((pct - 50) / 40.0) * 0.10, 4)
 
 
+def _item_row(item_name: str, stat: tuple = _MISSING_STAT) -> tuple:
+    return (
+        ITEM_EMOJIS.get(item_name, "🍽️"),
+        infer_category(item_name),
+        *stat,
+        ITEM_PERISHABILITY.get(item_name, "medium_hold"),
+    )
+
+
+def item_info(item_name: str) -> tuple:
+    """Look up an item's ITEM_TABLE row, deriving it for items not seen at startup."""
+    row = ITEM_TABLE.get(item_name)
+    return row if row is not None else _item_row(item_name)
+
+
 def confidence_interval(mean: float, std: float, predicted: float) -> tuple[int, int]:
     band = (std / mean) * 0.5 if mean > 0 else 0.3
     return (
@@ -177,13 +203,60 @@ def build_timeline(puck_drop: str, total_items: int) -> list[dict]:
     return result
 
 
+def summarize_backtest(results: list[dict]) -> dict:
+    """Build the /validation/backtest payload from cached per-game results."""
+    n = len(results)
+    if n == 0:
+        return {"results": [], "summary": {}}
+
+    import pandas as pd
+    df = pd.DataFrame(results, columns=["archetype", "volume_error", "waste_units", "stockout_units"])
+    df["abs_err"] = df["volume_error"].abs()
+    df["within15"] = df["abs_err"] <= 0.15
+    within_15 = int(df["within15"].sum())
+    within_25 = int((df["abs_err"] <= 0.25).sum())
+
+    # Archetype breakdown
+    arch_agg = df.groupby("archetype", sort=False).agg(
+        count=("volume_error", "size"),
+        median_error=("volume_error", "median"),
+        mean_abs_error=("abs_err", "mean"),
+        within_15pct=("within15", "sum"),
+    )
+    arch_summary = {
+        arch: {
+            "count": int(row["count"]),
+            "median_error": round(float(row["median_error"]), 4),
+            "mean_abs_error": round(float(row["mean_abs_error"]), 4),
+            "within_15pct": int(row["within_15pct"]),
+        }
+        for arch, row in arch_agg.to_dict("index").items()
+    }
+
+    return {
+        "results": results,
+        "summary": {
+            "total_games": n,
+            "median_error": round(float(df["volume_error"].median()), 4),
+            "mean_abs_error": round(float(df["abs_err"].mean()), 4),
+            "within_15pct": within_15,
+            "within_15pct_rate": round(within_15 / n, 3),
+            "within_25pct": within_25,
+            "within_25pct_rate": round(within_25 / n, 3),
+            "total_waste_units": int(df["waste_units"].sum()),
+            "total_stockout_units": int(df["stockout_units"].sum()),
+        },
+        "archetype_breakdown": arch_summary,
+    }
+
+
 # ─── STARTUP ────────────────────────────────────────────────────────────────────
 
 def load_model_data() -> None:
     global PROFILES, GAMES, MERGED, CORRECTION_MODEL
-    global ITEM_STATS, DOW_MULTIPLIERS, LOCATION_SHARES, LOCATION_TOP_ITEMS
-    global DATASET_META, HISTORY_SUMMARY
-    global BACKTEST_CACHE, EVENT_RECS_CACHE, AI_STRATEGY_CACHE, HAS_AI
+    global ITEM_STATS, ITEM_TABLE, DOW_MULTIPLIERS, LOCATION_SHARES, LOCATION_TOP_ITEMS
+    global DATASET_META, HISTORY_SUMMARY, ROOT_JSON, HISTORY_SUMMARY_JSON
+    global BACKTEST_CACHE, BACKTEST_JSON, EVENT_RECS_CACHE, AI_STRATEGY_CACHE, HAS_AI
 
     print("\n━━━ Puck Prep: Loading engine ━━━")
 
@@ -234,11 +307,19 @@ def load_model_data() -> None:
             })
 
         ITEM_STATS = mapped_items
+        engine_item_names = set(PROFILES["item_curves"]["Item"])
+        if "stand_item_curves" in PROFILES:
+            engine_item_names.update(PROFILES["stand_item_curves"]["Item"])
+        ITEM_TABLE = {name: _item_row(name) for name in engine_item_names}
+        ITEM_TABLE.update({
+            s["item"]: _item_row(s["item"], (s["mean_per100"], s["std_per100"], s["variance_pct"], s["confidence"]))
+            for s in mapped_items
+        })
         DOW_MULTIPLIERS = {str(k): float(v) for k, v in dow.items()}
         for day in ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]:
             DOW_MULTIPLIERS.setdefault(day, 1.0)
         LOCATION_SHARES = {str(k): float(v) for k, v in shares.items()}
-        LOCATION_TOP_ITEMS = {str(k): [str(x) for x in v] for k, v in top_items.items()}
+        LOCATION_TOP_ITEMS = {str(k): frozenset(str(x) for x in v) for k, v in top_items.items()}
 
         merged_check = sales.merge(
             games_raw[["GameDate", "Attendance"]], left_on="Date", right_on="GameDate", how="inner"
@@ -268,6 +349,21 @@ def load_model_data() -> None:
             "location_shares": LOCATION_SHARES,
         }
 
+        # Both payloads are immutable after startup — encode them once here
+        ROOT_JSON = orjson.dumps({
+            "service": "Puck Prep API",
+            "version": "3.0.0",
+            "status": "live",
+            "engine": "profile-matching forecast",
+            "ai_available": HAS_AI,
+            "games_in_dataset": DATASET_META.get("games_in_dataset"),
+            "transactions": DATASET_META.get("transactions"),
+            "r_squared": DATASET_META.get("r_squared"),
+        })
+        HISTORY_SUMMARY_JSON = orjson.dumps(
+            HISTORY_SUMMARY, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+
         # ── Pre-compute expensive operations ──────────────────────────
         print("  Pre-computing backtest (cached)...")
         try:
@@ -277,6 +373,7 @@ def load_model_data() -> None:
         except Exception as e:
             print(f"  Backtest pre-compute failed: {e}")
             BACKTEST_CACHE = []
+        BACKTEST_JSON = orjson.dumps(summarize_backtest(BACKTEST_CACHE), option=orjson.OPT_SERIALIZE_NUMPY)
 
         print("  Pre-computing event recommendations...")
         try:
@@ -291,6 +388,16 @@ def load_model_data() -> None:
             EVENT_RECS_CACHE = []
             AI_STRATEGY_CACHE = None
 
+        # Warm the /forecast path (lru caches, first-call pandas groupby setup)
+        # so the first real request doesn't pay for it. Optional: a failure
+        # here must not stop startup.
+        try:
+            forecast(ForecastRequest(
+                opponent=WHL_TEAMS[0], day_of_week="Friday", puck_drop="19:00", attendance=4000,
+            ))
+        except Exception as e:
+            logger.warning("Forecast warm-up failed: %s", e, exc_info=True)
+
         n_games = len(GAMES) if GAMES is not None else 0
         n_items = len(ITEM_STATS)
         print(f"  Items tracked : {n_items}")
@@ -323,6 +430,8 @@ app.add_middleware(
 # ─── SCHEMAS ────────────────────────────────────────────────────────────────────
 
 class ForecastRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
     opponent: str = Field(..., description="WHL opponent team name")
     day_of_week: str = Field(..., description="e.g. Friday")
     puck_drop: str = Field(..., description="e.g. 19:05")
@@ -336,16 +445,7 @@ class ForecastRequest(BaseModel):
 
 @app.get("/")
 def root():
-    return {
-        "service": "Puck Prep API",
-        "version": "3.0.0",
-        "status": "live",
-        "engine": "profile-matching forecast",
-        "ai_available": HAS_AI,
-        "games_in_dataset": DATASET_META.get("games_in_dataset"),
-        "transactions": DATASET_META.get("transactions"),
-        "r_squared": DATASET_META.get("r_squared"),
-    }
+    return Response(ROOT_JSON, media_type="application/json")
 
 
 @app.get("/teams")
@@ -356,13 +456,19 @@ def get_teams():
 @app.post("/forecast")
 def forecast(req: ForecastRequest):
     """Generate forecast using damien's engine, wrapped in partner's response shape."""
+    params = req.model_dump()
+    day_of_week = params["day_of_week"]
+    puck_drop = params["puck_drop"]
+    attendance = params["attendance"]
+    predicted_outcome = params["predicted_outcome"]
+    home_support_pct = params["home_support_pct"]
 
     # ── Damien's engine: generate the real forecast ───────────────────
-    puck_drop_hour = int(req.puck_drop.split(":")[0]) if ":" in req.puck_drop else 19
-    day_short = req.day_of_week[:3]
+    puck_drop_hour = int(puck_drop.split(":")[0]) if ":" in puck_drop else 19
+    day_short = day_of_week[:3]
 
     engine_forecast = generate_forecast(
-        attendance=req.attendance,
+        attendance=attendance,
         puck_drop_hour=puck_drop_hour,
         is_playoff=False,
         is_promo=False,
@@ -379,17 +485,17 @@ def forecast(req: ForecastRequest):
     # ── Apply correction model if available ───────────────────────────
     correction_factor = 1.0
     if CORRECTION_MODEL is not None:
-        import pandas as pd
-        game_features = pd.Series({
-            "attendance": req.attendance,
-            "is_weekend": req.day_of_week in ("Friday", "Saturday", "Sunday"),
+        # Plain dict: Series construction + Series.get dominated this per-request call
+        game_features = {
+            "attendance": attendance,
+            "is_weekend": day_of_week in ("Friday", "Saturday", "Sunday"),
             "is_promo": False,
             "is_playoff": False,
             "temp_mean": 8.0,
             "archetype": archetype,
             "opponent_division": "Unknown",
             "puck_drop_hour": puck_drop_hour,
-        })
+        }
         correction_factor = get_correction_factor(game_features, CORRECTION_MODEL)
 
     item_fc = engine_forecast["item_forecast"]
@@ -398,9 +504,11 @@ def forecast(req: ForecastRequest):
         item_fc["prep_qty"] = (item_fc["prep_qty"] * correction_factor).round(0).astype(int)
 
     # ── Partner's modifiers: outcome + home support ───────────────────
-    dow_mult = DOW_MULTIPLIERS.get(req.day_of_week, 1.0)
-    home_mod = home_support_modifier(req.home_support_pct)
-    outcome_mod = OUTCOME_MODIFIERS.get(req.predicted_outcome, OUTCOME_MODIFIERS["unknown"])
+    dow_mult = DOW_MULTIPLIERS.get(day_of_week, 1.0)
+    home_mod = home_support_modifier(home_support_pct)
+    outcome_mod = OUTCOME_MODIFIERS.get(predicted_outcome, OUTCOME_MODIFIERS["unknown"])
+    # Outcome × home-support multiplier per category, hoisted out of the item loops
+    category_factor = {cat: mod * home_mod for cat, mod in outcome_mod.items()}
 
     # ── Build per-item response (merge engine forecast with item stats) ──
     # Collapse time windows → per-item totals from engine
@@ -409,35 +517,24 @@ def forecast(req: ForecastRequest):
         engine_prep=("prep_qty", "sum"),
     ).reset_index()
 
-    # Build item_stats lookup
-    stats_lookup = {s["item"]: s for s in ITEM_STATS}
-
     all_items = []
     for _, row in engine_items.iterrows():
         item_name = row["item"]
         base_predicted = int(row["engine_predicted"])
         prep_qty = int(row["engine_prep"])
 
+        emoji, cat, mean_v, std_v, variance_pct, conf, perishability = item_info(item_name)
+
         # Apply outcome + home support mods on top of engine forecast
-        cat = infer_category(item_name)
-        out_mod = outcome_mod.get(cat, 1.0)
-        predicted = round(base_predicted * out_mod * home_mod)
-        prep_qty = round(prep_qty * out_mod * home_mod)
-
-        # Get confidence/variance from partner's stats
-        stat = stats_lookup.get(item_name, {})
-        mean_v = stat.get("mean_per100", 0)
-        std_v = stat.get("std_per100", mean_v * 0.3)
-        variance_pct = stat.get("variance_pct", 30.0)
-        conf = stat.get("confidence", "medium")
+        factor = category_factor.get(cat, home_mod)
+        predicted = round(base_predicted * factor)
+        prep_qty = round(prep_qty * factor)
 
         low, high = confidence_interval(max(mean_v, 0.01), max(std_v, 0.01), predicted)
 
-        perishability = ITEM_PERISHABILITY.get(item_name, "medium_hold")
-
         all_items.append({
             "item": item_name,
-            "emoji": ITEM_EMOJIS.get(item_name, "🍽️"),
+            "emoji": emoji,
             "category": cat,
             "confidence": conf,
             "variance_pct": variance_pct,
@@ -463,22 +560,21 @@ def forecast(req: ForecastRequest):
             share = stand_total / total_predicted if total_predicted > 0 else 0
 
             stand_items = []
-            for _, si_row in group.groupby("item").agg(
-                predicted=("expected_qty", "sum"),
-                prep_qty=("prep_qty", "sum"),
-            ).reset_index().sort_values("predicted", ascending=False).head(7).iterrows():
-                item_name = si_row["item"]
-                cat = infer_category(item_name)
-                pred = round(int(si_row["predicted"]) * out_mod * home_mod)
-                stat = stats_lookup.get(item_name, {})
-                mean_v = stat.get("mean_per100", 0.01)
-                std_v = stat.get("std_per100", mean_v * 0.3)
+            adjusted_total = 0.0
+            item_totals = group.groupby("item")["expected_qty"].sum().sort_values(ascending=False)
+            for rank, (item_name, item_qty) in enumerate(item_totals.items()):
+                emoji, cat, mean_v, std_v, _, conf, _ = item_info(item_name)
+                adjusted = int(item_qty) * category_factor.get(cat, home_mod)
+                adjusted_total += adjusted
+                if rank >= 7:
+                    continue
+                pred = round(adjusted)
                 low, high = confidence_interval(max(mean_v, 0.01), max(std_v, 0.01), pred)
                 stand_items.append({
                     "item": item_name,
-                    "emoji": ITEM_EMOJIS.get(item_name, "🍽️"),
+                    "emoji": emoji,
                     "category": cat,
-                    "confidence": stat.get("confidence", "medium"),
+                    "confidence": conf,
                     "predicted": pred,
                     "low": low,
                     "high": high,
@@ -487,14 +583,14 @@ def forecast(req: ForecastRequest):
             stands.append({
                 "name": short_name,
                 "volume_share_pct": round(share * 100, 1),
-                "total_predicted": round(stand_total * out_mod * home_mod),
+                "total_predicted": round(adjusted_total),
                 "items": stand_items,
             })
         stands.sort(key=lambda x: -x["total_predicted"])
     else:
         # Fallback: use partner's location shares
         for stand_name, share in LOCATION_SHARES.items():
-            top_names = LOCATION_TOP_ITEMS.get(stand_name, [])
+            top_names = LOCATION_TOP_ITEMS.get(stand_name, frozenset())
             stand_items = []
             for item in all_items:
                 if item["item"] not in top_names:
@@ -509,7 +605,7 @@ def forecast(req: ForecastRequest):
                     "low": round(item["low"] * f),
                     "high": round(item["high"] * f),
                 })
-            stand_items.sort(key=lambda x: -x["predicted"])
+            # all_items is already sorted by predicted desc, so stand_items is too
             stands.append({
                 "name": stand_name,
                 "volume_share_pct": round(share * 100, 1),
@@ -519,7 +615,7 @@ def forecast(req: ForecastRequest):
         stands.sort(key=lambda x: -x["total_predicted"])
 
     # ── Timeline + watchlist ──────────────────────────────────────────
-    timeline = build_timeline(req.puck_drop, total_predicted)
+    timeline = build_timeline(puck_drop, total_predicted)
     watchlist = [i for i in all_items if i["confidence"] == "low" or i["variance_pct"] > 40]
 
     # ── Prep targets summary ─────────────────────────────────────────
@@ -534,29 +630,21 @@ def forecast(req: ForecastRequest):
         }
     }
 
-    return {
-        "meta": {
-            "opponent": req.opponent,
-            "day_of_week": req.day_of_week,
-            "puck_drop": req.puck_drop,
-            "attendance": req.attendance,
-            "predicted_outcome": req.predicted_outcome,
-            "home_support_pct": req.home_support_pct,
-            "game_date": req.game_date,
-            "archetype": archetype,
-        },
+    # Bypass FastAPI's jsonable_encoder pass — the payload is already plain data
+    return ORJSONResponse({
+        "meta": {**params, "archetype": archetype},
         "summary": {
             "total_predicted": total_predicted,
             "total_low": sum(i["low"] for i in all_items),
             "total_high": sum(i["high"] for i in all_items),
-            "items_per_fan": round(total_predicted / req.attendance, 2),
+            "items_per_fan": round(total_predicted / attendance, 2),
             "r_squared": DATASET_META.get("r_squared", 0.9),
             "games_in_model": DATASET_META.get("games_in_dataset", 0),
         },
         "modifiers": {
-            "day_of_week": {"label": req.day_of_week, "multiplier": round(dow_mult, 3)},
-            "home_support": {"label": f"{req.home_support_pct}% Royals fans", "multiplier": round(home_mod, 3)},
-            "predicted_outcome": {"label": req.predicted_outcome, "modifiers": outcome_mod},
+            "day_of_week": {"label": day_of_week, "multiplier": round(dow_mult, 3)},
+            "home_support": {"label": f"{home_support_pct}% Royals fans", "multiplier": round(home_mod, 3)},
+            "predicted_outcome": {"label": predicted_outcome, "modifiers": outcome_mod},
         },
         "engine": {
             "archetype": archetype,
@@ -570,16 +658,23 @@ def forecast(req: ForecastRequest):
         "timeline": timeline,
         "watchlist": watchlist,
         "prep_targets": prep_targets,
-    }
+    })
 
 
 @app.get("/history/summary")
 def history_summary():
-    return HISTORY_SUMMARY
+    return Response(HISTORY_SUMMARY_JSON, media_type="application/json")
 
 
 # ─── SIMULATION ENDPOINTS ───────────────────────────────────────────────────────
 
+async def _ws_send(websocket: WebSocket, msg: dict) -> None:
+    """Send msg as a JSON text frame, encoded with orjson instead of stdlib json."""
+    await websocket.send_text(
+        orjson.dumps(msg, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+    )
+
+
 @app.get("/scenarios")
 def get_scenario_list():
     """List available simulation scenarios."""
@@ -603,12 +698,12 @@ async def simulation_websocket(websocket: WebSocket):
 
         scenarios = get_scenarios()
         if scenario_key not in scenarios:
-            await websocket.send_json({"type": "error", "message": f"Unknown scenario: {scenario_key}"})
+            await _ws_send(websocket, {"type": "error", "message": f"Unknown scenario: {scenario_key}"})
             return
 
         scenario = scenarios[scenario_key]
 
-        await websocket.send_json({
+        await _ws_send(websocket, {
             "type": "init",
             "scenario": {"key": scenario_key, "name": scenario.name, "description": scenario.description},
         })
@@ -628,7 +723,7 @@ async def simulation_websocket(websocket: WebSocket):
             profiles=PROFILES,
         )
 
-        await websocket.send_json({
+        await _ws_send(websocket, {
             "type": "game_info",
             "game": game_info,
             "archetype": forecast["archetype"],
@@ -681,13 +776,12 @@ async def simulation_websocket(websocket: WebSocket):
                     pass
             elif drift_report.has_significant_drift:
                 # Rule-based fallback
-                from engine.ai.reasoning import _fallback_classify
                 reasoning = _fallback_classify(drift_report, detector.cumulative_drift(), "AI disabled")
                 reasoning_results.append(reasoning)
                 msg["ai_alert"] = reasoning.to_dict()
 
             asyncio.run_coroutine_threadsafe(
-                websocket.send_json(msg), loop
+                _ws_send(websocket, msg), loop
             )
 
         sim.observers = [on_event]
@@ -727,7 +821,7 @@ async def simulation_websocket(websocket: WebSocket):
             except Exception:
                 pass
 
-        await websocket.send_json({
+        await _ws_send(websocket, {
             "type": "complete",
             "summary": summary,
             "post_game_report": post_game,
@@ -738,7 +832,7 @@ async def simulation_websocket(websocket: WebSocket):
         pass
     except Exception as e:
         try:
-            await websocket.send_json({"type": "error", "message": str(e)})
+            await _ws_send(websocket, {"type": "error", "message": str(e)})
         except Exception:
             pass
 
@@ -748,54 +842,7 @@ async def simulation_websocket(websocket: WebSocket):
 @app.get("/validation/backtest")
 def get_backtest():
     """Return pre-computed LOO backtest results."""
-    if BACKTEST_CACHE is None:
-        return {"results": [], "error": "Backtest not computed"}
-
-    results = BACKTEST_CACHE
-    n = len(results)
-    if n == 0:
-        return {"results": [], "summary": {}}
-
-    errors = [abs(r["volume_error"]) for r in results]
-    within_15 = sum(1 for e in errors if e <= 0.15)
-    within_25 = sum(1 for e in errors if e <= 0.25)
-
-    # Archetype breakdown
-    archetype_stats = {}
-    for r in results:
-        arch = r["archetype"]
-        if arch not in archetype_stats:
-            archetype_stats[arch] = {"count": 0, "errors": [], "games": []}
-        archetype_stats[arch]["count"] += 1
-        archetype_stats[arch]["errors"].append(r["volume_error"])
-        archetype_stats[arch]["games"].append(r)
-
-    arch_summary = {}
-    for arch, data in archetype_stats.items():
-        errs = data["errors"]
-        import statistics
-        arch_summary[arch] = {
-            "count": data["count"],
-            "median_error": round(statistics.median(errs), 4),
-            "mean_abs_error": round(sum(abs(e) for e in errs) / len(errs), 4),
-            "within_15pct": sum(1 for e in errs if abs(e) <= 0.15),
-        }
-
-    return {
-        "results": results,
-        "summary": {
-            "total_games": n,
-            "median_error": round(statistics.median([r["volume_error"] for r in results]), 4),
-            "mean_abs_error": round(sum(errors) / n, 4),
-            "within_15pct": within_15,
-            "within_15pct_rate": round(within_15 / n, 3),
-            "within_25pct": within_25,
-            "within_25pct_rate": round(within_25 / n, 3),
-            "total_waste_units": sum(r["waste_units"] for r in results),
-            "total_stockout_units": sum(r["stockout_units"] for r in results),
-        },
-        "archetype_breakdown": arch_summary,
-    }
+    return Response(BACKTEST_JSON, media_type="application/json")
 
 
 # ─── AI / EVENT ENDPOINTS ──────────────────────────────────────────────────────
@@ -0,0 +1,23 @@
+"""Shared Anthropic client for the AI modules."""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import anthropic
+
+
+@functools.lru_cache(maxsize=1)
+def get_client() -> anthropic.Anthropic:
+    """Return a process-wide Anthropic client, created on first use.
+
+    The client is thread-safe and keeps its own connection pool, so one
+    instance is shared by every AI call. A failed construction (e.g. missing
+    API key) is not cached and is retried on the next call. The SDK itself
+    is imported here so fallback-only runs never pay its import cost.
+    """
+    import anthropic
+
+    return anthropic.Anthropic()
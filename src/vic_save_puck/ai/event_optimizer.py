@@ -7,10 +7,10 @@ from dataclasses import dataclass
 
 import pandas as pd
 import numpy as np
-import anthropic
 
 from vic_save_puck.data.enricher import enrich_games
 from vic_save_puck.data.loader import load_merged
+from vic_save_puck.ai.client import get_client
 
 
 @dataclass
@@ -164,7 +164,7 @@ def generate_ai_event_recommendations(
     )
 
     try:
-        client = anthropic.Anthropic()
+        client = get_client()
         response = client.messages.create(
             model="claude-haiku-4-5",
             max_tokens=2048,
@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-import json
+import functools
 from dataclasses import dataclass, field
 
-import anthropic
+import orjson
 import pandas as pd
 import numpy as np
 
-from vic_save_puck.validation.backtest import GameResult
+from vic_save_puck.validation.backtest import GameResult, results_frame
+from vic_save_puck.ai.client import get_client
 
 
 @dataclass
@@ -22,6 +23,20 @@ class ForecastAnalysis:
     summary: str = ""
 
 
+# Number of worst-forecast games included in the prompt
+TOP_N_GAMES = 30
+
+# Backtest columns rendered into each prompt row
+GAME_ROW_COLS = [
+    "game_date", "opponent", "archetype", "attendance",
+    "actual_total", "forecast_total", "volume_error",
+]
+
+# Enriched-games columns attached to each prompt row
+GAME_FEATURE_COLS = ["temp_mean", "is_promo", "is_weekend", "is_playoff", "opponent_division"]
+
+PROMPT_JSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+
 SYSTEM_PROMPT = """You are a sports venue F&B demand forecasting analyst. You analyze leave-one-out cross-validation results from a forecasting model used at Save on Foods Memorial Centre (WHL Victoria Royals hockey).
 
 The forecast computes expected_qty = avg_qty_per_game * (attendance / reference_attendance) with adjustments for temperature, promos, and playoffs.
@@ -58,71 +73,82 @@ def analyze_forecast_errors(
     if not results:
         return ForecastAnalysis(summary="No results to analyze.")
 
-    df = pd.DataFrame([vars(r) for r in results])
+    df = results_frame(results)
+    # Pull the error column out once; every summary stat below reads these arrays
+    err = df["volume_error"].to_numpy()
+    abs_err = np.abs(err)
 
     # Build summary stats
     summary_stats = {
-        "n_games": len(df),
-        "median_volume_error": f"{df['volume_error'].median():+.1%}",
-        "mean_abs_error": f"{df['volume_error'].abs().mean():.1%}",
+        "n_games": err.size,
+        "median_volume_error": f"{np.median(err):+.1%}",
+        "mean_abs_error": f"{abs_err.mean():.1%}",
         "mean_stand_mape": f"{df['stand_mape'].mean():.1%}",
         "mean_item_mape": f"{df['item_mape'].mean():.1%}",
-        "within_15pct": int((df['volume_error'].abs() <= 0.15).sum()),
-        "within_25pct": int((df['volume_error'].abs() <= 0.25).sum()),
-        "overpredictions": int((df['volume_error'] > 0).sum()),
-        "underpredictions": int((df['volume_error'] < 0).sum()),
+        "within_15pct": int((abs_err <= 0.15).sum()),
+        "within_25pct": int((abs_err <= 0.25).sum()),
+        "overpredictions": int((err > 0).sum()),
+        "underpredictions": int((err < 0).sum()),
     }
 
-    # Per-archetype stats
-    arch_stats = {}
-    for arch in df["archetype"].unique():
-        sub = df[df["archetype"] == arch]
-        arch_stats[arch] = {
-            "count": len(sub),
-            "median_error": f"{sub['volume_error'].median():+.1%}",
-            "mean_abs_error": f"{sub['volume_error'].abs().mean():.1%}",
+    # Per-archetype stats (one grouped pass, archetypes in first-seen order)
+    arch_groups = df.assign(abs_err=abs_err).groupby("archetype", sort=False).agg(
+        count=("volume_error", "size"),
+        med=("volume_error", "median"),
+        mae=("abs_err", "mean"),
+    )
+    arch_stats = {
+        arch: {
+            "count": count,
+            "median_error": f"{med:+.1%}",
+            "mean_abs_error": f"{mae:.1%}",
         }
+        for arch, count, med, mae in arch_groups.itertuples(name=None)
+    }
 
-    # Per-game table (sorted by abs error descending)
-    df_sorted = df.sort_values("volume_error", key=abs, ascending=False)
-    game_rows = []
-    for _, row in df_sorted.iterrows():
-        game_rows.append({
-            "date": str(row["game_date"].date()),
-            "opponent": row["opponent"],
-            "archetype": row["archetype"],
-            "attendance": int(row["attendance"]),
-            "actual": int(row["actual_total"]),
-            "forecast": int(row["forecast_total"]),
-            "error": f"{row['volume_error']:+.1%}",
-        })
+    # Per-game table: only the 30 largest |errors| go into the prompt, so
+    # select them with a partial sort instead of ordering every game
+    top_idx = df["volume_error"].abs().nlargest(TOP_N_GAMES).index
+    df_top = df.loc[top_idx]
 
-    # Add game-level features if available
+    # Attach game-level features with one join rather than a scan per game
     if games is not None:
-        for gr in game_rows:
-            gd = pd.Timestamp(gr["date"])
-            match = games[games["game_date"] == gd]
-            if not match.empty:
-                g = match.iloc[0]
-                gr["temp_mean"] = round(float(g.get("temp_mean", 0)), 1)
-                gr["is_promo"] = bool(g.get("is_promo", False))
-                gr["is_weekend"] = bool(g.get("is_weekend", False))
-                gr["is_playoff"] = bool(g.get("is_playoff", False))
-                gr["division"] = str(g.get("opponent_division", ""))
+        features = games[["game_date", *GAME_FEATURE_COLS]].drop_duplicates("game_date")
+        df_top = df_top.merge(features, on="game_date", how="left", indicator="feature_match")
+
+    row_cols = GAME_ROW_COLS + ([*GAME_FEATURE_COLS, "feature_match"] if games is not None else [])
+    game_rows = []
+    for r in df_top[row_cols].to_dict(orient="records"):
+        gr = {
+            "date": str(r["game_date"].date()),
+            "opponent": r["opponent"],
+            "archetype": r["archetype"],
+            "attendance": int(r["attendance"]),
+            "actual": int(r["actual_total"]),
+            "forecast": int(r["forecast_total"]),
+            "error": f"{r['volume_error']:+.1%}",
+        }
+        if games is not None and r["feature_match"] == "both":
+            gr["temp_mean"] = round(float(r["temp_mean"]), 1)
+            gr["is_promo"] = bool(r["is_promo"])
+            gr["is_weekend"] = bool(r["is_weekend"])
+            gr["is_playoff"] = bool(r["is_playoff"])
+            gr["division"] = str(r["opponent_division"])
+        game_rows.append(gr)
 
     user_message = f"""BACKTEST SUMMARY:
-{json.dumps(summary_stats, indent=2)}
+{orjson.dumps(summary_stats, option=PROMPT_JSON_OPTS).decode()}
 
 PER-ARCHETYPE STATS:
-{json.dumps(arch_stats, indent=2)}
+{orjson.dumps(arch_stats, option=PROMPT_JSON_OPTS).decode()}
 
 PER-GAME RESULTS (sorted by |error|, top errors first):
-{json.dumps(game_rows[:30], indent=2)}
+{orjson.dumps(game_rows, option=PROMPT_JSON_OPTS).decode()}
 
 Analyze the error patterns. Identify systematic biases, feature-driven patterns, and recommend model improvements. Respond with JSON only."""
 
     try:
-        client = anthropic.Anthropic()
+        client = get_client()
         response = client.messages.create(
             model="claude-haiku-4-5",
             max_tokens=2048,
@@ -147,49 +173,56 @@ Analyze the error patterns. Identify systematic biases, feature-driven patterns,
 
 def _parse_json_response(text: str) -> dict:
     """Extract JSON from model response."""
+    # Cache holds the normalised JSON bytes so each caller gets a fresh dict
+    return orjson.loads(_normalize_json_response(text))
+
+
+@functools.lru_cache(maxsize=128)
+def _normalize_json_response(text: str) -> bytes:
+    """Strip code fences / surrounding prose and return the JSON payload as bytes."""
     text = text.strip()
     if text.startswith("```"):
         lines = text.split("\n")
         lines = [l for l in lines if not l.strip().startswith("```")]
         text = "\n".join(lines)
     try:
-        return json.loads(text)
-    except json.JSONDecodeError:
+        return orjson.dumps(orjson.loads(text))
+    except orjson.JSONDecodeError:
         start = text.find("{")
         end = text.rfind("}") + 1
         if start >= 0 and end > start:
-            return json.loads(text[start:end])
-        return {}
+            return orjson.dumps(orjson.loads(text[start:end]))
+        return b"{}"
 
 
 def _fallback_analysis(df: pd.DataFrame, error: str) -> ForecastAnalysis:
     """Rule-based fallback when Claude API is unavailable."""
     findings = []
+    err = df["volume_error"].to_numpy()
 
-    med_err = df["volume_error"].median()
+    med_err = np.median(err)
     if med_err > 0.1:
         findings.append(f"Systematic overprediction: median error is {med_err:+.1%}")
     elif med_err < -0.1:
         findings.append(f"Systematic underprediction: median error is {med_err:+.1%}")
 
-    # Per-archetype
-    for arch in sorted(df["archetype"].unique()):
-        sub = df[df["archetype"] == arch]
-        arch_med = sub["volume_error"].median()
-        findings.append(f"{arch} ({len(sub)} games): median error {arch_med:+.1%}")
+    # Per-archetype: one grouped pass instead of a boolean mask per archetype
+    arch_stats = df.groupby("archetype", sort=True)["volume_error"].agg(count="size", med="median")
+    for arch, count, arch_med in arch_stats.itertuples(name=None):
+        findings.append(f"{arch} ({count} games): median error {arch_med:+.1%}")
 
     # Worst games
     worst = df.nlargest(3, "volume_error")
     outliers = []
-    for _, row in worst.iterrows():
+    for row in worst.itertuples(index=False):
         outliers.append({
-            "game": f"{row['game_date'].date()} vs {row['opponent']}",
-            "error": f"{row['volume_error']:+.1%}",
+            "game": f"{row.game_date.date()} vs {row.opponent}",
+            "error": f"{row.volume_error:+.1%}",
             "likely_cause": "High overprediction — possible low-energy game or data anomaly",
         })
 
-    within_15 = (df["volume_error"].abs() <= 0.15).sum()
-    n = len(df)
+    within_15 = int((np.abs(err) <= 0.15).sum())
+    n = err.size
 
     return ForecastAnalysis(
         key_findings=findings,
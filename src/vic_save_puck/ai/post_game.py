@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import json
-import anthropic
+import orjson
 
 from vic_save_puck.models.drift import DriftDetector
 from vic_save_puck.ai.reasoning import ReasoningResult
+from vic_save_puck.ai.client import get_client
+
+PROMPT_JSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
 
 
 POSTGAME_SYSTEM = """You are an AI post-game analyst for Save on Foods Memorial Centre (WHL hockey arena, Victoria BC). After a game simulation, you produce a concise operations report.
@@ -67,10 +69,10 @@ FORECAST PERFORMANCE:
 - Warning signals: {summary['warning_signals']}
 
 DRIFT TIMELINE (significant events):
-{json.dumps(drift_timeline[:10], indent=2)}
+{orjson.dumps(drift_timeline[:10], option=PROMPT_JSON_OPTS).decode()}
 
 AI INTERVENTIONS:
-{json.dumps(ai_actions[:8], indent=2)}
+{orjson.dumps(ai_actions[:8], option=PROMPT_JSON_OPTS).decode()}
 
 FORECAST CONFIG:
 - Archetype used: {forecast.get('archetype', '?')}
@@ -80,7 +82,7 @@ FORECAST CONFIG:
 Generate a post-game operations report."""
 
     try:
-        client = anthropic.Anthropic()
+        client = get_client()
         response = client.messages.create(
             model="claude-haiku-4-5",
             max_tokens=2048,
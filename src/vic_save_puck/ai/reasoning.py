@@ -5,10 +5,9 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 
-import anthropic
-
 from vic_save_puck.models.drift import DriftReport, DriftSignal
 from vic_save_puck.config import STAND_SHORT
+from vic_save_puck.ai.client import get_client
 
 
 @dataclass
@@ -109,7 +108,7 @@ RECENT TREND:
 Classify the drift cause and recommend actions. Respond with JSON only."""
 
     try:
-        client = anthropic.Anthropic()
+        client = get_client()
         response = client.messages.create(
             model="claude-haiku-4-5",
             max_tokens=1024,
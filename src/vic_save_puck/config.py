@@ -1,7 +1,10 @@
 """Constants, perishability tiers, stand metadata, and shared configuration."""
 
+import sys
 from pathlib import Path
 
+import numpy as np
+
 # ── Paths ────────────────────────────────────────────────────────────────────
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 DATA_DIR = PROJECT_ROOT / "data"
@@ -11,7 +14,7 @@ CACHE_DIR.mkdir(exist_ok=True)
 PARQUET_CACHE = CACHE_DIR / "transactions.parquet"
 GAMES_CACHE = CACHE_DIR / "games.parquet"
 ENRICHED_CACHE = CACHE_DIR / "enriched.parquet"
-PROFILES_CACHE = CACHE_DIR / "profiles.parquet"
+PROFILES_CACHE = CACHE_DIR / "profiles.arrow"
 
 # ── Venue ────────────────────────────────────────────────────────────────────
 VENUE_LAT = 48.4284  # Save on Foods Memorial Centre, Victoria BC
@@ -103,10 +106,9 @@ PREP_SCALEUP_INCREMENT = {
 }
 
 # Invert for quick lookup
-ITEM_PERISHABILITY: dict[str, str] = {}
-for tier, items in PERISHABILITY.items():
-    for item in items:
-        ITEM_PERISHABILITY[item] = tier
+ITEM_PERISHABILITY: dict[str, str] = {
+    sys.intern(item): sys.intern(tier) for tier, items in PERISHABILITY.items() for item in items
+}
 
 # ── Crowd archetypes ─────────────────────────────────────────────────────────
 # Thresholds for beer_share of total alcohol+food qty
@@ -133,6 +135,12 @@ PERIOD_BOUNDARIES = {
 
 # 10-minute time windows relative to puck drop
 TIME_WINDOWS = list(range(-30, 120, 10))  # -30 to +110 in 10-min buckets
+TIME_WINDOWS_ARR = np.asarray(TIME_WINDOWS, dtype=np.int32)
+
+# Game-phase lookup for np.searchsorted: minutes from puck drop below
+# PHASE_BOUNDS_ARR[0] are pre-game, at or past PHASE_BOUNDS_ARR[-1] are post-game.
+PHASE_BOUNDS_ARR = np.array(sorted(set(PERIOD_BOUNDARIES.values())), dtype=np.int32)
+PHASE_LABELS_ARR = np.array(["pre_game", "P1", "INT1", "P2", "INT2", "P3", "post_game"], dtype=object)
 
 # ── WHL opponent metadata (distance from Victoria in km) ─────────────────────
 OPPONENT_DISTANCE = {
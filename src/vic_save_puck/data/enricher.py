@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import pandas as pd
 import numpy as np
@@ -12,7 +13,7 @@ from vic_save_puck.config import (
     OPPONENT_DISTANCE, OPPONENT_DIVISION,
     ARCHETYPE_THRESHOLDS,
 )
-from vic_save_puck.data.loader import load_games, load_merged
+from vic_save_puck.data.loader import load_games, load_merged, cache_is_fresh
 
 
 WEATHER_CACHE = CACHE_DIR / "weather.json"
@@ -92,10 +93,18 @@ def classify_archetype(game_txns: pd.DataFrame) -> str:
         return "mixed"
 
 
+@functools.lru_cache(maxsize=1)
+def _read_enriched(mtime_ns: int) -> pd.DataFrame:
+    return pd.read_parquet(ENRICHED_CACHE)
+
+
 def enrich_games(force_reload: bool = False) -> pd.DataFrame:
-    """Enrich games with weather, opponent metadata, calendar flags, archetypes."""
-    if ENRICHED_CACHE.exists() and not force_reload:
-        return pd.read_parquet(ENRICHED_CACHE)
+    """Enrich games with weather, opponent metadata, calendar flags, archetypes.
+
+    A fresh on-disk cache is memoized on its mtime; callers get a copy.
+    """
+    if not force_reload and cache_is_fresh(ENRICHED_CACHE):
+        return _read_enriched(ENRICHED_CACHE.stat().st_mtime_ns).copy()
 
     games = load_games(force_reload=force_reload)
     merged = load_merged(force_reload=force_reload)
@@ -5,8 +5,10 @@ from __future__ import annotations
 import argparse
 import time
 import sys
+from typing import TYPE_CHECKING
 
-from rich.console import Console
+import numpy as np
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.live import Live
@@ -15,20 +17,27 @@ from rich.columns import Columns
 from rich import box
 
 from vic_save_puck.config import STAND_SHORT
-from vic_save_puck.data.profiles import build_profiles
-from vic_save_puck.models.forecast import forecast_for_game, generate_forecast
-from vic_save_puck.models.prep_plan import generate_prep_plan, format_prep_plan
-from vic_save_puck.models.drift import DriftDetector
-from vic_save_puck.simulator.engine import GameSimulator, GameEvent
-from vic_save_puck.simulator.scenarios import get_scenarios, list_scenarios
-from vic_save_puck.ai.reasoning import analyze_drift, ReasoningResult
-from vic_save_puck.ai.post_game import generate_post_game_report
-from vic_save_puck.ai.event_optimizer import analyze_promo_opportunities, generate_ai_event_recommendations
-from vic_save_puck.models.traffic_light import TrafficLightMonitor, Status
-from vic_save_puck.validation.backtest import run_backtest
+
+# The pipeline modules pull in pandas/sklearn/anthropic; they are imported
+# inside the commands that use them so `--help` starts quickly.
+if TYPE_CHECKING:
+    from vic_save_puck.ai.reasoning import ReasoningResult
+    from vic_save_puck.simulator.engine import GameEvent
 
 console = Console()
 
+# Rich colours for the status, AI cause and recommendation-type labels
+_STATUS_COLOR = {"green": "green", "yellow": "yellow", "red": "red"}
+_CAUSE_COLOR = {
+    "volume_surge": "red",
+    "volume_drop": "blue",
+    "untagged_promo": "magenta",
+    "stand_redistribution": "yellow",
+    "weather_effect": "cyan",
+    "noise": "dim",
+}
+_RECOMMENDATION_COLOR = {"promo": "magenta", "early_bird": "yellow", "event": "cyan", "scheduling": "green"}
+
 
 def run_demo(
     scenario_key: str = "normal",
@@ -36,6 +45,15 @@ def run_demo(
     skip_ai: bool = False,
 ):
     """Run the full demo pipeline."""
+    from vic_save_puck.data.profiles import build_profiles
+    from vic_save_puck.models.forecast import forecast_for_game
+    from vic_save_puck.models.prep_plan import generate_prep_plan
+    from vic_save_puck.models.drift import DriftDetector
+    from vic_save_puck.simulator.scenarios import get_scenarios
+    from vic_save_puck.ai.reasoning import analyze_drift
+    from vic_save_puck.ai.post_game import generate_post_game_report
+    from vic_save_puck.models.traffic_light import TrafficLightMonitor, Status
+
     console.print()
     console.print(Panel.fit(
         "[bold cyan]VIC SAVE PUCK[/bold cyan]\n"
@@ -100,8 +118,8 @@ def run_demo(
 
     console.print(f"[green]✓[/green] Prep plan: {len(prep_actions)} actions")
     # Show first few prep actions
-    for a in prep_actions[:5]:
-        console.print(f"  [dim]{a}[/dim]")
+    if prep_actions:
+        console.print("\n".join(f"  [dim]{a}[/dim]" for a in prep_actions[:5]))
     if len(prep_actions) > 5:
         console.print(f"  [dim]... and {len(prep_actions) - 5} more[/dim]")
     console.print()
@@ -127,21 +145,25 @@ def run_demo(
     event_count = 0
     window_event_buffer: list[GameEvent] = []
 
-    def on_window_complete(tw: int, events: list[GameEvent]):
+    def on_window_complete(tw: int):
         """Called when a time window completes."""
         nonlocal reasoning_results
 
         report = detector.check_drift(tw)
         status = traffic_monitor.update(tw)
 
-        actual = sum(e.qty for e in events)
+        actual = detector.actual_total(tw)
+
+        # Collect the window's output and render it in one console.print
+        renderables = []
 
         # Always show traffic light status line
-        status_color = {"green": "green", "yellow": "yellow", "red": "red"}[status.overall_status.value]
+        status_color = _STATUS_COLOR[status.overall_status.value]
         status_line = traffic_monitor.summary_line()
-        console.print(f"  [{status_color}]{status_line}[/{status_color}]")
+        renderables.append(f"  [{status_color}]{status_line}[/{status_color}]")
 
         if not report.has_significant_drift:
+            console.print(Group(*renderables))
             return
 
         # Show detailed stand statuses for yellow/red windows
@@ -149,13 +171,13 @@ def run_demo(
             for ss in status.stand_statuses:
                 if ss.status != Status.GREEN:
                     ss_color = "red" if ss.status == Status.RED else "yellow"
-                    console.print(f"    [{ss_color}]{ss}[/{ss_color}]")
+                    renderables.append(f"    [{ss_color}]{ss}[/{ss_color}]")
 
         # Significant drift: show drift panel
         severity_color = "red" if any(s.severity == "critical" for s in report.signals) else "yellow"
 
-        console.print()
-        console.print(Panel(
+        renderables.append("")
+        renderables.append(Panel(
             _format_drift_panel(report, actual),
             title=f"[bold {severity_color}]DRIFT DETECTED T{tw:+}min[/bold {severity_color}]",
             border_style=severity_color,
@@ -163,6 +185,9 @@ def run_demo(
 
         # AI reasoning only for RED status (saves API calls, focuses on actionable)
         if not skip_ai and status.overall_status == Status.RED:
+            # Flush before the (slow) API call so the drift is visible meanwhile
+            console.print(Group(*renderables))
+            renderables = []
             with console.status("[cyan]AI analyzing drift..."):
                 result = analyze_drift(
                     drift_report=report,
@@ -172,16 +197,9 @@ def run_demo(
                 )
             reasoning_results.append(result)
 
-            cause_color = {
-                "volume_surge": "red",
-                "volume_drop": "blue",
-                "untagged_promo": "magenta",
-                "stand_redistribution": "yellow",
-                "weather_effect": "cyan",
-                "noise": "dim",
-            }.get(result.cause, "white")
+            cause_color = _CAUSE_COLOR.get(result.cause, "white")
 
-            console.print(Panel(
+            renderables.append(Panel(
                 f"[bold]Cause:[/bold] [{cause_color}]{result.cause}[/{cause_color}] "
                 f"(confidence: {result.confidence:.0%})\n\n"
                 f"[bold]Alert:[/bold] {result.alert_text}\n\n"
@@ -189,32 +207,19 @@ def run_demo(
                 title="[bold cyan]AI RECOMMENDATION[/bold cyan]",
                 border_style="cyan",
             ))
-        console.print()
+        renderables.append("")
+        console.print(Group(*renderables))
 
     # Run simulation in batch mode (events emitted instantly)
     # but process window-by-window
     console.print("[bold]Running game simulation...[/bold]")
     console.print()
 
-    events = []
-    window_buffers: dict[int, list[GameEvent]] = {}
-
-    # Batch run for speed
-    all_events = sim.run_batch()
-
-    # Process events window by window
-    processed_windows = set()
-    for event in all_events:
-        detector.ingest_event(event)
-        tw = event.time_window
-
-        if tw not in window_buffers:
-            window_buffers[tw] = []
-        window_buffers[tw].append(event)
-
-    # Process windows in order
-    for tw in sorted(window_buffers.keys()):
-        on_window_complete(tw, window_buffers[tw])
+    # Stream the game window by window (no timing): ingest each window's
+    # events, check it, then let them go before the next window
+    for tw, window_events in sim.iter_windows():
+        detector.ingest_batch(window_events)
+        on_window_complete(tw)
 
     # ── Phase 5: Post-game report ────────────────────────────────────────
     console.print()
@@ -252,20 +257,28 @@ def run_demo(
     console.print()
 
 
+def _stand_drift_color(drift: float) -> str:
+    return "red" if drift > 0.2 else ("blue" if drift < -0.2 else "yellow")
+
+
 def _format_drift_panel(report, actual: int) -> str:
     """Format drift report for display."""
     lines = [f"Total: {actual} units | Overall: {report.overall_volume_drift:+.0%}"]
 
-    # Stand drifts
-    stand_lines = []
-    for stand, drift in sorted(report.stand_drifts.items(), key=lambda x: -abs(x[1])):
-        if abs(drift) >= 0.15:
-            short = STAND_SHORT.get(stand, stand)
-            color = "red" if drift > 0.2 else ("blue" if drift < -0.2 else "yellow")
-            stand_lines.append(f"  [{color}]{short}: {drift:+.0%}[/{color}]")
-    if stand_lines:
+    # Stand drifts: mask and rank by |drift| in one pass, format only the top 5
+    stands = list(report.stand_drifts)
+    drifts = np.fromiter(report.stand_drifts.values(), dtype=np.float64, count=len(stands))
+    abs_drifts = np.abs(drifts)
+    flagged = np.flatnonzero(abs_drifts >= 0.15)
+    top = flagged[np.argsort(-abs_drifts[flagged], kind="stable")][:5].tolist()
+    if top:
+        shorts = [STAND_SHORT.get(stands[i], stands[i]) for i in top]
+        top_drifts = drifts[top].tolist()
+        colors = [_stand_drift_color(d) for d in top_drifts]
         lines.append("\n[bold]Stands:[/bold]")
-        lines.extend(stand_lines[:5])
+        lines.extend(
+            f"  [{c}]{short}: {d:+.0%}[/{c}]" for short, d, c in zip(shorts, top_drifts, colors)
+        )
 
     # Top item signals
     item_signals = [s for s in report.signals if s.drift_type == "mix"][:5]
@@ -293,6 +306,8 @@ def _format_actions(actions: list[dict]) -> str:
 
 def run_event_optimizer(skip_ai: bool = False):
     """Run the promo/event optimization analysis."""
+    from vic_save_puck.ai.event_optimizer import analyze_promo_opportunities, generate_ai_event_recommendations
+
     console.print()
     console.print(Panel.fit(
         "[bold cyan]VIC SAVE PUCK — Event Optimizer[/bold cyan]\n"
@@ -307,9 +322,7 @@ def run_event_optimizer(skip_ai: bool = False):
     console.print(f"[green]✓[/green] Found {len(recommendations)} insights\n")
 
     for r in recommendations:
-        color = {"promo": "magenta", "early_bird": "yellow", "event": "cyan", "scheduling": "green"}.get(
-            r.recommendation_type, "white"
-        )
+        color = _RECOMMENDATION_COLOR.get(r.recommendation_type, "white")
         console.print(Panel(
             f"[bold]Impact:[/bold] {r.expected_impact}\n"
             f"[bold]Confidence:[/bold] {r.confidence:.0%}\n"
@@ -418,6 +431,7 @@ def main():
             train_correction_model()
             console.print()
 
+        from vic_save_puck.validation.backtest import run_backtest
         results = run_backtest(detailed=args.detailed, use_correction=args.with_correction)
 
         if args.analyze and not args.skip_ai:
@@ -431,33 +445,41 @@ def main():
                 title="[bold green]AI FORECAST ERROR ANALYSIS[/bold green]",
                 border_style="green",
             ))
+            # One print per section rather than one per line
             if analysis.key_findings:
-                console.print("[bold]Key Findings:[/bold]")
-                for f in analysis.key_findings:
-                    console.print(f"  [cyan]\u2022[/cyan] {f}")
+                console.print("\n".join([
+                    "[bold]Key Findings:[/bold]",
+                    *(f"  [cyan]\u2022[/cyan] {f}" for f in analysis.key_findings),
+                ]))
                 console.print()
             if analysis.feature_importance:
-                console.print("[bold]Feature Importance:[/bold]")
-                for feat, desc in analysis.feature_importance.items():
-                    console.print(f"  [yellow]{feat}[/yellow]: {desc}")
+                console.print("\n".join([
+                    "[bold]Feature Importance:[/bold]",
+                    *(f"  [yellow]{feat}[/yellow]: {desc}"
+                      for feat, desc in analysis.feature_importance.items()),
+                ]))
                 console.print()
             if analysis.threshold_recommendations:
-                console.print("[bold]Threshold Recommendations:[/bold]")
-                for rec in analysis.threshold_recommendations:
-                    console.print(f"  [magenta]{rec.get('parameter', '?')}[/magenta]: "
-                                  f"{rec.get('current', '?')} \u2192 {rec.get('recommended', '?')} "
-                                  f"({rec.get('rationale', '')})")
+                console.print("\n".join([
+                    "[bold]Threshold Recommendations:[/bold]",
+                    *(f"  [magenta]{rec.get('parameter', '?')}[/magenta]: "
+                      f"{rec.get('current', '?')} \u2192 {rec.get('recommended', '?')} "
+                      f"({rec.get('rationale', '')})"
+                      for rec in analysis.threshold_recommendations),
+                ]))
                 console.print()
             if analysis.outlier_explanations:
-                console.print("[bold]Outlier Explanations:[/bold]")
-                for out in analysis.outlier_explanations[:5]:
-                    console.print(f"  [red]{out.get('game', '?')}[/red] ({out.get('error', '?')}): "
-                                  f"{out.get('likely_cause', '')}")
+                console.print("\n".join([
+                    "[bold]Outlier Explanations:[/bold]",
+                    *(f"  [red]{out.get('game', '?')}[/red] ({out.get('error', '?')}): "
+                      f"{out.get('likely_cause', '')}"
+                      for out in analysis.outlier_explanations[:5]),
+                ]))
                 console.print()
         elif args.analyze and args.skip_ai:
             from vic_save_puck.ai.forecast_analyst import _fallback_analysis
-            import pandas as _pd
-            df = _pd.DataFrame([vars(r) for r in results])
+            from vic_save_puck.validation.backtest import results_frame
+            df = results_frame(results)
             analysis = _fallback_analysis(df, "skipped by user")
             console.print()
             console.print(Panel(
@@ -466,12 +488,12 @@ def main():
                 border_style="yellow",
             ))
             if analysis.key_findings:
-                for f in analysis.key_findings:
-                    console.print(f"  [cyan]\u2022[/cyan] {f}")
+                console.print("\n".join(f"  [cyan]\u2022[/cyan] {f}" for f in analysis.key_findings))
     elif args.command == "events":
         run_event_optimizer(skip_ai=args.skip_ai)
     elif args.command == "sim":
         if args.list_scenarios:
+            from vic_save_puck.simulator.scenarios import list_scenarios
             for s in list_scenarios():
                 console.print(f"[bold]{s['key']:20}[/bold] | {s['game_date']} | {s['name']}")
                 console.print(f"  [dim]{s['description']}[/dim]")
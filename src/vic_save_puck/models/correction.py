@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 import pandas as pd
 from pathlib import Path
@@ -12,7 +17,7 @@ from rich.progress import track
 from vic_save_puck.config import CACHE_DIR
 from vic_save_puck.data.loader import load_merged
 from vic_save_puck.data.enricher import enrich_games
-from vic_save_puck.data.profiles import build_profiles_from_data
+from vic_save_puck.data.profiles import build_curve_aggregates, profiles_without_game
 from vic_save_puck.models.forecast import generate_forecast
 
 CORRECTION_CACHE = CACHE_DIR / "correction_model.json"
@@ -24,30 +29,131 @@ FEATURE_NAMES = [
 ]
 
 
-def _build_feature_vector(g: pd.Series, att_mean: float, att_std: float,
-                          temp_mean: float, temp_std: float) -> list[float]:
-    """Build feature vector from a game row."""
+def _build_feature_vector(g: pd.Series | dict, att_mean: float, att_std: float,
+                          temp_mean: float, temp_std: float) -> np.ndarray:
+    """Build feature vector from a game row (a Series or a plain dict of fields)."""
     att_z = (g["attendance"] - att_mean) / att_std if att_std > 0 else 0.0
     temp_z = (g["temp_mean"] - temp_mean) / temp_std if temp_std > 0 else 0.0
     div = g.get("opponent_division", "Unknown")
-    return [
+    arch = g.get("archetype", "")
+    return np.array([
         att_z,
-        float(g.get("is_weekend", False)),
-        float(g.get("is_promo", False)),
-        float(g.get("is_playoff", False)),
+        g.get("is_weekend", False),
+        g.get("is_promo", False),
+        g.get("is_playoff", False),
         temp_z,
-        float(g.get("archetype", "") == "beer_crowd"),
-        float(g.get("archetype", "") == "family"),
-        float(div == "US"),
-        float(div == "BC"),
-        float(div == "East"),
-        float(g.get("puck_drop_hour", 19)),
-    ]
+        arch == "beer_crowd",
+        arch == "family",
+        div == "US",
+        div == "BC",
+        div == "East",
+        g.get("puck_drop_hour", 19),
+    ], dtype=np.float32)
+
+
+def _build_feature_matrix(games: pd.DataFrame, att_mean: float, att_std: float,
+                          temp_mean: float, temp_std: float) -> np.ndarray:
+    """Build the (n_games, n_features) matrix for every game row in one pass.
+
+    Row i matches ``_build_feature_vector(games.iloc[i], ...)``.
+    """
+    n = len(games)
+
+    def col(name: str, default) -> np.ndarray:
+        if name in games.columns:
+            return games[name].to_numpy()
+        return np.full(n, default, dtype=object)
+
+    att_z = (col("attendance", np.nan).astype(np.float64) - att_mean) / att_std if att_std > 0 else np.zeros(n)
+    temp_z = (col("temp_mean", np.nan).astype(np.float64) - temp_mean) / temp_std if temp_std > 0 else np.zeros(n)
+    div = col("opponent_division", "Unknown")
+    arch = col("archetype", "")
+    return np.column_stack([
+        att_z,
+        col("is_weekend", False).astype(np.float64),
+        col("is_promo", False).astype(np.float64),
+        col("is_playoff", False).astype(np.float64),
+        temp_z,
+        arch == "beer_crowd",
+        arch == "family",
+        div == "US",
+        div == "BC",
+        div == "East",
+        col("puck_drop_hour", 19).astype(np.float64),
+    ]).astype(np.float32)
+
+
+def _loo_fold(
+    fold: tuple[pd.Timestamp, int],
+    n_rows: int,
+    games: pd.DataFrame,
+    curve_aggregates: dict,
+    rows_per_game: pd.Series,
+    actual_totals: pd.Series,
+) -> tuple[int, float, dict] | None:
+    """Residual for one held-out game.
+
+    ``fold`` is the game date and its row position in games. Returns
+    (row position, correction target, game info), or None if the game has
+    no usable residual.
+    """
+    gd_ts, game_pos = fold
+    g = games.iloc[game_pos]
+
+    if rows_per_game.get(gd_ts, 0) == n_rows:
+        return None  # no training transactions left
+
+    profiles = profiles_without_game(curve_aggregates, gd_ts)
+
+    forecast = generate_forecast(
+        attendance=int(g["attendance"]),
+        puck_drop_hour=int(g["puck_drop_hour"]),
+        is_playoff=bool(g["is_playoff"]),
+        is_promo=bool(g["is_promo"]),
+        promo_type=str(g.get("promo_type", "")),
+        temp_mean=float(g.get("temp_mean", 8.0)),
+        day_of_week=str(g["day_of_week"]),
+        profiles=profiles,
+    )
+
+    actual_total = int(actual_totals.get(gd_ts, 0))
+    forecast_total = int(forecast["item_forecast"]["expected_qty"].sum())
+
+    if forecast_total <= 0 or actual_total <= 0:
+        return None
+
+    correction_target = actual_total / forecast_total
+    return game_pos, correction_target, {
+        "date": str(gd_ts.date()),
+        "actual": actual_total,
+        "forecast": forecast_total,
+        "correction": round(correction_target, 4),
+    }
+
+
+# Per-process fold inputs, set once by the pool initializer
+_WORKER_DATA: dict = {}
+
+
+def _init_worker(n_rows: int, games: pd.DataFrame,
+                 curve_aggregates: dict, rows_per_game: pd.Series,
+                 actual_totals: pd.Series) -> None:
+    _WORKER_DATA.update(
+        n_rows=n_rows, games=games, curve_aggregates=curve_aggregates,
+        rows_per_game=rows_per_game, actual_totals=actual_totals,
+    )
+
 
+def _loo_worker(fold: tuple[pd.Timestamp, int]) -> tuple[int, float, dict] | None:
+    return _loo_fold(fold, **_WORKER_DATA)
 
-def train_correction_model() -> dict:
+
+def train_correction_model(max_workers: int | None = None) -> dict:
     """Train correction factors from LOO backtest residuals.
 
+    Folds are independent, so they are fanned out over a process pool.
+    Pass ``max_workers=1`` to run serially in the calling process.
+
     Returns dict with model coefficients and training metrics.
     """
     console = Console()
@@ -55,62 +161,65 @@ def train_correction_model() -> dict:
 
     merged = load_merged()
     games = enrich_games()
-    game_dates = sorted(games["game_date"].unique())
+    # (date, first row position in games) per game, converted once up front
+    first_pos: dict[pd.Timestamp, int] = {}
+    for pos, gd in enumerate(games["game_date"]):
+        first_pos.setdefault(pd.Timestamp(gd), pos)
+    folds_in = sorted(first_pos.items())
 
-    # Collect correction targets and features
+    # Collect correction targets and the games (rows of feature_matrix) they came from
     targets = []
-    features = []
+    feature_rows = []
     game_info_list = []
 
     att_mean = games["attendance"].mean()
     att_std = games["attendance"].std()
     temp_mean = games["temp_mean"].mean()
     temp_std = games["temp_mean"].std()
+    feature_matrix = _build_feature_matrix(games, att_mean, att_std, temp_mean, temp_std)
+
+    # Full-data curve sums, downdated per fold instead of rebuilding profiles
+    curve_aggregates = build_curve_aggregates(merged, games)
+    # One pass over merged for per-game row counts and actual units sold
+    per_game = merged.groupby("game_date")["Qty"].agg(["size", "sum"])
+    rows_per_game, actual_totals = per_game["size"], per_game["sum"]
+
+    # Games with no sales or no attendance can never yield a residual; drop
+    # them before paying for a profile downdate and forecast
+    attendance = games["attendance"].to_numpy()
+    folds_in = [
+        (gd_ts, pos) for gd_ts, pos in folds_in
+        if actual_totals.get(gd_ts, 0) > 0 and attendance[pos] > 0
+    ]
 
-    for gd in track(game_dates, description="Computing residuals"):
-        gd_ts = pd.Timestamp(gd)
-        game_row = games[games["game_date"] == gd_ts]
-        if game_row.empty:
-            continue
-        g = game_row.iloc[0]
-
-        train_merged = merged[merged["game_date"] != gd_ts]
-        train_games = games[games["game_date"] != gd_ts]
-        if train_merged.empty:
-            continue
-
-        profiles = build_profiles_from_data(train_merged, train_games)
-
-        forecast = generate_forecast(
-            attendance=int(g["attendance"]),
-            puck_drop_hour=int(g["puck_drop_hour"]),
-            is_playoff=bool(g["is_playoff"]),
-            is_promo=bool(g["is_promo"]),
-            promo_type=str(g.get("promo_type", "")),
-            temp_mean=float(g.get("temp_mean", 8.0)),
-            day_of_week=str(g["day_of_week"]),
-            profiles=profiles,
-        )
-
-        game_txns = merged[merged["game_date"] == gd_ts]
-        actual_total = int(game_txns["Qty"].sum())
-        forecast_total = int(forecast["item_forecast"]["expected_qty"].sum())
+    # Folds only need the aggregates above, so merged itself is never shipped to workers
+    fold_inputs = (len(merged), games, curve_aggregates, rows_per_game, actual_totals)
+    if max_workers is None:
+        max_workers = min(os.cpu_count() or 1, len(folds_in))
 
-        if forecast_total <= 0 or actual_total <= 0:
+    if max_workers <= 1:
+        folds = [_loo_fold(f, *fold_inputs) for f in track(folds_in, description="Computing residuals")]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker, initargs=fold_inputs,
+        ) as ex:
+            folds = list(track(
+                ex.map(_loo_worker, folds_in, chunksize=4),
+                total=len(folds_in), description="Computing residuals",
+            ))
+
+    for fold in folds:
+        if fold is None:
             continue
-
-        correction_target = actual_total / forecast_total
+        row, correction_target, info = fold
+        feature_rows.append(row)
         targets.append(correction_target)
-        features.append(_build_feature_vector(g, att_mean, att_std, temp_mean, temp_std))
-        game_info_list.append({
-            "date": str(gd_ts.date()),
-            "actual": actual_total,
-            "forecast": forecast_total,
-            "correction": round(correction_target, 4),
-        })
+        game_info_list.append(info)
 
-    X = np.array(features)
-    y = np.array(targets)
+    X = feature_matrix[feature_rows]
+    # Features are small standardized values and flags; float32 is ample for
+    # a ridge fit and halves the footprint of X and y.
+    y = np.asarray(targets, dtype=np.float32)
 
     # Try sklearn Ridge regression
     model_data: dict = {
@@ -127,19 +236,15 @@ def train_correction_model() -> dict:
     try:
         from sklearn.linear_model import Ridge
 
-        ridge = Ridge(alpha=1.0)
+        ridge = Ridge(alpha=1.0, solver="cholesky")
         ridge.fit(X, y)
 
-        # LOO predictions for training metrics
-        predictions = []
-        for i in range(len(X)):
-            X_train = np.delete(X, i, axis=0)
-            y_train = np.delete(y, i, axis=0)
-            r = Ridge(alpha=1.0)
-            r.fit(X_train, y_train)
-            predictions.append(float(r.predict(X[i:i+1])[0]))
-
-        residuals = y - np.array(predictions)
+        # LOO residuals in closed form (PRESS): e_i / (1 - H_ii). The intercept
+        # is unpenalised, so H = 1/n + Xc (Xc'Xc + alpha*I)^-1 Xc' on centred X.
+        Xc = X - X.mean(axis=0)
+        A = np.linalg.inv(Xc.T @ Xc + ridge.alpha * np.eye(X.shape[1]))
+        h_diag = 1.0 / len(X) + np.einsum("ij,jk,ik->i", Xc, A, Xc)
+        residuals = (y - ridge.predict(X)) / np.maximum(1.0 - h_diag, 1e-12)
 
         model_data.update({
             "method": "ridge",
@@ -159,7 +264,7 @@ def train_correction_model() -> dict:
         # Per-archetype mean correction
         arch_corrections = {}
         for i, info in enumerate(game_info_list):
-            feat = features[i]
+            feat = X[i]
             if feat[5] == 1:
                 arch = "beer_crowd"
             elif feat[6] == 1:
@@ -202,18 +307,35 @@ def train_correction_model() -> dict:
     return model_data
 
 
+@functools.lru_cache(maxsize=1)
+def _read_correction_model(mtime_ns: int) -> dict:
+    return json.loads(CORRECTION_CACHE.read_text())
+
+
+@functools.lru_cache(maxsize=4)
+def _coef_array(coefficients: tuple[float, ...]) -> np.ndarray:
+    return np.asarray(coefficients, dtype=np.float32)
+
+
 def load_correction_model() -> dict | None:
-    """Load the trained correction model from cache."""
-    if not CORRECTION_CACHE.exists():
+    """Load the trained correction model from cache.
+
+    The parsed model is memoized on the file's mtime, so repeat calls skip
+    the disk read until the model is retrained; callers get a copy.
+    """
+    try:
+        mtime_ns = CORRECTION_CACHE.stat().st_mtime_ns
+    except FileNotFoundError:
         return None
-    return json.loads(CORRECTION_CACHE.read_text())
+    return copy.deepcopy(_read_correction_model(mtime_ns))
 
 
-def get_correction_factor(game_features: pd.Series, model: dict | None = None) -> float:
+def get_correction_factor(game_features: pd.Series | dict, model: dict | None = None) -> float:
     """Compute correction factor for a game.
 
     Args:
-        game_features: Series with game metadata (attendance, is_weekend, etc.)
+        game_features: Series or dict with game metadata (attendance, is_weekend, etc.).
+            A dict is cheaper on per-request paths: no Series construction or .get dispatch.
         model: Pre-loaded model dict, or None to load from cache.
 
     Returns:
@@ -231,9 +353,8 @@ def get_correction_factor(game_features: pd.Series, model: dict | None = None) -
             stats["att_mean"], stats["att_std"],
             stats["temp_mean"], stats["temp_std"],
         )
-        intercept = model["intercept"]
-        coefs = model["coefficients"]
-        raw = intercept + sum(c * f for c, f in zip(coefs, fv))
+        coefs = _coef_array(tuple(model["coefficients"]))
+        raw = model["intercept"] + float(np.dot(coefs, fv))
     elif model.get("method") == "archetype_mean":
         arch = game_features.get("archetype", "mixed")
         arch_corr = model.get("archetype_corrections", {})
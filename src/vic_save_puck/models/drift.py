@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import sys
+from collections import defaultdict
 from dataclasses import dataclass, field
+from itertools import compress
+from operator import attrgetter
+from typing import Iterable
 import pandas as pd
 import numpy as np
 
@@ -13,7 +18,50 @@ from vic_save_puck.config import (
 from vic_save_puck.simulator.engine import GameEvent
 
 
-@dataclass
+# Severities that make a report significant
+_WARN_CRIT = frozenset({"warning", "critical"})
+
+# Sort key for signals, strongest first (used with reverse=True)
+_BY_ABS_MAGNITUDE = attrgetter("abs_magnitude")
+
+
+def _severity(magnitude: float) -> str:
+    abs_mag = abs(magnitude)
+    if abs_mag >= 0.40:
+        return "critical"
+    elif abs_mag >= 0.25:
+        return "warning"
+    else:
+        return "info"
+
+
+# Module-level factories (not lambdas) so detectors stay picklable
+def _counts() -> defaultdict[str, int]:
+    return defaultdict(int)
+
+
+def _nested_counts() -> defaultdict[str, defaultdict[str, int]]:
+    return defaultdict(_counts)
+
+
+def _drift_ratios(
+    actual: dict[str, int], forecast: dict[str, int],
+) -> tuple[list[str], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized (actual - fc) / fc over every key seen in a window.
+
+    Returns the keys with their actual counts, forecast counts and drift
+    ratios as position-aligned arrays; drift is NaN where fc is 0.
+    """
+    keys = list(actual)
+    n = len(keys)
+    act = np.fromiter(actual.values(), dtype=np.int64, count=n)
+    fc = np.fromiter((forecast.get(k, 0) for k in keys), dtype=np.int64, count=n)
+    drift = np.divide(act - fc, fc, out=np.full(n, np.nan), where=fc > 0)
+    return keys, act, fc, drift
+
+
+@dataclass(slots=True, frozen=True)
 class DriftSignal:
     """A detected drift signal."""
     drift_type: str          # "volume", "mix", "timing"
@@ -22,23 +70,20 @@ class DriftSignal:
     direction: str           # "above" or "below"
     time_window: int
     detail: str              # human-readable detail
+    # Derived from magnitude once at construction; read by sorting, summaries and __str__
+    severity: str = field(init=False, repr=False, compare=False)
+    abs_magnitude: float = field(init=False, repr=False, compare=False)
 
-    @property
-    def severity(self) -> str:
-        abs_mag = abs(self.magnitude)
-        if abs_mag >= 0.40:
-            return "critical"
-        elif abs_mag >= 0.25:
-            return "warning"
-        else:
-            return "info"
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "severity", _severity(self.magnitude))
+        object.__setattr__(self, "abs_magnitude", abs(self.magnitude))
 
     def __str__(self) -> str:
         pct = f"{self.magnitude:+.0%}"
         return f"[{self.severity.upper():8}] T+{self.time_window:>3}min {self.drift_type:7} | {self.scope:20} | {pct:>6} | {self.detail}"
 
 
-@dataclass
+@dataclass(slots=True)
 class DriftReport:
     """Collection of drift signals for a time window."""
     time_window: int
@@ -50,7 +95,7 @@ class DriftReport:
 
     @property
     def has_significant_drift(self) -> bool:
-        return any(s.severity in ("warning", "critical") for s in self.signals)
+        return any(s.severity in _WARN_CRIT for s in self.signals)
 
     def __str__(self) -> str:
         if not self.signals:
@@ -61,6 +106,34 @@ class DriftReport:
         return "\n".join(lines)
 
 
+def _rows(df: pd.DataFrame, *cols: str):
+    """Zip columns as plain Python scalars, without boxing each row as a Series."""
+    return zip(*(df[c].tolist() for c in cols))
+
+
+def _best_alternate_stand(
+    item: str,
+    stand: str,
+    fc_by_stand: dict[str, int],
+    actual_by_stand_item: dict[str, dict[str, int]],
+) -> tuple[str, int] | None:
+    """
+    Underloaded stand (drift < 15%) with the most spare forecast capacity for
+    an item, as (stand, capacity). Single pass over the stands forecast to sell
+    the item; ties go to the first stand in forecast order.
+    """
+    best = None
+    for s2, fc2 in fc_by_stand.items():
+        if s2 == stand or fc2 <= 0:
+            continue
+        actual2 = actual_by_stand_item.get(s2, {}).get(item, 0)
+        if (actual2 - fc2) / fc2 < 0.15:
+            capacity = fc2 - actual2
+            if best is None or capacity > best[1]:
+                best = (s2, capacity)
+    return best
+
+
 class DriftDetector:
     """
     Maintains rolling comparison of actual vs forecast.
@@ -72,36 +145,48 @@ class DriftDetector:
         self.item_forecast = forecast["item_forecast"]
         self.stand_item_forecast = forecast.get("stand_item_forecast")
 
-        # Accumulate actuals per window
-        self._actual_by_stand_window: dict[tuple[str, int], int] = {}
-        self._actual_by_item_window: dict[tuple[str, int], int] = {}
-        self._actual_by_category_window: dict[tuple[str, int], int] = {}
-        self._actual_by_stand_item_window: dict[tuple[str, str, int], int] = {}
-        self._actual_by_window: dict[int, int] = {}
-        self._event_count_by_window: dict[int, int] = {}
-
-        # Build forecast lookup dicts
-        self._fc_stand = {}
-        for _, row in self.stand_forecast.iterrows():
-            key = (row["stand"], int(row["time_window"]))
-            self._fc_stand[key] = int(row["expected_qty"])
-
-        self._fc_item = {}
-        for _, row in self.item_forecast.iterrows():
-            key = (row["item"], int(row["time_window"]))
-            self._fc_item[key] = int(row["expected_qty"])
-
-        # Stand × item forecast lookup
-        self._fc_stand_item: dict[tuple[str, str, int], int] = {}
+        # Accumulate actuals keyed by time window first, so a window's stands,
+        # items and categories are read directly (in arrival order) instead of
+        # scanning every window's keys
+        self._actual_by_window_stand: dict[int, dict[str, int]] = defaultdict(_counts)
+        self._actual_by_window_item: dict[int, dict[str, int]] = defaultdict(_counts)
+        self._actual_by_window_category: dict[int, dict[str, int]] = defaultdict(_counts)
+        self._actual_by_window_stand_item: dict[int, dict[str, dict[str, int]]] = defaultdict(_nested_counts)
+        self._actual_by_window: dict[int, int] = defaultdict(int)
+        self._event_count_by_window: dict[int, int] = defaultdict(int)
+
+        # Build forecast lookup dicts, also window-first. Names are interned
+        # like GameEvent's, so lookups with event keys compare by identity.
+        self._fc_stand_by_window: dict[int, dict[str, int]] = {}
+        for stand, tw, qty in _rows(self.stand_forecast, "stand", "time_window", "expected_qty"):
+            self._fc_stand_by_window.setdefault(tw, {})[sys.intern(stand)] = qty
+
+        self._fc_item_by_window: dict[int, dict[str, int]] = {}
+        for item, tw, qty in _rows(self.item_forecast, "item", "time_window", "expected_qty"):
+            self._fc_item_by_window.setdefault(tw, {})[sys.intern(item)] = qty
+
+        # Stand × item forecast lookup: window -> item -> stand -> qty
+        self._fc_item_stand_by_window: dict[int, dict[str, dict[str, int]]] = {}
         if self.stand_item_forecast is not None:
-            for _, row in self.stand_item_forecast.iterrows():
-                key = (row["stand"], row["item"], int(row["time_window"]))
-                self._fc_stand_item[key] = int(row["expected_qty"])
+            for stand, item, tw, qty in _rows(
+                self.stand_item_forecast, "stand", "item", "time_window", "expected_qty",
+            ):
+                fc = self._fc_item_stand_by_window.setdefault(tw, {})
+                fc.setdefault(sys.intern(item), {})[sys.intern(stand)] = qty
+
+        self._fc_total_by_window: dict[int, int] = {
+            tw: sum(fc.values()) for tw, fc in self._fc_stand_by_window.items()
+        }
 
         # Running totals for cumulative drift
         self._cumulative_actual = 0
         self._cumulative_forecast = 0
         self._drift_history: list[DriftReport] = []
+        self._report_by_window: dict[int, DriftReport] = {}
+        # Running signal counts for summary(), updated by check_drift()
+        self._signal_count = 0
+        self._severity_counts: dict[str, int] = defaultdict(int)
+        self._windows_with_drift = 0
 
     def ingest_event(self, event: GameEvent) -> None:
         """Record an incoming event."""
@@ -111,29 +196,59 @@ class DriftDetector:
         cat = event.category
         qty = event.qty
 
-        key_sw = (stand, tw)
-        key_iw = (item, tw)
-        key_cw = (cat, tw)
-
-        self._actual_by_stand_window[key_sw] = self._actual_by_stand_window.get(key_sw, 0) + qty
-        self._actual_by_item_window[key_iw] = self._actual_by_item_window.get(key_iw, 0) + qty
-        self._actual_by_category_window[key_cw] = self._actual_by_category_window.get(key_cw, 0) + qty
-        key_siw = (stand, item, tw)
-        self._actual_by_stand_item_window[key_siw] = self._actual_by_stand_item_window.get(key_siw, 0) + qty
-        self._actual_by_window[tw] = self._actual_by_window.get(tw, 0) + qty
-        self._event_count_by_window[tw] = self._event_count_by_window.get(tw, 0) + 1
+        self._actual_by_window_stand[tw][stand] += qty
+        self._actual_by_window_item[tw][item] += qty
+        self._actual_by_window_category[tw][cat] += qty
+        self._actual_by_window_stand_item[tw][stand][item] += qty
+        self._actual_by_window[tw] += qty
+        self._event_count_by_window[tw] += 1
         self._cumulative_actual += qty
 
+    def ingest_batch(self, events: Iterable[GameEvent]) -> None:
+        """
+        Record a run of events, e.g. one window's worth from iter_windows().
+
+        Same result as ingest_event() for each event in order, but a window's
+        counters are looked up once per run of same-window events instead of
+        once per event, which is most of ingest_event()'s cost.
+        """
+        tw = None
+        for event in events:
+            if event.time_window != tw:
+                tw = event.time_window
+                by_stand = self._actual_by_window_stand[tw]
+                by_item = self._actual_by_window_item[tw]
+                by_cat = self._actual_by_window_category[tw]
+                by_stand_item = self._actual_by_window_stand_item[tw]
+            stand, item, qty = event.stand, event.item, event.qty
+            by_stand[stand] += qty
+            by_item[item] += qty
+            by_cat[event.category] += qty
+            by_stand_item[stand][item] += qty
+            self._actual_by_window[tw] += qty
+            self._event_count_by_window[tw] += 1
+            self._cumulative_actual += qty
+
+    def forecast_total(self, time_window: int) -> int:
+        """Total forecast units across all stands for a window."""
+        return self._fc_total_by_window.get(time_window, 0)
+
+    def forecast_totals(self) -> dict[int, int]:
+        """Total forecast units across all stands, for every forecast window."""
+        return dict(self._fc_total_by_window)
+
+    def actual_total(self, time_window: int) -> int:
+        """Total units ingested so far across all stands for a window."""
+        return self._actual_by_window.get(time_window, 0)
+
     def check_drift(self, time_window: int) -> DriftReport:
         """Analyze drift for a completed time window."""
         report = DriftReport(time_window=time_window)
         signals = []
 
         # ── Overall volume drift ─────────────────────────────────────────
-        actual_total = self._actual_by_window.get(time_window, 0)
-        fc_total = sum(
-            v for (s, tw), v in self._fc_stand.items() if tw == time_window
-        )
+        actual_total = self.actual_total(time_window)
+        fc_total = self.forecast_total(time_window)
 
         if fc_total > 0 and self._event_count_by_window.get(time_window, 0) >= DRIFT_MIN_SAMPLES:
             vol_drift = (actual_total - fc_total) / fc_total
@@ -151,31 +266,32 @@ class DriftDetector:
                 ))
 
         # ── Per-stand drift ──────────────────────────────────────────────
-        stands_this_window = {
-            s for (s, tw) in self._actual_by_stand_window if tw == time_window
-        }
-        for stand in stands_this_window:
-            actual = self._actual_by_stand_window.get((stand, time_window), 0)
-            fc = self._fc_stand.get((stand, time_window), 0)
+        stands, actuals, fcs, drifts = _drift_ratios(
+            self._actual_by_window_stand.get(time_window, {}),
+            self._fc_stand_by_window.get(time_window, {}),
+        )
+        has_fc = fcs > 0
+        # Unexpected stand activity is recorded as infinite drift
+        unexpected = ~has_fc & (actuals > DRIFT_MIN_SAMPLES)
+        drifts[unexpected] = np.inf
+        recorded = has_fc | unexpected
+        report.stand_drifts = dict(zip(compress(stands, recorded), drifts[recorded].tolist()))
+
+        # Only stands past the threshold (or unexpected) become signals
+        for i in np.flatnonzero(np.abs(drifts) >= DRIFT_VOLUME_THRESHOLD).tolist():
+            stand, actual, fc, drift = stands[i], int(actuals[i]), int(fcs[i]), float(drifts[i])
+            short = STAND_SHORT.get(stand, stand)
             if fc > 0:
-                drift = (actual - fc) / fc
-                short = STAND_SHORT.get(stand, stand)
-                report.stand_drifts[stand] = drift
-
-                if abs(drift) >= DRIFT_VOLUME_THRESHOLD:
-                    direction = "above" if drift > 0 else "below"
-                    signals.append(DriftSignal(
-                        drift_type="volume",
-                        scope=short,
-                        magnitude=drift,
-                        direction=direction,
-                        time_window=time_window,
-                        detail=f"{short}: {actual} actual vs {fc} forecast ({drift:+.0%})",
-                    ))
-            elif actual > DRIFT_MIN_SAMPLES:
-                # Unexpected stand activity
-                report.stand_drifts[stand] = float("inf")
-                short = STAND_SHORT.get(stand, stand)
+                direction = "above" if drift > 0 else "below"
+                signals.append(DriftSignal(
+                    drift_type="volume",
+                    scope=short,
+                    magnitude=drift,
+                    direction=direction,
+                    time_window=time_window,
+                    detail=f"{short}: {actual} actual vs {fc} forecast ({drift:+.0%})",
+                ))
+            else:
                 signals.append(DriftSignal(
                     drift_type="volume",
                     scope=short,
@@ -186,55 +302,59 @@ class DriftDetector:
                 ))
 
         # ── Per-item drift (top movers only) ─────────────────────────────
-        items_this_window = {
-            i for (i, tw) in self._actual_by_item_window if tw == time_window
-        }
-        for item in items_this_window:
-            actual = self._actual_by_item_window.get((item, time_window), 0)
-            fc = self._fc_item.get((item, time_window), 0)
-            if fc > 0:
-                drift = (actual - fc) / fc
-                report.item_drifts[item] = drift
-
-                if abs(drift) >= 0.30:  # higher threshold for items (more noisy)
-                    direction = "above" if drift > 0 else "below"
-                    signals.append(DriftSignal(
-                        drift_type="mix",
-                        scope=item,
-                        magnitude=drift,
-                        direction=direction,
-                        time_window=time_window,
-                        detail=f"{item}: {actual} actual vs {fc} forecast ({drift:+.0%})",
-                    ))
-
-        # ── Category mix drift ───────────────────────────────────────────
-        cats_this_window = {
-            c for (c, tw) in self._actual_by_category_window if tw == time_window
-        }
-        total_actual_cat = sum(
-            self._actual_by_category_window.get((c, time_window), 0)
-            for c in cats_this_window
+        items, actuals, fcs, drifts = _drift_ratios(
+            self._actual_by_window_item.get(time_window, {}),
+            self._fc_item_by_window.get(time_window, {}),
         )
-        if total_actual_cat > DRIFT_MIN_SAMPLES:
-            for cat in cats_this_window:
-                actual_cat = self._actual_by_category_window.get((cat, time_window), 0)
-                actual_share = actual_cat / total_actual_cat
+        has_fc = fcs > 0
+        report.item_drifts = dict(zip(compress(items, has_fc), drifts[has_fc].tolist()))
+
+        # Higher threshold for items (more noisy)
+        for i in np.flatnonzero(np.abs(drifts) >= 0.30).tolist():
+            item, actual, fc, drift = items[i], int(actuals[i]), int(fcs[i]), float(drifts[i])
+            direction = "above" if drift > 0 else "below"
+            signals.append(DriftSignal(
+                drift_type="mix",
+                scope=item,
+                magnitude=drift,
+                direction=direction,
+                time_window=time_window,
+                detail=f"{item}: {actual} actual vs {fc} forecast ({drift:+.0%})",
+            ))
 
-                # Compute forecast share from item forecasts by category
-                # Simplified: just track the shift
-                report.category_mix_drift[cat] = actual_share
+        # ── Category mix drift ───────────────────────────────────────────
+        # Every event lands in exactly one category, so the categories sum to
+        # the window's actual total computed above
+        if actual_total > DRIFT_MIN_SAMPLES:
+            # Compute forecast share from item forecasts by category
+            # Simplified: just track the shift
+            report.category_mix_drift = {
+                cat: actual_cat / actual_total
+                for cat, actual_cat in self._actual_by_window_category[time_window].items()
+            }
 
         # ── Cumulative drift tracking ────────────────────────────────────
         self._cumulative_forecast += fc_total
 
-        report.signals = sorted(signals, key=lambda s: -abs(s.magnitude))
+        report.signals = sorted(signals, key=_BY_ABS_MAGNITUDE, reverse=True)
         self._drift_history.append(report)
+        self._report_by_window[time_window] = report
+
+        self._signal_count += len(signals)
+        for s in signals:
+            self._severity_counts[s.severity] += 1
+        if report.has_significant_drift:
+            self._windows_with_drift += 1
         return report
 
     @property
     def history(self) -> list[DriftReport]:
         return self._drift_history
 
+    def report_for(self, time_window: int) -> DriftReport | None:
+        """Latest report for a window, or None if it hasn't been checked."""
+        return self._report_by_window.get(time_window)
+
     def cumulative_drift(self) -> float:
         """Overall cumulative drift so far."""
         if self._cumulative_forecast == 0:
@@ -248,44 +368,30 @@ class DriftDetector:
         Returns list of {stand, item, actual, forecast, drift, overloaded, suggestion}
         """
         results = []
-        stands_this_window = {
-            s for (s, tw) in self._actual_by_stand_window if tw == time_window
-        }
+        fc_stands = self._fc_stand_by_window.get(time_window, {})
+        fc_item_stands = self._fc_item_stand_by_window.get(time_window, {})
+        actual_stand_items = self._actual_by_window_stand_item.get(time_window, {})
 
-        for stand in stands_this_window:
-            actual_total = self._actual_by_stand_window.get((stand, time_window), 0)
-            fc_total = self._fc_stand.get((stand, time_window), 0)
+        for stand, actual_total in self._actual_by_window_stand.get(time_window, {}).items():
+            fc_total = fc_stands.get(stand, 0)
             stand_drift = (actual_total - fc_total) / fc_total if fc_total > 0 else 0
 
             # Find top items at this stand
-            items_at_stand = {
-                i for (s, i, tw) in self._actual_by_stand_item_window
-                if s == stand and tw == time_window
-            }
-            for item in items_at_stand:
-                actual = self._actual_by_stand_item_window.get((stand, item, time_window), 0)
-                fc = self._fc_stand_item.get((stand, item, time_window), 0)
+            for item, actual in actual_stand_items.get(stand, {}).items():
+                fc = fc_item_stands.get(item, {}).get(stand, 0)
                 item_drift = (actual - fc) / fc if fc > 0 else 0
 
                 # Find alternative stands that sell this item and are underloaded
                 suggestion = None
                 if item_drift > 0.30 and actual >= 5:
-                    alt_stands = []
-                    for (s2, i2, tw2), fc2 in self._fc_stand_item.items():
-                        if i2 == item and tw2 == time_window and s2 != stand and fc2 > 0:
-                            actual2 = self._actual_by_stand_item_window.get((s2, item, time_window), 0)
-                            drift2 = (actual2 - fc2) / fc2 if fc2 > 0 else 0
-                            if drift2 < 0.15:  # underloaded
-                                alt_stands.append({
-                                    "stand": s2,
-                                    "capacity": fc2 - actual2,
-                                    "drift": drift2,
-                                })
-                    if alt_stands:
-                        best = max(alt_stands, key=lambda x: x["capacity"])
-                        short_alt = STAND_SHORT.get(best["stand"], best["stand"])
+                    best = _best_alternate_stand(
+                        item, stand, fc_item_stands.get(item, {}), actual_stand_items,
+                    )
+                    if best is not None:
+                        alt_stand, capacity = best
+                        short_alt = STAND_SHORT.get(alt_stand, alt_stand)
                         short_src = STAND_SHORT.get(stand, stand)
-                        suggestion = f"Redirect {item} demand from {short_src} to {short_alt} (has {best['capacity']} units capacity)"
+                        suggestion = f"Redirect {item} demand from {short_src} to {short_alt} (has {capacity} units capacity)"
 
                 results.append({
                     "stand": stand,
@@ -303,13 +409,12 @@ class DriftDetector:
 
     def summary(self) -> dict:
         """Summary stats across all windows."""
-        all_signals = [s for r in self._drift_history for s in r.signals]
         return {
             "total_windows": len(self._drift_history),
-            "windows_with_drift": sum(1 for r in self._drift_history if r.has_significant_drift),
-            "total_signals": len(all_signals),
-            "critical_signals": sum(1 for s in all_signals if s.severity == "critical"),
-            "warning_signals": sum(1 for s in all_signals if s.severity == "warning"),
+            "windows_with_drift": self._windows_with_drift,
+            "total_signals": self._signal_count,
+            "critical_signals": self._severity_counts["critical"],
+            "warning_signals": self._severity_counts["warning"],
             "cumulative_drift": f"{self.cumulative_drift():+.1%}",
             "total_actual": self._cumulative_actual,
             "total_forecast": self._cumulative_forecast,
@@ -35,6 +35,39 @@ def derive_archetype(
     return "mixed"
 
 
+def _adjusted_qty(df: pd.DataFrame, beer_factor: float, dog_promo: bool, is_playoff: bool) -> np.ndarray:
+    """Apply the temperature, hot-dog promo and playoff factors to expected_qty in one pass.
+
+    The beer, hot-drink and hot-dog item sets are disjoint, so each row takes
+    at most one of those factors before the across-the-board playoff uplift.
+    """
+    items = df["Item"]
+    factors = np.ones(len(df))
+    factors[items.isin(["Draught Beer", "Cans of Beer"]).to_numpy()] = beer_factor
+    # Non-alcoholic beverages get inverse adjustment (cold = more hot drinks)
+    factors[items.isin(["Hot Drinks", "Coffee & Baileys"]).to_numpy()] = 1.0 / beer_factor
+    if dog_promo:
+        factors[items.isin(["Hot Dog", "Dogs"]).to_numpy()] = 2.5
+    qty = df["expected_qty"].to_numpy() * factors
+    if is_playoff:
+        qty *= 1.15  # 15% uplift across the board
+    return np.round(qty).astype(int)
+
+
+def _archetype_curves(curves: pd.DataFrame, archetype: str) -> pd.DataFrame:
+    """Curve rows for an archetype (falling back to "mixed") within -90..+120.
+
+    The time-window cut is applied here, before any per-row shaping, so the
+    scaling and prep-target steps only touch rows that make the forecast.
+    """
+    in_arch = curves["archetype"] == archetype
+    if not in_arch.any():
+        in_arch = curves["archetype"] == "mixed"
+    tw = curves["time_window"]
+    # Own copy: callers add columns to it (pandas 2.x has no copy-on-write by default)
+    return curves[in_arch & (tw >= -90) & (tw <= 120)].copy()
+
+
 def generate_forecast(
     attendance: int,
     puck_drop_hour: int = 19,
@@ -73,17 +106,14 @@ def generate_forecast(
     scale = attendance / ref_attendance if ref_attendance > 0 else 1.0
 
     # ── Build stand × time_window forecast from avg historical curves ────
-    sc = stand_curves[stand_curves["archetype"] == archetype].copy()
-    if sc.empty:
-        sc = stand_curves[stand_curves["archetype"] == "mixed"].copy()
+    # (time windows limited to -90..+120, matching actual data range)
+    sc = _archetype_curves(stand_curves, archetype)
 
     # avg_qty is already per-game average; scale by attendance ratio
     sc["expected_qty"] = (sc["avg_qty"] * scale).round(1)
 
     # ── Build item × time_window forecast ────────────────────────────────
-    ic = item_curves[item_curves["archetype"] == archetype].copy()
-    if ic.empty:
-        ic = item_curves[item_curves["archetype"] == "mixed"].copy()
+    ic = _archetype_curves(item_curves, archetype)
 
     ic["expected_qty"] = (ic["avg_qty"] * scale).round(1)
 
@@ -93,29 +123,12 @@ def generate_forecast(
     beer_factor = 1.0 + (temp_delta * 0.03)
     beer_factor = max(0.7, min(1.5, beer_factor))
 
-    # Apply to beer items in item curves
-    from vic_save_puck.config import CATEGORY_MAP
-    # Get the merged data to know which items are beer
-    beer_items = ic["Item"].isin(["Draught Beer", "Cans of Beer"])
-    ic.loc[beer_items, "expected_qty"] *= beer_factor
-
-    # Non-alcoholic beverages get inverse adjustment (cold = more hot drinks)
-    hot_items = ic["Item"].isin(["Hot Drinks", "Coffee & Baileys"])
-    ic.loc[hot_items, "expected_qty"] *= (1.0 / beer_factor)
-
     # ── Promo overrides ──────────────────────────────────────────────────
-    if is_promo and promo_type:
-        promo_lower = promo_type.lower()
-        if "dog" in promo_lower:
-            dog_items = ic["Item"].isin(["Hot Dog", "Dogs"])
-            ic.loc[dog_items, "expected_qty"] *= 2.5
-
-    # ── Playoff boost ────────────────────────────────────────────────────
-    if is_playoff:
-        ic["expected_qty"] *= 1.15  # 15% uplift across the board
+    dog_promo = bool(is_promo and promo_type and "dog" in promo_type.lower())
 
-    # Round
-    ic["expected_qty"] = ic["expected_qty"].round(0).astype(int)
+    # Beer/hot-drink temperature factors, promo override and playoff boost,
+    # applied as one multiplier per item row, then rounded
+    ic["expected_qty"] = _adjusted_qty(ic, beer_factor, dog_promo, is_playoff)
     sc["expected_qty"] = sc["expected_qty"].round(0).astype(int)
 
     # ── Apply asymmetric prep targets (underpredict to minimize waste) ───
@@ -129,32 +142,15 @@ def generate_forecast(
 
     ic = _apply_prep_target(ic, "Item")
 
-    # Filter to reasonable time windows (-90 to +120, matching actual data range)
-    sc = sc[(sc["time_window"] >= -90) & (sc["time_window"] <= 120)]
-    ic = ic[(ic["time_window"] >= -90) & (ic["time_window"] <= 120)]
-
     # ── Build stand × item × time_window forecast (granular) ────────────
     si_forecast = None
     if stand_item_curves is not None:
-        si = stand_item_curves[stand_item_curves["archetype"] == archetype].copy()
-        if si.empty:
-            si = stand_item_curves[stand_item_curves["archetype"] == "mixed"].copy()
+        si = _archetype_curves(stand_item_curves, archetype)
         si["expected_qty"] = (si["avg_qty"] * scale).round(1)
 
         # Apply same adjustments
-        beer_si = si["Item"].isin(["Draught Beer", "Cans of Beer"])
-        si.loc[beer_si, "expected_qty"] *= beer_factor
-        hot_si = si["Item"].isin(["Hot Drinks", "Coffee & Baileys"])
-        si.loc[hot_si, "expected_qty"] *= (1.0 / beer_factor)
-        if is_promo and promo_type and "dog" in promo_type.lower():
-            dog_si = si["Item"].isin(["Hot Dog", "Dogs"])
-            si.loc[dog_si, "expected_qty"] *= 2.5
-        if is_playoff:
-            si["expected_qty"] *= 1.15
-
-        si["expected_qty"] = si["expected_qty"].round(0).astype(int)
+        si["expected_qty"] = _adjusted_qty(si, beer_factor, dog_promo, is_playoff)
         si = _apply_prep_target(si, "Item")
-        si = si[(si["time_window"] >= -90) & (si["time_window"] <= 120)]
         si_forecast = si[["stand", "Item", "time_window", "expected_qty", "prep_qty", "perishability"]].rename(
             columns={"Item": "item"}
         ).reset_index(drop=True)
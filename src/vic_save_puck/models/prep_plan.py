@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 from dataclasses import dataclass
 
 from vic_save_puck.config import ITEM_PERISHABILITY, STAND_SHORT
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PrepAction:
     """A single prep action for a stand."""
     time_window: int        # minutes from puck drop
@@ -47,10 +48,30 @@ def generate_prep_plan(forecast: dict) -> list[PrepAction]:
     # Use prep_qty (conservative target) instead of expected_qty (full demand)
     qty_col = "prep_qty" if "prep_qty" in item_forecast.columns else "expected_qty"
 
-    # Group item forecast by item
-    for item, group in item_forecast.groupby("item"):
+    # Per-item totals as bincount reductions over item codes (sorted, like groupby)
+    codes, item_names = pd.factorize(item_forecast["item"], sort=True)
+    valid = codes >= 0
+    codes = codes[valid]
+    tws = item_forecast["time_window"].to_numpy(dtype=np.int64)[valid]
+    qtys = item_forecast[qty_col].to_numpy(dtype=np.int64)[valid]
+    n_items = len(item_names)
+
+    def per_item(mask: np.ndarray | None = None) -> np.ndarray:
+        weights = qtys if mask is None else np.where(mask, qtys, 0)
+        return np.bincount(codes, weights=weights, minlength=n_items).astype(np.int64)
+
+    totals = per_item()
+    pre_game = per_item(tws < 20)
+    mid_game = per_item((tws >= 20) & (tws < 58))
+    late_game = per_item(tws >= 58)
+
+    # Row positions of each item, in original order, as slices of one stable sort
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(n_items + 1))
+
+    for k, item in enumerate(item_names.tolist()):
         tier = ITEM_PERISHABILITY.get(item, "medium_hold")
-        total_qty = group[qty_col].sum()
+        total_qty = int(totals[k])
         if total_qty <= 0:
             continue
 
@@ -61,53 +82,50 @@ def generate_prep_plan(forecast: dict) -> list[PrepAction]:
                 stand="ALL",
                 action="pre_stage",
                 item=item,
-                quantity=int(total_qty),
+                quantity=total_qty,
                 tier=tier,
             ))
 
         elif tier == "medium_hold":
             # Batch before game, refresh at intermissions
-            pre_game = group[group["time_window"] < 20][qty_col].sum()
-            mid_game = group[
-                (group["time_window"] >= 20) & (group["time_window"] < 58)
-            ][qty_col].sum()
-            late_game = group[group["time_window"] >= 58][qty_col].sum()
-
-            if pre_game > 0:
+            if pre_game[k] > 0:
                 actions.append(PrepAction(
                     time_window=-10,
                     stand="ALL",
                     action="batch",
                     item=item,
-                    quantity=int(pre_game),
+                    quantity=int(pre_game[k]),
                     tier=tier,
                 ))
-            if mid_game > 0:
+            if mid_game[k] > 0:
                 actions.append(PrepAction(
                     time_window=20,
                     stand="ALL",
                     action="refresh_batch",
                     item=item,
-                    quantity=int(mid_game),
+                    quantity=int(mid_game[k]),
                     tier=tier,
                 ))
-            if late_game > 0:
+            if late_game[k] > 0:
                 actions.append(PrepAction(
                     time_window=58,
                     stand="ALL",
                     action="refresh_batch",
                     item=item,
-                    quantity=int(late_game),
+                    quantity=int(late_game[k]),
                     tier=tier,
                 ))
 
         elif tier == "short_life":
+            rows = order[bounds[k]:bounds[k + 1]]
+            item_tws = tws[rows]
+            item_qtys = qtys[rows]
+
             # Continuous cook per time window
-            for _, row in group.iterrows():
-                qty = int(row[qty_col])
+            for tw, qty in zip(item_tws.tolist(), item_qtys.tolist()):
                 if qty > 0:
                     actions.append(PrepAction(
-                        time_window=int(row["time_window"]),
+                        time_window=tw,
                         stand="ALL",
                         action="continuous_cook",
                         item=item,
@@ -115,20 +133,17 @@ def generate_prep_plan(forecast: dict) -> list[PrepAction]:
                         tier=tier,
                     ))
 
-            # Add stop-prep signal when demand drops
-            windows = group.sort_values("time_window")
-            peak_qty = windows[qty_col].max()
-            for _, row in windows.iterrows():
-                if row[qty_col] < peak_qty * 0.1 and row["time_window"] > 60:
-                    actions.append(PrepAction(
-                        time_window=int(row["time_window"]),
-                        stand="ALL",
-                        action="stop_prep",
-                        item=item,
-                        quantity=0,
-                        tier=tier,
-                    ))
-                    break
+            # Add stop-prep signal at the first late window where demand drops
+            dropped = (item_qtys < item_qtys.max() * 0.1) & (item_tws > 60)
+            if dropped.any():
+                actions.append(PrepAction(
+                    time_window=int(item_tws[dropped].min()),
+                    stand="ALL",
+                    action="stop_prep",
+                    item=item,
+                    quantity=0,
+                    tier=tier,
+                ))
 
     # Sort by time
     actions.sort(key=lambda a: a.time_window)
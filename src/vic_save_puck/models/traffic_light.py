@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
+from operator import attrgetter
 
 from vic_save_puck.config import STAND_SHORT
 from vic_save_puck.models.drift import DriftDetector, DriftReport
@@ -17,17 +19,23 @@ class Status(str, Enum):
 
     @property
     def emoji(self) -> str:
-        return {"green": "🟢", "yellow": "🟡", "red": "🔴"}[self.value]
+        return _STATUS_EMOJI[self]
 
     @property
     def label(self) -> str:
-        return {"green": "ON TRACK", "yellow": "WATCH", "red": "ACTION"}[self.value]
+        return _STATUS_LABEL[self]
+
+
+_STATUS_EMOJI = {Status.GREEN: "🟢", Status.YELLOW: "🟡", Status.RED: "🔴"}
+_STATUS_LABEL = {Status.GREEN: "ON TRACK", Status.YELLOW: "WATCH", Status.RED: "ACTION"}
 
 
 # Thresholds
 GREEN_THRESHOLD = 0.15    # ±15%
 YELLOW_THRESHOLD = 0.30   # ±30%
 
+_BY_ABS_DRIFT = attrgetter("abs_drift")
+
 
 @dataclass
 class StandStatus:
@@ -38,6 +46,10 @@ class StandStatus:
     forecast_qty: int
     actual_qty: int
     trend: str  # "improving", "stable", "worsening"
+    abs_drift: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.abs_drift = abs(self.drift_pct)
 
     @property
     def short_name(self) -> str:
@@ -52,7 +64,7 @@ class StandStatus:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class OverallStatus:
     """Overall game status at a point in time."""
     time_window: int
@@ -60,6 +72,9 @@ class OverallStatus:
     overall_drift: float
     stand_statuses: list[StandStatus]
     cumulative_drift: float
+    red_count: int = 0
+    yellow_count: int = 0
+    green_count: int = 0
 
     def __str__(self) -> str:
         lines = [
@@ -93,16 +108,12 @@ class TrafficLightMonitor:
     def __init__(self, detector: DriftDetector):
         self.detector = detector
         self._history: list[OverallStatus] = []
-        self._stand_drift_history: dict[str, list[float]] = {}
+        self._stand_abs_drift: dict[str, deque[float]] = {}
 
     def update(self, time_window: int) -> OverallStatus:
         """Compute current status after a drift check."""
-        # Get the latest report
-        report = None
-        for r in reversed(self.detector.history):
-            if r.time_window == time_window:
-                report = r
-                break
+        # Get the latest report for this window
+        report = self.detector.report_for(time_window)
 
         if report is None:
             return OverallStatus(
@@ -118,33 +129,40 @@ class TrafficLightMonitor:
         overall_status = classify_status(overall_drift)
         cumulative = self.detector.cumulative_drift()
 
-        # Per-stand statuses
-        stand_statuses = []
+        # Per-stand statuses, bucketed by status as they are built
+        buckets: dict[Status, list[StandStatus]] = {
+            Status.RED: [], Status.YELLOW: [], Status.GREEN: [],
+        }
+        fc_by_stand = self.detector._fc_stand_by_window.get(time_window, {})
+        actual_by_stand = self.detector._actual_by_window_stand.get(time_window, {})
         for stand, drift in report.stand_drifts.items():
-            # Track history for trend
-            if stand not in self._stand_drift_history:
-                self._stand_drift_history[stand] = []
-            self._stand_drift_history[stand].append(drift)
+            # Track the last few absolute drifts for trend
+            recent = self._stand_abs_drift.get(stand)
+            if recent is None:
+                recent = self._stand_abs_drift[stand] = deque(maxlen=3)
+            recent.append(abs(drift))
 
-            trend = self._compute_trend(self._stand_drift_history[stand])
+            trend = self._compute_trend(recent)
 
             # Get forecast and actual for this stand+window
-            fc_key = (stand, time_window)
-            fc_qty = self.detector._fc_stand.get(fc_key, 0)
-            actual_qty = self.detector._actual_by_stand_window.get(fc_key, 0)
+            fc_qty = fc_by_stand.get(stand, 0)
+            actual_qty = actual_by_stand.get(stand, 0)
 
-            stand_statuses.append(StandStatus(
+            status = classify_status(drift)
+            buckets[status].append(StandStatus(
                 stand=stand,
-                status=classify_status(drift),
+                status=status,
                 drift_pct=drift,
                 forecast_qty=fc_qty,
                 actual_qty=actual_qty,
                 trend=trend,
             ))
 
-        # Sort: red first, then yellow, then green
-        priority = {Status.RED: 0, Status.YELLOW: 1, Status.GREEN: 2}
-        stand_statuses.sort(key=lambda s: (priority[s.status], -abs(s.drift_pct)))
+        # Red first, then yellow, then green; largest drift first in each
+        stand_statuses = []
+        for bucket in buckets.values():
+            bucket.sort(key=_BY_ABS_DRIFT, reverse=True)
+            stand_statuses.extend(bucket)
 
         status = OverallStatus(
             time_window=time_window,
@@ -152,23 +170,23 @@ class TrafficLightMonitor:
             overall_drift=overall_drift,
             stand_statuses=stand_statuses,
             cumulative_drift=cumulative,
+            red_count=len(buckets[Status.RED]),
+            yellow_count=len(buckets[Status.YELLOW]),
+            green_count=len(buckets[Status.GREEN]),
         )
         self._history.append(status)
         return status
 
-    def _compute_trend(self, history: list[float]) -> str:
+    def _compute_trend(self, recent_abs: deque[float]) -> str:
         """Determine if drift is improving, stable, or worsening."""
-        if len(history) < 2:
+        if len(recent_abs) < 2:
             return "stable"
 
-        recent = history[-3:] if len(history) >= 3 else history
         # Compare absolute drift: is it getting closer to 0 or further?
-        if len(recent) >= 2:
-            recent_abs = [abs(d) for d in recent]
-            if recent_abs[-1] < recent_abs[0] - 0.05:
-                return "improving"
-            elif recent_abs[-1] > recent_abs[0] + 0.05:
-                return "worsening"
+        if recent_abs[-1] < recent_abs[0] - 0.05:
+            return "improving"
+        elif recent_abs[-1] > recent_abs[0] + 0.05:
+            return "worsening"
         return "stable"
 
     @property
@@ -177,9 +195,9 @@ class TrafficLightMonitor:
         if not self._history:
             return Status.GREEN
         latest = self._history[-1]
-        if any(s.status == Status.RED for s in latest.stand_statuses):
+        if latest.red_count:
             return Status.RED
-        if any(s.status == Status.YELLOW for s in latest.stand_statuses):
+        if latest.yellow_count:
             return Status.YELLOW
         return Status.GREEN
 
@@ -188,15 +206,12 @@ class TrafficLightMonitor:
         if not self._history:
             return "No data yet"
         latest = self._history[-1]
-        red = sum(1 for s in latest.stand_statuses if s.status == Status.RED)
-        yellow = sum(1 for s in latest.stand_statuses if s.status == Status.YELLOW)
-        green = sum(1 for s in latest.stand_statuses if s.status == Status.GREEN)
         # Only show cumulative drift once enough data has accumulated
         cum_str = ""
         if self.detector._cumulative_forecast > 500:
             cum_str = f" (cum: {latest.cumulative_drift:+.0%})"
         return (
             f"{latest.overall_status.emoji} T{latest.time_window:+}min | "
-            f"🔴{red} 🟡{yellow} 🟢{green} | "
+            f"🔴{latest.red_count} 🟡{latest.yellow_count} 🟢{latest.green_count} | "
             f"Drift: {latest.overall_drift:+.0%}{cum_str}"
         )
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import sys
 import time
-from dataclasses import dataclass, field
-from typing import Callable
+from collections import defaultdict
+from dataclasses import dataclass, field, fields
+from itertools import compress, groupby
+from operator import attrgetter
+from typing import Callable, Iterator
 
 import pandas as pd
 import numpy as np
@@ -13,7 +17,7 @@ from vic_save_puck.data.loader import load_merged
 from vic_save_puck.data.enricher import enrich_games
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GameEvent:
     """A single POS transaction event."""
     timestamp: pd.Timestamp
@@ -25,6 +29,13 @@ class GameEvent:
     mins_from_puck_drop: float
     time_window: int
 
+    def __post_init__(self) -> None:
+        # Keys for the detector's counters: share one string object per name
+        # so dict lookups hit the identity fast path with a cached hash.
+        object.__setattr__(self, "stand", sys.intern(self.stand))
+        object.__setattr__(self, "item", sys.intern(self.item))
+        object.__setattr__(self, "category", sys.intern(self.category))
+
     def to_dict(self) -> dict:
         return {
             "timestamp": self.timestamp,
@@ -38,7 +49,10 @@ class GameEvent:
         }
 
 
-@dataclass
+_EVENT_FIELDS = tuple(f.name for f in fields(GameEvent))
+
+
+@dataclass(slots=True)
 class NoiseConfig:
     """Configuration for noise injection."""
     demand_spike_stand: str | None = None      # Stand to spike
@@ -72,8 +86,7 @@ class GameSimulator:
         self.window_observers: list[WindowObserver] = window_observers or []
 
         # Load game data
-        merged = load_merged()
-        self.game_txns = merged[merged["game_date"] == self.game_date].copy()
+        self.game_txns = load_merged(game_date=self.game_date)
         if self.game_txns.empty:
             raise ValueError(f"No transactions found for {game_date}")
 
@@ -104,36 +117,60 @@ class GameSimulator:
             "total_transactions": self.total_events,
         }
 
-    def _apply_noise(self, row: pd.Series) -> list[GameEvent]:
-        """Apply noise config to a transaction, returning 0+ events."""
-        mins = row["mins_from_puck_drop"]
-        stand = row["stand"]
-
-        # Stand outage: drop events from the outage stand during window
-        if (self.noise.stand_outage and stand == self.noise.stand_outage
-                and self.noise.stand_outage_start_min <= mins <= self.noise.stand_outage_end_min):
-            return []
+    def _iter_events(self) -> Iterator[GameEvent]:
+        """
+        Yield the game's transactions as events, in time order, with noise applied.
 
-        qty = int(row["Qty"])
+        The noise config is applied to whole columns up front, so the per-row
+        work is only building each GameEvent from plain Python values.
+        """
+        txns = self.game_txns
+        noise = self.noise
+        stand = txns["stand"]
+        mins = txns["mins_from_puck_drop"]
 
-        # Global volume scaling
-        qty = max(1, round(qty * self.noise.global_volume_factor))
+        # Stand outage: drop events from the outage stand during window
+        keep = None
+        if noise.stand_outage:
+            keep = ~(
+                (stand == noise.stand_outage)
+                & mins.between(noise.stand_outage_start_min, noise.stand_outage_end_min)
+            ).to_numpy()
+
+        # Global volume scaling (no float round-trip at the default factor)
+        qty = txns["Qty"].to_numpy()
+        if noise.global_volume_factor != 1.0:
+            qty = np.round(qty * noise.global_volume_factor)
+        qty = np.maximum(1, qty).astype(np.int64)
 
         # Demand spike at specific stand
-        if (self.noise.demand_spike_stand and stand == self.noise.demand_spike_stand
-                and mins >= self.noise.demand_spike_after_min):
-            qty = max(1, round(qty * self.noise.demand_spike_factor))
-
-        return [GameEvent(
-            timestamp=row["datetime"],
-            stand=stand,
-            item=row["Item"],
-            category=row["category_norm"],
-            qty=qty,
-            price_point=str(row.get("Price Point Name", "")),
-            mins_from_puck_drop=float(mins),
-            time_window=int(row["time_window"]),
-        )]
+        if noise.demand_spike_stand:
+            spike = ((stand == noise.demand_spike_stand) & (mins >= noise.demand_spike_after_min)).to_numpy()
+            qty[spike] = np.maximum(1, np.round(qty[spike] * noise.demand_spike_factor))
+
+        if "Price Point Name" in txns:
+            price_points = [str(p) for p in txns["Price Point Name"].tolist()]
+        else:
+            price_points = [""] * len(txns)
+
+        rows = zip(
+            txns["datetime"].tolist(), stand.tolist(), txns["Item"].tolist(),
+            txns["category_norm"].tolist(), qty.tolist(), price_points,
+            mins.tolist(), txns["time_window"].tolist(),
+        )
+        if keep is not None:
+            rows = compress(rows, keep.tolist())
+        for ts, st, item, cat, q, price_point, m, tw in rows:
+            yield GameEvent(
+                timestamp=ts,
+                stand=st,
+                item=item,
+                category=cat,
+                qty=q,
+                price_point=price_point,
+                mins_from_puck_drop=m,
+                time_window=tw,
+            )
 
     def run(self, realtime: bool = True) -> list[GameEvent]:
         """
@@ -142,42 +179,51 @@ class GameSimulator:
         If realtime=True, sleeps between events to simulate wall-clock pace.
         If realtime=False, emits all events instantly (for batch processing).
         """
+        if not realtime and not self.observers:
+            return self._run_by_window()
+
         all_events: list[GameEvent] = []
-        window_events: dict[int, list[GameEvent]] = {}
+        window_events: defaultdict[int, list[GameEvent]] = defaultdict(list)
         current_window = None
 
         prev_time = None
-
-        for _, row in self.game_txns.iterrows():
-            events = self._apply_noise(row)
-
-            for event in events:
-                # Real-time pacing
-                if realtime and prev_time is not None and self.speed > 0:
-                    delta = (event.timestamp - prev_time).total_seconds()
-                    if delta > 0:
-                        time.sleep(delta / self.speed)
-
-                prev_time = event.timestamp
-
-                # Emit to observers
-                for obs in self.observers:
-                    obs(event)
-
-                all_events.append(event)
-
-                # Track window events
-                tw = event.time_window
-                if tw not in window_events:
-                    window_events[tw] = []
-                window_events[tw].append(event)
-
-                # Window boundary: notify window observers
-                if current_window is not None and tw != current_window:
-                    for wobs in self.window_observers:
-                        wobs(current_window, window_events.get(current_window, []))
-
-                current_window = tw
+        # Pacing anchor: game time and monotonic clock at the last (re)anchor
+        anchor_ts = anchor_clock = anchor_speed = None
+
+        for event in self._iter_events():
+            # Real-time pacing: sleep until an absolute deadline, so sleep
+            # overshoot and slow observers don't accumulate across the game.
+            # Re-anchor when the speed is changed mid-run.
+            if realtime and self.speed > 0:
+                if anchor_ts is None or self.speed != anchor_speed:
+                    anchor_ts = prev_time if prev_time is not None else event.timestamp
+                    anchor_clock, anchor_speed = time.monotonic(), self.speed
+                delay = (
+                    anchor_clock
+                    + (event.timestamp - anchor_ts).total_seconds() / anchor_speed
+                    - time.monotonic()
+                )
+                if delay > 0:
+                    time.sleep(delay)
+
+            prev_time = event.timestamp
+
+            # Emit to observers
+            for obs in self.observers:
+                obs(event)
+
+            all_events.append(event)
+
+            # Track window events
+            tw = event.time_window
+            window_events[tw].append(event)
+
+            # Window boundary: notify window observers
+            if current_window is not None and tw != current_window:
+                for wobs in self.window_observers:
+                    wobs(current_window, window_events.get(current_window, []))
+
+            current_window = tw
 
         # Final window notification
         if current_window is not None:
@@ -188,12 +234,57 @@ class GameSimulator:
         self._window_events = window_events
         return all_events
 
+    def _run_by_window(self) -> list[GameEvent]:
+        """
+        run() without pacing or per-event observers.
+
+        Events are built in one pass and window observers get each window's
+        events in the same order and with the same lists as run() would pass,
+        without the per-event bookkeeping.
+        """
+        all_events = list(self._iter_events())
+        window_events: defaultdict[int, list[GameEvent]] = defaultdict(list)
+        for tw, events in groupby(all_events, key=attrgetter("time_window")):
+            window_events[tw].extend(events)
+            for wobs in self.window_observers:
+                wobs(tw, window_events[tw])
+
+        self._events = all_events
+        self._window_events = window_events
+        return all_events
+
     def run_batch(self) -> list[GameEvent]:
         """Run without timing — emit all events instantly."""
         return self.run(realtime=False)
 
+    def iter_windows(self) -> Iterator[tuple[int, list[GameEvent]]]:
+        """
+        Yield (time_window, events) for each window in order, without timing.
+
+        Events are not retained on the simulator, so only one window's events
+        are held at a time; use run_batch() when the full event list is needed.
+        Per-event observers are still notified; window observers are not.
+        """
+        current_window = None
+        window_events: list[GameEvent] = []
+
+        for event in self._iter_events():
+            for obs in self.observers:
+                obs(event)
+
+            tw = event.time_window
+            if current_window is not None and tw != current_window:
+                yield current_window, window_events
+                window_events = []
+            current_window = tw
+            window_events.append(event)
+
+        if current_window is not None:
+            yield current_window, window_events
+
     def get_events_dataframe(self) -> pd.DataFrame:
-        """Convert emitted events to DataFrame."""
+        """Convert emitted events to DataFrame, one column list per field."""
         if not self._events:
             return pd.DataFrame()
-        return pd.DataFrame([e.to_dict() for e in self._events])
+        events = self._events
+        return pd.DataFrame({name: [getattr(e, name) for e in events] for name in _EVENT_FIELDS})
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 
+import pandas as pd
+
+from vic_save_puck.config import ENRICHED_CACHE
 from vic_save_puck.simulator.engine import GameSimulator, NoiseConfig
 from vic_save_puck.data.enricher import enrich_games
 
@@ -26,9 +30,8 @@ class Scenario:
         )
 
 
-def _pick_game(archetype: str = "mixed", is_playoff: bool = False) -> str:
+def _pick_game(games: pd.DataFrame, archetype: str = "mixed", is_playoff: bool = False) -> str:
     """Pick a representative game date for a scenario."""
-    games = enrich_games()
     candidates = games[
         (games["archetype"] == archetype) & (games["is_playoff"] == is_playoff)
     ]
@@ -40,14 +43,14 @@ def _pick_game(archetype: str = "mixed", is_playoff: bool = False) -> str:
     return str(candidates.loc[idx, "game_date"].date())
 
 
-def get_scenarios() -> dict[str, Scenario]:
-    """Return all pre-built demo scenarios."""
+@functools.lru_cache(maxsize=1)
+def _scenario_dates(enriched_mtime_ns: int) -> tuple[str, str, str, str]:
+    """Game dates for the scenarios, memoized on the enriched cache's mtime."""
     games = enrich_games()
 
     # Find a good game for each scenario
-    normal_date = _pick_game("mixed")
-    beer_date = _pick_game("beer_crowd")
-    family_date = _pick_game("family")
+    normal_date = _pick_game(games, "mixed")
+    family_date = _pick_game(games, "family")
 
     # Playoff game
     playoff_games = games[games["is_playoff"]]
@@ -57,6 +60,19 @@ def get_scenarios() -> dict[str, Scenario]:
     promo_games = games[games["is_promo"]]
     promo_date = str(promo_games.iloc[0]["game_date"].date()) if not promo_games.empty else normal_date
 
+    return normal_date, family_date, playoff_date, promo_date
+
+
+def get_scenarios() -> dict[str, Scenario]:
+    """
+    Return all pre-built demo scenarios.
+
+    Scenarios are built fresh on each call since callers may mutate their
+    NoiseConfig; only the game-date selection is memoized.
+    """
+    mtime_ns = ENRICHED_CACHE.stat().st_mtime_ns if ENRICHED_CACHE.exists() else 0
+    normal_date, family_date, playoff_date, promo_date = _scenario_dates(mtime_ns)
+
     return {
         "normal": Scenario(
             name="Normal Game",
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 import numpy as np
-from dataclasses import dataclass, field
+from dataclasses import dataclass, fields
 from rich.console import Console
 from rich.table import Table
 from rich.progress import track
@@ -12,9 +15,13 @@ from rich import box
 
 from vic_save_puck.data.loader import load_merged
 from vic_save_puck.data.enricher import enrich_games
-from vic_save_puck.data.profiles import build_profiles_from_data
+from vic_save_puck.data.profiles import build_curve_aggregates, profiles_without_game
 from vic_save_puck.models.forecast import generate_forecast
 
+_NO_SALES = pd.Series(dtype=np.int64)
+
+console = Console()
+
 
 @dataclass
 class GameResult:
@@ -33,15 +40,166 @@ class GameResult:
     stockout_units: int
 
 
-def run_backtest(detailed: bool = False, use_correction: bool = False) -> list[GameResult]:
+_RESULT_FIELDS = tuple(f.name for f in fields(GameResult))
+
+
+def _backtest_one_game(
+    gd_ts: pd.Timestamp,
+    games: pd.DataFrame,
+    correction_model: dict | None,
+    game_actuals: dict,
+    curve_aggregates: dict,
+) -> GameResult | None:
+    """Hold out one game, downdate the profiles without it, and score the forecast.
+
+    ``game_actuals`` is ``_game_actuals`` over all transactions;
+    ``curve_aggregates`` is ``build_curve_aggregates`` over all games.
+    """
+    # ── Get game info ─────────────────────────────────────────────
+    game_row = games[games["game_date"] == gd_ts]
+    if game_row.empty:
+        return None
+    g = game_row.iloc[0]
+
+    # ── Hold out this game's transactions ─────────────────────────
+    if game_actuals["rows"].get(gd_ts, 0) == game_actuals["n_rows"]:
+        return None  # no training transactions left
+
+    # ── Profiles from the remaining games ─────────────────────────
+    profiles = profiles_without_game(curve_aggregates, gd_ts)
+
+    # ── Generate forecast for held-out game ───────────────────────
+    forecast = generate_forecast(
+        attendance=int(g["attendance"]),
+        puck_drop_hour=int(g["puck_drop_hour"]),
+        is_playoff=bool(g["is_playoff"]),
+        is_promo=bool(g["is_promo"]),
+        promo_type=str(g.get("promo_type", "")),
+        temp_mean=float(g.get("temp_mean", 8.0)),
+        day_of_week=str(g["day_of_week"]),
+        profiles=profiles,
+    )
+
+    # ── Apply correction factor if available ────────────────────────
+    if correction_model is not None:
+        from vic_save_puck.models.correction import get_correction_factor
+        cf = get_correction_factor(g, model=correction_model)
+        scaled_fc = forecast["item_forecast"]
+        for col in ("expected_qty", "prep_qty"):
+            scaled_fc[col] = np.rint(scaled_fc[col].to_numpy() * cf).astype(int)
+        if "stand_forecast" in forecast:
+            stand_qty = forecast["stand_forecast"]["expected_qty"].to_numpy()
+            forecast["stand_forecast"]["expected_qty"] = np.rint(stand_qty * cf).astype(int)
+
+    # ── Actuals for this game ─────────────────────────────────────
+    actual_total = int(game_actuals["total"].get(gd_ts, 0))
+    actual_by_stand = game_actuals["stand"].get(gd_ts, _NO_SALES)
+    actual_by_item = game_actuals["item"].get(gd_ts, _NO_SALES)
+
+    # ── Overall volume error ──────────────────────────────────────
+    item_fc = forecast["item_forecast"]
+    forecast_total = int(item_fc["expected_qty"].sum())
+    volume_error = (
+        (forecast_total - actual_total) / actual_total
+        if actual_total > 0 else 0.0
+    )
+
+    # ── Stand MAPE ────────────────────────────────────────────────
+    stand_fc = forecast["stand_forecast"]
+    stand_mape = _mape(stand_fc.groupby("stand")["expected_qty"].sum(), actual_by_stand)
+
+    # ── Item MAPE (top items by actual volume) ────────────────────
+    item_mape = _mape(
+        item_fc.groupby("item")["expected_qty"].sum(),
+        actual_by_item.sort_values(ascending=False).head(15),
+    )
+
+    # ── Prep metrics ──────────────────────────────────────────────
+    # Outer-aligned on item: items missing on either side count as zero
+    prep_by_item, actual_by_item = item_fc.groupby("item")["prep_qty"].sum().align(
+        actual_by_item, join="outer", fill_value=0,
+    )
+    prep_qty = prep_by_item.to_numpy()
+    actual_qty = actual_by_item.to_numpy()
+
+    covered = (prep_qty >= actual_qty).sum()
+    total_items = int((actual_qty > 0).sum())
+    prep_coverage = covered / total_items if total_items > 0 else 1.0
+
+    waste_units = int(np.maximum(0, prep_qty - actual_qty).sum())
+    stockout_units = int(np.maximum(0, actual_qty - prep_qty).sum())
+
+    return GameResult(
+        game_date=gd_ts,
+        opponent=str(g["opponent"]),
+        attendance=int(g["attendance"]),
+        archetype=str(g["archetype"]),
+        actual_total=actual_total,
+        forecast_total=forecast_total,
+        volume_error=volume_error,
+        stand_mape=stand_mape,
+        item_mape=item_mape,
+        prep_coverage=prep_coverage,
+        waste_units=waste_units,
+        stockout_units=stockout_units,
+    )
+
+
+def _mape(forecast: pd.Series, actual: pd.Series) -> float:
+    """Mean absolute percentage error over keys in both series with actual > 0."""
+    fc = forecast[forecast.index.isin(actual.index)]
+    act = actual.reindex(fc.index).to_numpy()
+    mask = act > 0
+    if not mask.any():
+        return 0.0
+    return (np.abs(fc.to_numpy()[mask] - act[mask]) / act[mask]).mean()
+
+
+def _game_actuals(merged: pd.DataFrame) -> dict:
+    """Per-game row counts, Qty totals and stand/item Qty sums, keyed by game date."""
+    per_game = merged.groupby("game_date")["Qty"].agg(["size", "sum"])
+    by_stand = merged.groupby(["game_date", "stand"])["Qty"].sum()
+    by_item = merged.groupby(["game_date", "Item"])["Qty"].sum()
+    return {
+        "n_rows": len(merged),
+        "rows": per_game["size"],
+        "total": per_game["sum"],
+        "stand": {gd: s.droplevel("game_date") for gd, s in by_stand.groupby(level="game_date")},
+        "item": {gd: s.droplevel("game_date") for gd, s in by_item.groupby(level="game_date")},
+    }
+
+
+# Per-process state for the parallel LOO workers, set once by _init_worker so the
+# fold inputs are pickled once per worker rather than once per game.
+_WORKER_DATA: dict = {}
+
+
+def _init_worker(games: pd.DataFrame, correction_model: dict | None,
+                 game_actuals: dict, curve_aggregates: dict) -> None:
+    _WORKER_DATA.update(
+        games=games, correction_model=correction_model,
+        game_actuals=game_actuals, curve_aggregates=curve_aggregates,
+    )
+
+
+def _backtest_worker(gd_ts: pd.Timestamp) -> GameResult | None:
+    return _backtest_one_game(gd_ts, **_WORKER_DATA)
+
+
+def run_backtest(
+    detailed: bool = False,
+    use_correction: bool = False,
+    max_workers: int | None = None,
+) -> list[GameResult]:
     """Run leave-one-out cross-validation over all games.
 
+    Folds are independent, so they are fanned out over a process pool.
+
     Args:
         detailed: Show per-game results table.
         use_correction: Apply learned correction factors to forecasts.
+        max_workers: Worker processes; 1 runs serially in the calling process.
     """
-    console = Console()
-
     console.print("[cyan]Loading data...[/cyan]")
     merged = load_merged()
     games = enrich_games()
@@ -58,160 +216,52 @@ def run_backtest(detailed: bool = False, use_correction: bool = False) -> list[G
             console.print(f"[green]Correction model loaded ({correction_model['method']}, "
                           f"n={correction_model['n_games']})[/green]")
 
-    game_dates = sorted(games["game_date"].unique())
+    # tolist() boxes datetime64 values as Timestamps, matching the per-game dict keys
+    game_dates = games["game_date"].drop_duplicates().sort_values().tolist()
     label = "LOO validation" + (" + correction" if correction_model else "")
     console.print(f"Running {label} over {len(game_dates)} games\n")
 
-    results: list[GameResult] = []
-
-    for gd in track(game_dates, description="Backtesting"):
-        gd_ts = pd.Timestamp(gd)
-
-        # ── Get game info ─────────────────────────────────────────────
-        game_row = games[games["game_date"] == gd_ts]
-        if game_row.empty:
-            continue
-        g = game_row.iloc[0]
-
-        # ── Hold out this game's transactions ─────────────────────────
-        train_merged = merged[merged["game_date"] != gd_ts]
-        train_games = games[games["game_date"] != gd_ts]
-
-        if train_merged.empty:
-            continue
-
-        # ── Build profiles from remaining games ───────────────────────
-        profiles = build_profiles_from_data(train_merged, train_games)
-
-        # ── Generate forecast for held-out game ───────────────────────
-        forecast = generate_forecast(
-            attendance=int(g["attendance"]),
-            puck_drop_hour=int(g["puck_drop_hour"]),
-            is_playoff=bool(g["is_playoff"]),
-            is_promo=bool(g["is_promo"]),
-            promo_type=str(g.get("promo_type", "")),
-            temp_mean=float(g.get("temp_mean", 8.0)),
-            day_of_week=str(g["day_of_week"]),
-            profiles=profiles,
-        )
-
-        # ── Apply correction factor if available ────────────────────────
-        if correction_model is not None:
-            from vic_save_puck.models.correction import get_correction_factor
-            cf = get_correction_factor(g, model=correction_model)
-            forecast["item_forecast"]["expected_qty"] = (
-                forecast["item_forecast"]["expected_qty"] * cf
-            ).round(0).astype(int)
-            forecast["item_forecast"]["prep_qty"] = (
-                forecast["item_forecast"]["prep_qty"] * cf
-            ).round(0).astype(int)
-            if "stand_forecast" in forecast:
-                forecast["stand_forecast"]["expected_qty"] = (
-                    forecast["stand_forecast"]["expected_qty"] * cf
-                ).round(0).astype(int)
-
-        # ── Actuals for this game ─────────────────────────────────────
-        game_txns = merged[merged["game_date"] == gd_ts]
-        actual_total = int(game_txns["Qty"].sum())
-
-        # ── Overall volume error ──────────────────────────────────────
-        item_fc = forecast["item_forecast"]
-        forecast_total = int(item_fc["expected_qty"].sum())
-        volume_error = (
-            (forecast_total - actual_total) / actual_total
-            if actual_total > 0 else 0.0
-        )
-
-        # ── Stand MAPE ────────────────────────────────────────────────
-        stand_fc = forecast["stand_forecast"]
-        actual_by_stand = (
-            game_txns.groupby("stand")["Qty"].sum().reset_index()
-            .rename(columns={"Qty": "actual_qty"})
-        )
-        stand_comp = stand_fc.groupby("stand")["expected_qty"].sum().reset_index()
-        stand_comp = stand_comp.merge(actual_by_stand, on="stand", how="inner")
-        if not stand_comp.empty and (stand_comp["actual_qty"] > 0).any():
-            mask = stand_comp["actual_qty"] > 0
-            stand_mape = (
-                (stand_comp.loc[mask, "expected_qty"] - stand_comp.loc[mask, "actual_qty"]).abs()
-                / stand_comp.loc[mask, "actual_qty"]
-            ).mean()
-        else:
-            stand_mape = 0.0
-
-        # ── Item MAPE (top items by actual volume) ────────────────────
-        actual_by_item = (
-            game_txns.groupby("Item")["Qty"].sum()
-            .sort_values(ascending=False)
-            .head(15)
-            .reset_index()
-            .rename(columns={"Qty": "actual_qty"})
-        )
-        item_comp = item_fc.groupby("item")["expected_qty"].sum().reset_index()
-        item_comp = item_comp.merge(
-            actual_by_item, left_on="item", right_on="Item", how="inner"
-        )
-        if not item_comp.empty and (item_comp["actual_qty"] > 0).any():
-            mask = item_comp["actual_qty"] > 0
-            item_mape = (
-                (item_comp.loc[mask, "expected_qty"] - item_comp.loc[mask, "actual_qty"]).abs()
-                / item_comp.loc[mask, "actual_qty"]
-            ).mean()
-        else:
-            item_mape = 0.0
-
-        # ── Prep metrics ──────────────────────────────────────────────
-        prep_fc = item_fc.groupby("item")[["prep_qty", "expected_qty"]].sum().reset_index()
-        actual_items = (
-            game_txns.groupby("Item")["Qty"].sum().reset_index()
-            .rename(columns={"Item": "item", "Qty": "actual_qty"})
-        )
-        prep_comp = prep_fc.merge(actual_items, on="item", how="outer").fillna(0)
-
-        covered = (prep_comp["prep_qty"] >= prep_comp["actual_qty"]).sum()
-        total_items = len(prep_comp[prep_comp["actual_qty"] > 0])
-        prep_coverage = covered / total_items if total_items > 0 else 1.0
-
-        waste_units = int(
-            prep_comp.apply(
-                lambda r: max(0, r["prep_qty"] - r["actual_qty"]), axis=1
-            ).sum()
-        )
-        stockout_units = int(
-            prep_comp.apply(
-                lambda r: max(0, r["actual_qty"] - r["prep_qty"]), axis=1
-            ).sum()
-        )
-
-        results.append(GameResult(
-            game_date=gd_ts,
-            opponent=str(g["opponent"]),
-            attendance=int(g["attendance"]),
-            archetype=str(g["archetype"]),
-            actual_total=actual_total,
-            forecast_total=forecast_total,
-            volume_error=volume_error,
-            stand_mape=stand_mape,
-            item_mape=item_mape,
-            prep_coverage=prep_coverage,
-            waste_units=waste_units,
-            stockout_units=stockout_units,
-        ))
+    if max_workers is None:
+        max_workers = min(os.cpu_count() or 1, len(game_dates))
+
+    # Per-game actuals in one grouped pass, so folds do no groupby over transactions
+    game_actuals = _game_actuals(merged)
+    # Full-data curve sums, downdated per fold instead of rebuilding profiles
+    curve_aggregates = build_curve_aggregates(merged, games)
+    fold_inputs = (games, correction_model, game_actuals, curve_aggregates)
+
+    if max_workers <= 1:
+        results = [
+            _backtest_one_game(gd_ts, *fold_inputs)
+            for gd_ts in track(game_dates, description="Backtesting")
+        ]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker, initargs=fold_inputs,
+        ) as ex:
+            results = list(track(
+                ex.map(_backtest_worker, game_dates, chunksize=4),
+                total=len(game_dates), description="Backtesting",
+            ))
+    results = [r for r in results if r is not None]
 
     console.print()
     format_backtest_results(results, detailed=detailed)
     return results
 
 
+def results_frame(results: list[GameResult]) -> pd.DataFrame:
+    """One row per GameResult, built column-wise rather than from per-row dicts."""
+    return pd.DataFrame({name: [getattr(r, name) for r in results] for name in _RESULT_FIELDS})
+
+
 def format_backtest_results(results: list[GameResult], detailed: bool = False) -> None:
     """Print formatted backtest results."""
-    console = Console()
-
     if not results:
         console.print("[red]No results to display[/red]")
         return
 
-    df = pd.DataFrame([vars(r) for r in results])
+    df = results_frame(results)
 
     # ── Summary table ─────────────────────────────────────────────────
     table = Table(
@@ -222,18 +272,19 @@ def format_backtest_results(results: list[GameResult], detailed: bool = False) -
     table.add_column("Value", justify="right")
 
     n = len(df)
+    abs_err = df["volume_error"].abs().to_numpy()
     table.add_row("Games validated", str(n))
     table.add_row("Median volume error", f"{df['volume_error'].median():+.1%}")
-    table.add_row("Mean abs volume error", f"{df['volume_error'].abs().mean():.1%}")
+    table.add_row("Mean abs volume error", f"{abs_err.mean():.1%}")
     table.add_row("Mean stand MAPE", f"{df['stand_mape'].mean():.1%}")
     table.add_row("Mean item MAPE", f"{df['item_mape'].mean():.1%}")
     table.add_row("Median stand MAPE", f"{df['stand_mape'].median():.1%}")
     table.add_row("Median item MAPE", f"{df['item_mape'].median():.1%}")
 
-    within_15 = (df["volume_error"].abs() <= 0.15).sum()
+    within_15 = (abs_err <= 0.15).sum()
     table.add_row("Games within +/-15%", f"{within_15}/{n} ({within_15/n:.0%})")
 
-    within_25 = (df["volume_error"].abs() <= 0.25).sum()
+    within_25 = (abs_err <= 0.25).sum()
     table.add_row("Games within +/-25%", f"{within_25}/{n} ({within_25/n:.0%})")
 
     console.print(table)
@@ -251,8 +302,9 @@ def format_backtest_results(results: list[GameResult], detailed: bool = False) -
     arch_table.add_column("Within 15%", justify="right")
 
     for arch in sorted(df["archetype"].unique()):
-        sub = df[df["archetype"] == arch]
-        w15 = (sub["volume_error"].abs() <= 0.15).sum()
+        in_arch = (df["archetype"] == arch).to_numpy()
+        sub = df[in_arch]
+        w15 = (abs_err[in_arch] <= 0.15).sum()
         arch_table.add_row(
             arch,
             str(len(sub)),
@@ -286,7 +338,12 @@ def format_backtest_results(results: list[GameResult], detailed: bool = False) -
     console.print(prep_table)
 
     # ── Best / Worst games ────────────────────────────────────────────
-    df_sorted = df.sort_values("volume_error", key=abs)
+    # Partial selection of the k smallest/largest |error|, ordered within each end
+    k = min(5, n)
+    best = np.argpartition(abs_err, k - 1)[:k]
+    best = best[np.argsort(abs_err[best], kind="stable")]
+    worst = np.argpartition(-abs_err, k - 1)[:k]
+    worst = worst[np.argsort(-abs_err[worst], kind="stable")]
     bw_table = Table(title="Best & Worst Predicted Games", box=box.ROUNDED)
     bw_table.add_column("Rank", style="bold")
     bw_table.add_column("Date")
@@ -296,26 +353,26 @@ def format_backtest_results(results: list[GameResult], detailed: bool = False) -
     bw_table.add_column("Vol Err", justify="right")
     bw_table.add_column("Stand MAPE", justify="right")
 
-    for i, (_, row) in enumerate(df_sorted.head(5).iterrows()):
+    for i, row in enumerate(df.iloc[best].itertuples(index=False)):
         bw_table.add_row(
             f"Best {i+1}",
-            str(row["game_date"].date()),
-            row["opponent"],
-            row["archetype"],
-            f"{row['attendance']:,}",
-            f"{row['volume_error']:+.1%}",
-            f"{row['stand_mape']:.1%}",
+            str(row.game_date.date()),
+            row.opponent,
+            row.archetype,
+            f"{row.attendance:,}",
+            f"{row.volume_error:+.1%}",
+            f"{row.stand_mape:.1%}",
         )
 
-    for i, (_, row) in enumerate(df_sorted.tail(5).iloc[::-1].iterrows()):
+    for i, row in enumerate(df.iloc[worst].itertuples(index=False)):
         bw_table.add_row(
             f"Worst {i+1}",
-            str(row["game_date"].date()),
-            row["opponent"],
-            row["archetype"],
-            f"{row['attendance']:,}",
-            f"{row['volume_error']:+.1%}",
-            f"{row['stand_mape']:.1%}",
+            str(row.game_date.date()),
+            row.opponent,
+            row.archetype,
+            f"{row.attendance:,}",
+            f"{row.volume_error:+.1%}",
+            f"{row.stand_mape:.1%}",
         )
 
     console.print(bw_table)
@@ -333,20 +390,20 @@ def format_backtest_results(results: list[GameResult], detailed: bool = False) -
         det_table.add_column("It MAPE", justify="right")
         det_table.add_column("Prep Cov", justify="right")
 
-        for _, row in df.sort_values("game_date").iterrows():
-            err_color = "green" if abs(row["volume_error"]) <= 0.15 else (
-                "yellow" if abs(row["volume_error"]) <= 0.25 else "red"
+        for row in df.sort_values("game_date").itertuples(index=False):
+            err_color = "green" if abs(row.volume_error) <= 0.15 else (
+                "yellow" if abs(row.volume_error) <= 0.25 else "red"
             )
             det_table.add_row(
-                str(row["game_date"].date()),
-                row["opponent"][:12],
-                row["archetype"][:6],
-                f"{row['actual_total']:,}",
-                f"{row['forecast_total']:,}",
-                f"[{err_color}]{row['volume_error']:+.1%}[/{err_color}]",
-                f"{row['stand_mape']:.1%}",
-                f"{row['item_mape']:.1%}",
-                f"{row['prep_coverage']:.0%}",
+                str(row.game_date.date()),
+                row.opponent[:12],
+                row.archetype[:6],
+                f"{row.actual_total:,}",
+                f"{row.forecast_total:,}",
+                f"[{err_color}]{row.volume_error:+.1%}[/{err_color}]",
+                f"{row.stand_mape:.1%}",
+                f"{row.item_mape:.1%}",
+                f"{row.prep_coverage:.0%}",
             )
 
         console.print(det_table)
@@ -4,10 +4,26 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import orjson
 from flask import Flask
 from flask_socketio import SocketIO
 
-socketio = SocketIO()
+# Payloads carry numpy scalars (e.g. float64 drifts) that stdlib json accepts as floats
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+class _OrjsonCodec:
+    """Drop-in for the stdlib json module when encoding SocketIO packets."""
+
+    @staticmethod
+    def dumps(obj, **kwargs) -> str:
+        # kwargs (e.g. separators) are stdlib formatting knobs; orjson is always compact
+        return orjson.dumps(obj, option=_ORJSON_OPTS).decode()
+
+    loads = staticmethod(orjson.loads)
+
+
+socketio = SocketIO(json=_OrjsonCodec)
 
 
 def create_app(skip_ai: bool = False, debug: bool = False) -> Flask:
@@ -26,5 +42,6 @@ def create_app(skip_ai: bool = False, debug: bool = False) -> Flask:
     # Import events to register SocketIO handlers
     from vic_save_puck.web import events  # noqa: F401
 
+    # WebSimulation relies on real threads; see WebSimulation.start
     socketio.init_app(app, cors_allowed_origins="*", async_mode="threading")
     return app
@@ -34,6 +34,7 @@ def handle_start(data):
         scenario_key=scenario,
         speed=speed,
         skip_ai=skip_ai,
+        debug=current_app.debug,
     )
     _active_sim.start()
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import heapq
+
 from vic_save_puck.models.drift import DriftReport, DriftSignal
 from vic_save_puck.models.traffic_light import OverallStatus, StandStatus, Status
 from vic_save_puck.ai.reasoning import ReasoningResult
@@ -31,7 +33,7 @@ def serialize_drift_report(r: DriftReport) -> dict:
         },
         "item_drifts": {
             k: round(v, 3)
-            for k, v in sorted(r.item_drifts.items(), key=lambda x: -abs(x[1]))[:10]
+            for k, v in heapq.nlargest(10, r.item_drifts.items(), key=lambda x: abs(x[1]))
         },
         "signals": [serialize_drift_signal(s) for s in r.signals[:10]],
     }
@@ -90,11 +92,11 @@ def serialize_forecast_summary(forecast: dict) -> dict:
         "total_prep": total_prep,
         "prep_pct": round(total_prep / total_expected * 100, 1) if total_expected > 0 else 0,
         "top_items": [
-            {
-                "item": item,
-                "forecast": int(row["expected_qty"]),
-                "prep": int(row["prep_qty"]),
-            }
-            for item, row in top_items.iterrows()
+            {"item": item, "forecast": int(fc), "prep": int(prep)}
+            for item, fc, prep in zip(
+                top_items.index.tolist(),
+                top_items["expected_qty"].tolist(),
+                top_items["prep_qty"].tolist(),
+            )
         ],
     }
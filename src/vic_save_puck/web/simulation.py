@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import queue
 import threading
 import time
 import traceback
+from collections import defaultdict
 
 from vic_save_puck.data.profiles import build_profiles
 from vic_save_puck.models.forecast import forecast_for_game
@@ -22,46 +24,131 @@ from vic_save_puck.web.serializers import (
     serialize_forecast_summary,
 )
 
+# Window updates are coalesced into one sim:batch frame when replay pacing
+# is faster than BATCH_MAX_LATENCY; slower speeds emit each window directly.
+BATCH_MAX_SIZE = 16
+BATCH_MAX_LATENCY = 0.05  # seconds
+
+# RED windows awaiting AI analysis; further RED windows are dropped while full
+ALERT_QUEUE_SIZE = 4
+# Longest the game-end wait for queued analyses may take before reporting anyway
+ALERT_DRAIN_TIMEOUT = 30.0  # seconds
+
 
 class WebSimulation:
     """Runs a game simulation in a background thread, emitting SocketIO events."""
 
-    def __init__(self, socketio, scenario_key: str, speed: float, skip_ai: bool):
+    def __init__(self, socketio, scenario_key: str, speed: float, skip_ai: bool,
+                 debug: bool = False):
         self.socketio = socketio
         self.scenario_key = scenario_key
         self.speed = speed
         self.skip_ai = skip_ai
+        self.debug = debug
 
         self._stop = threading.Event()
-        self._lock = threading.Lock()
-        self._noise_overrides: list[dict] = []
-        self._thread: threading.Thread | None = None
+        # Filled by the request handler, drained by the sim loop
+        self._noise_overrides: queue.SimpleQueue[dict] = queue.SimpleQueue()
+        self._task = None
         self._running = False
+        self._emit_buffer: list[dict] = []
+        self._buffer_started = 0.0
+        # The alert worker emits concurrently with the window loop
+        self._emit_lock = threading.Lock()
 
     def start(self):
         if self._running:
             return
         self._stop.clear()
         self._running = True
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        # Pacing, the alert queue and the emit lock use threading.Event/Lock and
+        # queue.Queue, so this needs async_mode="threading" (see create_app) or an
+        # eventlet/gevent server with the stdlib monkey-patched.
+        self._task = self.socketio.start_background_task(self._run)
 
     def stop(self):
         self._stop.set()
         self._running = False
 
     def update_speed(self, speed: float):
-        with self._lock:
-            self.speed = max(1.0, min(500.0, speed))
+        # A single attribute store; the sim loop reads it without locking
+        self.speed = max(1.0, min(500.0, speed))
 
     def inject_override(self, override_type: str, params: dict):
-        with self._lock:
-            self._noise_overrides.append({"type": override_type, "params": params})
+        self._noise_overrides.put({"type": override_type, "params": params})
 
     def _emit(self, event: str, data: dict):
-        self.socketio.emit(event, data)
+        # Anything still buffered goes out first so clients see events in order
+        with self._emit_lock:
+            self._flush_buffer()
+            self.socketio.emit(event, data)
+
+    def _queue(self, event: str, data: dict):
+        """Buffer an emit until the batch is full or its oldest entry is stale."""
+        with self._emit_lock:
+            if not self._emit_buffer:
+                self._buffer_started = time.monotonic()
+            self._emit_buffer.append({"event": event, "data": data})
+            if (len(self._emit_buffer) >= BATCH_MAX_SIZE
+                    or time.monotonic() - self._buffer_started >= BATCH_MAX_LATENCY):
+                self._flush_buffer()
+
+    def _flush(self):
+        with self._emit_lock:
+            self._flush_buffer()
+
+    def _flush_buffer(self):
+        # Caller holds _emit_lock
+        if not self._emit_buffer:
+            return
+        if len(self._emit_buffer) == 1:
+            msg = self._emit_buffer[0]
+            self.socketio.emit(msg["event"], msg["data"])
+        else:
+            self.socketio.emit("sim:batch", self._emit_buffer)
+        self._emit_buffer = []
+
+    def _analyze_alerts(self, alerts: queue.Queue, game_info: dict,
+                        reasoning_results: list[ReasoningResult], done: threading.Event):
+        """Run AI drift analysis for queued RED windows until a None sentinel."""
+        try:
+            while True:
+                job = alerts.get()
+                try:
+                    if job is None:
+                        return
+                    if self._stop.is_set():
+                        continue
+                    tw, report, cumulative_drift, recent_reports = job
+                    result = analyze_drift(
+                        drift_report=report,
+                        game_context=game_info,
+                        cumulative_drift=cumulative_drift,
+                        recent_reports=recent_reports,
+                    )
+                    alert = {"time_window": tw, **serialize_reasoning_result(result)}
+                    # stop() may have landed during the AI call
+                    if self._stop.is_set():
+                        continue
+                    reasoning_results.append(result)
+                    self._emit("sim:alert", alert)
+                except Exception:
+                    pass
+                finally:
+                    alerts.task_done()
+        finally:
+            done.set()
+
+    def _wait_for_alerts(self, alerts: queue.Queue, done: threading.Event):
+        """Wait, bounded, for queued analyses; gives up if the worker has exited."""
+        deadline = time.monotonic() + ALERT_DRAIN_TIMEOUT
+        while alerts.unfinished_tasks and not done.is_set() and time.monotonic() < deadline:
+            if self._stop.wait(0.1):
+                return
 
     def _run(self):
+        alerts: queue.Queue | None = None
+        alerts_done = threading.Event()
         try:
             self._emit("sim:status", {"message": "Loading historical profiles..."})
 
@@ -82,6 +169,7 @@ class WebSimulation:
             # Build simulator and run batch
             sim = scenario.build_simulator(speed=self.speed)
             game_info = sim.game_info
+            detector = DriftDetector(forecast)
 
             self._emit("sim:started", {
                 "scenario": {
@@ -91,6 +179,8 @@ class WebSimulation:
                 },
                 "game_info": game_info,
                 "forecast_summary": serialize_forecast_summary(forecast),
+                # Sent once here; window updates carry only actuals
+                "forecast_by_window": detector.forecast_totals(),
                 "prep_actions_count": len(prep_actions),
             })
 
@@ -102,18 +192,21 @@ class WebSimulation:
             all_events = sim.run_batch()
 
             # Group events by time window
-            window_buffers: dict[int, list[GameEvent]] = {}
+            window_buffers: defaultdict[int, list[GameEvent]] = defaultdict(list)
             for event in all_events:
-                tw = event.time_window
-                if tw not in window_buffers:
-                    window_buffers[tw] = []
-                window_buffers[tw].append(event)
+                window_buffers[event.time_window].append(event)
 
             # Initialize drift detection
-            detector = DriftDetector(forecast)
             traffic_monitor = TrafficLightMonitor(detector)
             reasoning_results: list[ReasoningResult] = []
-            sorted_windows = sorted(window_buffers.keys())
+            sorted_windows = sorted(window_buffers)
+
+            # AI analysis runs beside the loop so LLM latency doesn't stall pacing
+            if not self.skip_ai:
+                alerts = queue.Queue(maxsize=ALERT_QUEUE_SIZE)
+                self.socketio.start_background_task(
+                    self._analyze_alerts, alerts, game_info, reasoning_results, alerts_done,
+                )
 
             # Process window by window
             for i, tw in enumerate(sorted_windows):
@@ -125,64 +218,52 @@ class WebSimulation:
 
                 # Ingest all events for this window
                 window_events = window_buffers[tw]
-                for event in window_events:
-                    detector.ingest_event(event)
+                detector.ingest_batch(window_events)
 
                 # Check drift and traffic status
                 report = detector.check_drift(tw)
                 status = traffic_monitor.update(tw)
 
-                actual_qty = sum(e.qty for e in window_events)
-                fc_qty = sum(
-                    v for (s, t), v in detector._fc_stand.items() if t == tw
-                )
-
-                # Emit window data
-                self._emit("sim:window", {
-                    "time_window": tw,
-                    "window_index": i,
-                    "total_windows": len(sorted_windows),
-                    "actual_qty": actual_qty,
-                    "forecast_qty": fc_qty,
-                    "drift_pct": round(report.overall_volume_drift, 3),
-                    "cumulative_drift": round(detector.cumulative_drift(), 3),
-                    "event_count": len(window_events),
-                    "drift_report": serialize_drift_report(report),
+                # Already summed by the detector during ingest
+                actual_qty = detector.actual_total(tw)
+                cumulative_drift = detector.cumulative_drift()
+
+                # Emit window and traffic light data as one frame. Alerts stay
+                # separate: they wait on the AI call and shouldn't hold this back.
+                self._queue("sim:window_update", {
+                    "window": {
+                        "time_window": tw,
+                        "window_index": i,
+                        "total_windows": len(sorted_windows),
+                        "actual_qty": actual_qty,
+                        "drift_pct": round(report.overall_volume_drift, 3),
+                        "cumulative_drift": round(cumulative_drift, 3),
+                        "event_count": len(window_events),
+                        "drift_report": serialize_drift_report(report),
+                    },
+                    "traffic": serialize_overall_status(status),
                 })
 
-                # Emit traffic light data
-                self._emit("sim:traffic", serialize_overall_status(status))
-
                 # AI reasoning for RED status
-                if not self.skip_ai and status.overall_status == Status.RED:
+                if alerts is not None and status.overall_status == Status.RED:
                     try:
-                        result = analyze_drift(
-                            drift_report=report,
-                            game_context=game_info,
-                            cumulative_drift=detector.cumulative_drift(),
-                            recent_reports=detector.history[-5:],
-                        )
-                        reasoning_results.append(result)
-                        self._emit("sim:alert", {
-                            "time_window": tw,
-                            **serialize_reasoning_result(result),
-                        })
-                    except Exception:
+                        alerts.put_nowait((tw, report, cumulative_drift, detector.history[-5:]))
+                    except queue.Full:
                         pass
 
                 # Sleep between windows for pacing
-                with self._lock:
-                    current_speed = self.speed
-                delay = 10.0 / current_speed
-                # Use small sleep intervals so we can check stop flag
-                elapsed = 0.0
-                while elapsed < delay and not self._stop.is_set():
-                    step = min(0.1, delay - elapsed)
-                    time.sleep(step)
-                    elapsed += step
+                delay = 10.0 / self.speed
+                if delay >= BATCH_MAX_LATENCY:
+                    self._flush()
+                # Wakes immediately if stop() is called mid-delay
+                if self._stop.wait(delay):
+                    break
 
             # Game complete
             if not self._stop.is_set():
+                if alerts is not None:
+                    # Queued analyses feed the post-game report
+                    self._wait_for_alerts(alerts, alerts_done)
                 summary = detector.summary()
 
                 post_game_text = None
@@ -206,18 +287,26 @@ class WebSimulation:
         except Exception as e:
             self._emit("sim:error", {
                 "message": str(e),
-                "traceback": traceback.format_exc(),
+                # Only formatted (and sent to clients) when running with --debug
+                "traceback": traceback.format_exc() if self.debug else None,
             })
         finally:
+            if alerts is not None and not alerts_done.is_set():
+                try:
+                    alerts.put(None, timeout=ALERT_DRAIN_TIMEOUT)
+                except queue.Full:
+                    pass
+            self._flush()
             self._running = False
 
     def _apply_overrides(self, sim, current_window: int):
         """Apply any queued noise overrides to the simulator."""
-        with self._lock:
-            overrides = self._noise_overrides[:]
-            self._noise_overrides.clear()
+        while True:
+            try:
+                override = self._noise_overrides.get_nowait()
+            except queue.Empty:
+                break
 
-        for override in overrides:
             otype = override["type"]
             params = override["params"]
 
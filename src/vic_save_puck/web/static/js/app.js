@@ -49,7 +49,7 @@ const App = {
             infoBadge.classList.remove('hidden');
 
             // Reset UI
-            Charts.reset(data.forecast_summary);
+            Charts.reset(data.forecast_summary, data.forecast_by_window);
             Traffic.reset();
             Alerts.reset();
             document.getElementById('post-game-card').classList.add('hidden');
@@ -57,7 +57,7 @@ const App = {
             Controls.onSimStarted();
         });
 
-        this.socket.on('sim:window', (data) => {
+        this.socket.on('sim:window_update', ({ window: data, traffic }) => {
             this.state.currentWindow = data.time_window;
             this.state.windowCount = data.window_index + 1;
             this.state.totalWindows = data.total_windows;
@@ -71,10 +71,15 @@ const App = {
             // Update drift badges
             this.updateDriftBadge('overall-drift', data.drift_pct);
             this.updateDriftBadge('cumulative-drift', data.cumulative_drift);
+
+            Traffic.update(traffic);
         });
 
-        this.socket.on('sim:traffic', (data) => {
-            Traffic.update(data);
+        // Coalesced emits at high replay speeds: replay each through its own handler
+        this.socket.on('sim:batch', (batch) => {
+            for (const { event, data } of batch) {
+                this.socket.listeners(event).forEach((handler) => handler(data));
+            }
         });
 
         this.socket.on('sim:alert', (data) => {
@@ -4,6 +4,7 @@ const Charts = {
     forecastChart: null,
     driftChart: null,
     annotations: [],
+    forecastByWindow: {},
 
     init() {
         Chart.defaults.color = '#71717a';
@@ -168,7 +169,8 @@ const Charts = {
         });
     },
 
-    reset(forecastSummary) {
+    reset(forecastSummary, forecastByWindow = {}) {
+        this.forecastByWindow = forecastByWindow;
         this.forecastChart.data.labels = [];
         this.forecastChart.data.datasets[0].data = [];
         this.forecastChart.data.datasets[1].data = [];
@@ -186,7 +188,7 @@ const Charts = {
 
         // Bar chart
         this.forecastChart.data.labels.push(label);
-        this.forecastChart.data.datasets[0].data.push(data.forecast_qty);
+        this.forecastChart.data.datasets[0].data.push(this.forecastByWindow[data.time_window] ?? 0);
         this.forecastChart.data.datasets[1].data.push(data.actual_qty);
         this.forecastChart.update('none');
 